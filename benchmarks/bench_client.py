@@ -0,0 +1,84 @@
+"""
+Measure the overhead of the client stack against the local Entity API server.
+
+The server runs in-process on loopback, so the numbers show the cost of the
+client itself (session, pooling, hooks, decoding) without network noise.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_client
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+
+from services.entity.api_client import APIClient
+from services.entity.async_api_client import AsyncAPIClient
+from services.entity.async_entity_service import AsyncEntityService
+from services.entity.async_http_client import AsyncHTTPClient
+from services.entity.entity_service import EntityService
+from services.entity.http_client import HTTPClient
+from utils.allure_utils import AllureUtils, AttachPolicy
+from utils.api.entity_server import EntityServer
+from utils.async_utils import gather_bounded
+
+REQUESTS = 500
+FAN_OUT = 16
+
+
+def measure(name: str, func: Callable[[], object], requests: int = REQUESTS) -> None:
+    """Run a workload once and print its throughput and mean latency."""
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(
+        f"  {name:<36} {requests / elapsed:9.0f} req/s "
+        f"{elapsed / requests * 1e6:9.0f} us/req"
+    )
+
+
+def sequential_gets(url: str, entity_id: str, *, keep_alive: bool) -> None:
+    """Read one entity REQUESTS times through a single client."""
+    with HTTPClient(url, keep_alive=keep_alive) as http:
+        service = EntityService(APIClient(url, http))
+        for _ in range(REQUESTS):
+            service.get_entity(entity_id)
+
+
+def async_gets(url: str, entity_id: str) -> None:
+    """Read one entity REQUESTS times with FAN_OUT requests in flight."""
+
+    async def run() -> None:
+        async with AsyncAPIClient(
+            url, AsyncHTTPClient(url, max_workers=FAN_OUT)
+        ) as client:
+            service = AsyncEntityService(client)
+            await gather_bounded(
+                FAN_OUT, *(service.get_entity(entity_id) for _ in range(REQUESTS))
+            )
+
+    asyncio.run(run())
+
+
+def main() -> None:
+    """Start the local server and run every workload against it."""
+    AllureUtils.policy = AttachPolicy.NEVER
+    with EntityServer() as server:
+        url = server.url
+        _, entity = EntityService(APIClient(url)).create_entity()
+        entity_id = str(entity.id)
+        print(f"{REQUESTS} GET /api/get/ requests against {url}")
+        measure(
+            "sequential, pooled",
+            lambda: sequential_gets(url, entity_id, keep_alive=True),
+        )
+        measure(
+            "sequential, new connection each",
+            lambda: sequential_gets(url, entity_id, keep_alive=False),
+        )
+        measure(f"asyncio, {FAN_OUT} in flight", lambda: async_gets(url, entity_id))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Compare getall page decoding paths on a synthetic 10k-row payload.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_decoding
+"""
+
+import json
+import timeit
+
+from services.entity.models.decoding import decode_entities
+from services.entity.models.entity_model import EntityResponse
+
+ROWS = 10_000
+REPEAT = 5
+NUMBER = 3
+
+
+def build_page(rows: int = ROWS) -> bytes:
+    """Build a getall response body with the given number of rows."""
+    entities = [
+        {
+            "id": i,
+            "title": f"Entity title {i}",
+            "verified": i % 2 == 0,
+            "important_numbers": [i % 100, (i * 7) % 100, (i * 13) % 100],
+            "addition": {
+                "id": i,
+                "additional_info": f"Additional info {i}",
+                "additional_number": i % 1000,
+            },
+        }
+        for i in range(rows)
+    ]
+    return json.dumps({"entity": entities}).encode()
+
+
+def legacy_decode(content: bytes) -> list[EntityResponse]:
+    """Decode the page the way get_all_entities used to."""
+    data = json.loads(content)
+    return [EntityResponse(**item) for item in data["entity"]]
+
+
+def main() -> None:
+    """Run the benchmark and print the best time per path."""
+    content = build_page()
+    paths = {
+        "json.loads + EntityResponse(**item)": lambda: legacy_decode(content),
+        "TypeAdapter.validate_json": lambda: decode_entities(content),
+        "trusted model_construct": lambda: decode_entities(content, trusted=True),
+    }
+    print(f"Decoding {ROWS} rows ({len(content) / 1024:.0f} KiB), best of {REPEAT}")
+    baseline = None
+    for name, func in paths.items():
+        best = min(timeit.repeat(func, repeat=REPEAT, number=NUMBER)) / NUMBER
+        baseline = baseline or best
+        print(f"  {name:<40} {best * 1000:8.1f} ms  x{baseline / best:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Compare per-record and bulk generation of customers and entity payloads.
+
+Also compares the peak memory of materialized lists and columnar batches.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_generators
+"""
+
+import random
+import string
+import timeit
+import tracemalloc
+from collections.abc import Callable
+
+from data.generators import (
+    create_customers,
+    generate_customer_batch,
+    generate_customers,
+)
+from data.providers import fake
+from services.entity.payloads import PayloadBatch, Payloads
+
+RECORDS = 100_000
+MEMORY_RECORDS = 1_000_000
+REPEAT = 3
+
+
+def legacy_customer() -> tuple[str, str, str]:
+    """Build one customer the way Customer() did before the lookup tables."""
+    postcode = "".join(random.choices(string.digits, k=10))
+    name = ""
+    for i in range(0, 10, 2):
+        name += chr((int(postcode[i : i + 2]) % 26) + 97)
+    return postcode, name.capitalize(), fake.last_name()
+
+
+def peak_memory(func: Callable[[], object]) -> int:
+    """Return the peak number of bytes allocated while building and holding a result."""
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
+
+
+def compare_memory() -> None:
+    """Print the peak memory of lists and batches of MEMORY_RECORDS records."""
+    groups = {
+        "customers": {
+            "generate_customers": lambda: generate_customers(MEMORY_RECORDS, seed=1),
+            "generate_customer_batch": lambda: generate_customer_batch(
+                MEMORY_RECORDS, seed=1
+            ),
+        },
+        "entity payloads": {
+            "generate_entity_payloads": lambda: Payloads.generate_entity_payloads(
+                MEMORY_RECORDS, seed=1
+            ),
+            "PayloadBatch.generate": lambda: PayloadBatch.generate(
+                MEMORY_RECORDS, seed=1
+            ),
+        },
+    }
+    for group, paths in groups.items():
+        print(f"{MEMORY_RECORDS} {group}, peak memory")
+        baseline = None
+        for name, func in paths.items():
+            peak = peak_memory(func)
+            baseline = baseline or peak
+            print(f"  {name:<32} {peak / 2**20:8.1f} MiB  /{baseline / peak:.1f}")
+
+
+def main() -> None:
+    """Run the benchmark and print the best time and peak memory per path."""
+    groups = {
+        "customers": {
+            "legacy per-record loop": lambda: [
+                legacy_customer() for _ in range(RECORDS)
+            ],
+            "create_customers": lambda: create_customers(RECORDS),
+            "generate_customers": lambda: generate_customers(RECORDS, seed=1),
+        },
+        "entity payloads": {
+            "generate_entity_payload loop": lambda: [
+                Payloads.generate_entity_payload() for _ in range(RECORDS)
+            ],
+            "generate_entity_payloads": lambda: Payloads.generate_entity_payloads(
+                RECORDS, seed=1
+            ),
+        },
+    }
+    for group, paths in groups.items():
+        print(f"{RECORDS} {group}, best of {REPEAT}")
+        baseline = None
+        for name, func in paths.items():
+            best = min(timeit.repeat(func, repeat=REPEAT, number=1))
+            baseline = baseline or best
+            print(
+                f"  {name:<32} {best * 1000:8.0f} ms "
+                f"{RECORDS / best:>10.0f} rec/s  x{baseline / best:.1f}"
+            )
+    compare_memory()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Compare the page-ready time of the pages under each browser profile.
+
+A page is ready when ``open_page`` has returned and ``is_page_loaded`` holds,
+i.e. when a test could start using it. Every profile gets a fresh browser;
+its first load warms the disk cache of the profiles that keep one and is not
+counted.
+
+Needs Chrome and network access to the demo site. Run from the repository
+root::
+
+    python -m benchmarks.bench_page_load
+"""
+
+import statistics
+import time
+from collections.abc import Callable
+
+from selenium.webdriver.chrome.webdriver import WebDriver
+
+from pages.add_customer_page import AddCustomerPage
+from pages.base_page import BasePage
+from pages.customer_list_page import CustomerListPage
+from utils.ui.browser_profiles import PROFILES, BrowserProfile
+from utils.ui.driver_factory import create_driver
+
+LOADS = 5
+PAGES: dict[str, Callable[[WebDriver], BasePage]] = {
+    "AddCustomerPage": AddCustomerPage,
+    "CustomerListPage": CustomerListPage,
+}
+
+
+def page_ready_time(page: BasePage) -> float:
+    """Return the seconds from navigation until the page is ready."""
+    page.browser.get("about:blank")
+    start = time.perf_counter()
+    page.open_page()
+    if not page.is_page_loaded():
+        error_message = f"{type(page).__name__} did not load"
+        raise RuntimeError(error_message)
+    return time.perf_counter() - start
+
+
+def measure(profile: BrowserProfile) -> dict[str, list[float]]:
+    """Return the page-ready times of every page in a browser of a profile."""
+    driver = create_driver(profile=profile)
+    try:
+        times = {}
+        for name, page_type in PAGES.items():
+            page = page_type(driver)
+            page_ready_time(page)  # warm-up
+            times[name] = [page_ready_time(page) for _ in range(LOADS)]
+        return times
+    finally:
+        driver.quit()
+
+
+def main() -> None:
+    """Run the benchmark and print the median and best time per profile."""
+    results = {name: measure(profile) for name, profile in PROFILES.items()}
+    for page in PAGES:
+        print(f"{page}, {LOADS} loads")
+        baseline = None
+        for name, times in results.items():
+            median = statistics.median(times[page])
+            baseline = baseline or median
+            print(
+                f"  {name:<10} median {median * 1000:7.0f} ms "
+                f"best {min(times[page]) * 1000:7.0f} ms  x{baseline / median:.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,42 @@
+import os
+
 BASE_URL = "https://2d58-77-45-151-104.ngrok-free.app"  # change to your ngrok url
 TIMEOUT = 10
+
+# Connection pool
+POOL_CONNECTIONS = 4  # number of per-host pools kept by the client
+POOL_MAXSIZE = 16  # max connections kept alive per host
+KEEP_ALIVE = True
+
+# Retries of idempotent requests
+RETRY_ATTEMPTS = 3  # attempts per request, including the first one
+RETRY_BACKOFF = 0.05  # seconds, upper bound of the first jittered wait
+RETRY_BACKOFF_MAX = 1.0  # seconds, upper bound of any wait
+RETRY_BUDGET = 50  # retries allowed per session (per xdist worker)
+
+# Circuit breaker
+CIRCUIT_FAILURE_THRESHOLD = 5  # consecutive connection failures that open it
+CIRCUIT_RESET_TIMEOUT = 30.0  # seconds before an open circuit is probed
+
+# Concurrency
+SEED_CONCURRENCY = 16  # max in-flight requests when seeding or tearing down
+CLEANUP_CONCURRENCY = 8  # max in-flight deletions of the deferred cleanup
+
+# Pagination
+PAGE_SIZE = 100  # entities requested per /api/getall/ page when streaming
+PAGE_PREFETCH = 1  # pages fetched ahead in the background
+
+# Recorded API exchanges (modes: record, replay, passthrough)
+CASSETTE_MODE = os.getenv("API_CASSETTE_MODE", "passthrough")
+CASSETTE_DIR = os.getenv("API_CASSETTE_DIR", "cassettes")
+
+# Entity cache (opt-in with --entity-cache)
+ENTITY_CACHE_SIZE = 1024  # entities kept per session
+ENTITY_CACHE_TTL = 60.0  # seconds a cached entity stays valid
+
+# Allure attachments
+# policy: always | on_failure | sampled | never; oversize mode: truncate | gzip
+ALLURE_ATTACH_POLICY = os.getenv("ALLURE_ATTACH_POLICY", "always")
+ALLURE_SAMPLE_RATE = float(os.getenv("ALLURE_SAMPLE_RATE", "0.1"))
+ALLURE_BODY_LIMIT = int(os.getenv("ALLURE_BODY_LIMIT", str(64 * 1024)))  # bytes
+ALLURE_OVERSIZE_MODE = os.getenv("ALLURE_OVERSIZE_MODE", "truncate")
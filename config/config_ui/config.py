@@ -1,6 +1,35 @@
+import os
+
 BASE_URL = "https://www.globalsqa.com/angularJs-protractor/BankingProject/#"
 ADD_CUSTOMER_URL = "/manager/addCust"
 CUSTOMER_LIST_URL = "/manager/list"
 
 # Timeouts
 DEFAULT_TIMEOUT = 10
+
+# Browser
+WINDOW_SIZE = "1920,1080"
+DRIVER_MAX_USES = 25  # tests a pooled browser runs before it is replaced
+
+# Waits (strategies: events, poll)
+WAIT_STRATEGY = os.getenv("UI_WAIT_STRATEGY", "events")
+WAIT_POLL_INTERVAL = 0.1  # seconds between checks of the poll strategy
+
+# Parallel runs (-n auto starts at most one browser per core and per budget)
+BROWSER_MEMORY_MB = 512  # memory budget of one headless Chrome
+MAX_BROWSERS = int(os.getenv("UI_MAX_BROWSERS", "0"))  # fixed cap, 0 for none
+PAGE_GROUP_SIZE = 8  # tests of one page object run back to back on a worker
+
+# Browser performance profiles (default, eager, blocked, lean, none)
+BROWSER_PROFILE = os.getenv("UI_BROWSER_PROFILE", "default")
+BROWSER_CACHE_DIR = os.getenv("UI_BROWSER_CACHE_DIR", ".cache/chrome")  # kept
+BLOCKED_URLS = (  # third parties of the demo site the tests never touch
+    "*googlesyndication.com*",
+    "*doubleclick.net*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*googletagservices.com*",
+    "*adservice.google.*",
+    "*facebook.net*",
+)
+FONT_URLS = ("*fonts.googleapis.com*", "*fonts.gstatic.com*", "*.woff*", "*.ttf*")
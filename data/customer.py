@@ -1,4 +1,6 @@
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
+from typing import overload
 
 from data.providers import fake
 
@@ -31,3 +33,137 @@ class Customer:
         based on the custom first name generated from the postcode.
         """
         self.first_name = fake.custom_first_name(self.post_code)
+
+
+POSTCODE_WIDTH = 10
+
+
+class CustomerRow:
+    """
+    Read-only view of one customer of a CustomerBatch.
+
+    Fields are decoded from the batch columns on access; ``to_customer``
+    builds a real ``Customer`` when a test needs one.
+    """
+
+    __slots__ = ("_batch", "_index")
+
+    def __init__(self, batch: "CustomerBatch", index: int) -> None:
+        """Initializes the view of the row at ``index``."""
+        self._batch = batch
+        self._index = index
+
+    @property
+    def post_code(self) -> str:
+        """The postcode of the customer."""
+        start = self._index * POSTCODE_WIDTH
+        return str(self._batch.postcodes[start : start + POSTCODE_WIDTH], "ascii")
+
+    @property
+    def first_name(self) -> str:
+        """The first name, derived from the postcode."""
+        return fake.custom_first_name(self.post_code)
+
+    @property
+    def last_name(self) -> str:
+        """The last name of the customer."""
+        return self._batch.names[self._batch.last_names[self._index]]
+
+    def to_customer(self) -> Customer:
+        """Materialize the row as a Customer."""
+        return Customer(post_code=self.post_code, last_name=self.last_name)
+
+    def to_dict(self) -> dict[str, str]:
+        """Materialize the row as a dictionary of the Customer fields."""
+        return {
+            "post_code": self.post_code,
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+        }
+
+    def __repr__(self) -> str:
+        """Show the row like a Customer."""
+        return (
+            f"CustomerRow(post_code={self.post_code!r}, "
+            f"first_name={self.first_name!r}, last_name={self.last_name!r})"
+        )
+
+
+class CustomerBatch:
+    """
+    Columnar batch of customers.
+
+    Postcodes are stored back to back in one bytes buffer and last names as
+    indices into a shared table of names, so a million customers take about
+    12 MB instead of a million ``Customer`` objects. Rows and slices are
+    views over the same buffers; nothing is copied until ``to_customer`` or
+    ``to_customers`` is called.
+
+    Attributes:
+        postcodes (memoryview): ASCII postcodes, POSTCODE_WIDTH bytes each.
+        last_names (memoryview): Index of each last name in ``names``.
+        names (Sequence[str]): The table of last names.
+    """
+
+    __slots__ = ("last_names", "names", "postcodes")
+
+    def __init__(
+        self,
+        postcodes: bytes | memoryview,
+        last_names: memoryview,
+        names: Sequence[str],
+    ) -> None:
+        """Initializes the batch from its columns."""
+        self.postcodes = memoryview(postcodes)
+        self.last_names = memoryview(last_names)
+        self.names = names
+        if len(self.postcodes) != len(self.last_names) * POSTCODE_WIDTH:
+            error_message = "The postcode and last name columns differ in length"
+            raise ValueError(error_message)
+
+    def __len__(self) -> int:
+        """Number of customers in the batch."""
+        return len(self.last_names)
+
+    @overload
+    def __getitem__(self, key: int) -> CustomerRow: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> "CustomerBatch": ...
+
+    def __getitem__(self, key: int | slice) -> "CustomerRow | CustomerBatch":
+        """Return a row view, or a batch viewing a contiguous slice."""
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                error_message = "Batches only support contiguous slices"
+                raise ValueError(error_message)
+            stop = max(start, stop)
+            return CustomerBatch(
+                self.postcodes[start * POSTCODE_WIDTH : stop * POSTCODE_WIDTH],
+                self.last_names[start:stop],
+                self.names,
+            )
+        index = range(len(self))[key]
+        return CustomerRow(self, index)
+
+    def __iter__(self) -> Iterator[CustomerRow]:
+        """Iterate over row views."""
+        return (CustomerRow(self, index) for index in range(len(self)))
+
+    def shard(self, index: int, count: int) -> "CustomerBatch":
+        """
+        Return the contiguous part of the batch owned by one of ``count`` shards.
+
+        Args:
+            index (int): The shard, e.g. the number of an xdist worker.
+            count (int): The number of shards.
+
+        Returns:
+            CustomerBatch: A view of about ``len(self) / count`` customers.
+        """
+        return self[len(self) * index // count : len(self) * (index + 1) // count]
+
+    def to_customers(self) -> list[Customer]:
+        """Materialize every row as a Customer."""
+        return [row.to_customer() for row in self]
@@ -0,0 +1,183 @@
+"""Streaming export and import of generated datasets."""
+
+import json
+import mmap
+import struct
+import sys
+from collections.abc import Iterable, Iterator, Mapping
+from itertools import islice
+from pathlib import Path
+from typing import Any, BinaryIO, TypeVar
+
+from data.customer import CustomerBatch
+from services.entity.payloads import PayloadBatch
+
+NDJSON_SUFFIX = ".ndjson"
+MAGIC = b"TNDS"
+_PREFIX = struct.Struct("<4sI")  # magic and header length
+_ALIGNMENT = 8
+
+Batch = TypeVar("Batch", CustomerBatch, PayloadBatch)
+
+
+def write_ndjson(path: Path, records: Iterable[Mapping[str, Any]]) -> int:
+    """
+    Write records as newline-delimited JSON, one record at a time.
+
+    Args:
+        path (Path): The file to write.
+        records (Iterable[Mapping[str, Any]]): The records, e.g. a generator.
+
+    Returns:
+        int: The number of records written.
+    """
+    count = 0
+    with path.open("w", encoding="utf-8") as file:
+        for record in records:
+            file.write(json.dumps(record, separators=(",", ":")))
+            file.write("\n")
+            count += 1
+    return count
+
+
+def read_ndjson(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield the records of a newline-delimited JSON file from a memory map."""
+    if path.stat().st_size == 0:
+        return
+    with (
+        path.open("rb") as file,
+        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+    ):
+        for line in iter(mapped.readline, b""):
+            if line.strip():
+                yield json.loads(line)
+
+
+def write_columnar(path: Path, batch: CustomerBatch | PayloadBatch) -> None:
+    """
+    Write a batch in the binary columnar format.
+
+    The file starts with ``MAGIC``, the length of a JSON header and the
+    header, followed by the raw buffer of every column, each aligned to
+    8 bytes. The memoryview attributes of the batch are its columns; its
+    other attributes, such as the name table of a ``CustomerBatch``, are
+    stored in the header.
+
+    Args:
+        path (Path): The file to write.
+        batch (CustomerBatch | PayloadBatch): The batch to write.
+    """
+    columns, attributes, offset = {}, {}, 0
+    for name in type(batch).__slots__:
+        value = getattr(batch, name)
+        if not isinstance(value, memoryview):
+            attributes[name] = value
+            continue
+        columns[name] = {
+            "format": value.format,
+            "offset": offset,
+            "nbytes": value.nbytes,
+        }
+        offset = _align(offset + value.nbytes)
+    header = json.dumps(
+        {
+            "kind": type(batch).__name__,
+            "byteorder": sys.byteorder,
+            "attributes": attributes,
+            "columns": columns,
+        }
+    ).encode("utf-8")
+
+    with path.open("wb") as file:
+        file.write(_PREFIX.pack(MAGIC, len(header)))
+        file.write(header)
+        _pad(file, _PREFIX.size + len(header))
+        for name in columns:
+            view = getattr(batch, name)
+            file.write(view)
+            _pad(file, view.nbytes)
+
+
+def read_columnar(path: Path, batch_type: type[Batch]) -> Batch:
+    """
+    Open a batch written by ``write_columnar`` without reading it.
+
+    The file is memory-mapped and the columns of the batch are views of the
+    mapping, so pages are loaded on access and shared through the page cache
+    by every process reading the same file.
+
+    Args:
+        path (Path): The file to read.
+        batch_type (type[Batch]): The class of the batch stored in the file.
+
+    Returns:
+        Batch: The batch viewing the file.
+
+    Raises:
+        ValueError: If the file is not a columnar dataset of ``batch_type``.
+    """
+    with path.open("rb") as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    magic, header_size = _PREFIX.unpack_from(view)
+    if magic != MAGIC:
+        error_message = f"{path} is not a columnar dataset"
+        raise ValueError(error_message)
+    header = json.loads(bytes(view[_PREFIX.size : _PREFIX.size + header_size]))
+    if header["kind"] != batch_type.__name__ or header["byteorder"] != sys.byteorder:
+        error_message = (
+            f"{path} holds a {header['byteorder']}-endian {header['kind']}, "
+            f"expected a {sys.byteorder}-endian {batch_type.__name__}"
+        )
+        raise ValueError(error_message)
+
+    start = _align(_PREFIX.size + header_size)
+    columns = {
+        name: view[
+            start + column["offset"] : start + column["offset"] + column["nbytes"]
+        ].cast(column["format"])
+        for name, column in header["columns"].items()
+    }
+    return batch_type(**columns, **header["attributes"])
+
+
+def save_dataset(path: Path, batch: CustomerBatch | PayloadBatch) -> None:
+    """Write a batch as NDJSON if ``path`` ends in ``.ndjson``, else as columnar."""
+    if path.suffix == NDJSON_SUFFIX:
+        write_ndjson(path, (row.to_dict() for row in batch))
+    else:
+        write_columnar(path, batch)
+
+
+def iter_payloads(
+    path: Path, shard: int = 0, shards: int = 1
+) -> Iterator[dict[str, Any]]:
+    """
+    Stream the entity payloads of a dataset file.
+
+    A columnar dataset is split into contiguous parts; the lines of an NDJSON
+    dataset are dealt to the parts in turn.
+
+    Args:
+        path (Path): An NDJSON or columnar payload dataset.
+        shard (int): The part of the dataset to read, e.g. the xdist worker.
+        shards (int): The number of parts the dataset is split into.
+
+    Yields:
+        dict[str, Any]: The payloads of the shard, in file order.
+    """
+    if path.suffix == NDJSON_SUFFIX:
+        yield from islice(read_ndjson(path), shard, None, shards)
+        return
+    for row in read_columnar(path, PayloadBatch).shard(shard, shards):
+        yield row.to_dict()
+
+
+def _align(offset: int) -> int:
+    """Round an offset up to the column alignment."""
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _pad(file: BinaryIO, written: int) -> None:
+    """Write the zero bytes aligning the next column."""
+    file.write(bytes(_align(written) - written))
@@ -1,6 +1,76 @@
-from data.customer import Customer
+import random
+from array import array
+from functools import cache
+from itertools import accumulate
+
+from data.customer import Customer, CustomerBatch
+from data.providers import fake
+
+POSTCODES = range(10**10)
+CHUNK_SIZE = 65_536  # rows drawn at a time by the batch generators
 
 
 def create_customers(num_customers: int) -> list:
     """Create a list of customers."""
     return [Customer() for _ in range(num_customers)]
+
+
+@cache
+def _last_names() -> tuple[list[str], list[float]]:
+    """Return the last names of the Faker locale with cumulative weights."""
+    provider = next(p for p in fake.get_providers() if hasattr(p, "last_names"))
+    names = provider.last_names
+    if isinstance(names, dict):
+        population, weights = list(names), list(names.values())
+    else:
+        population, weights = list(names), [1.0] * len(names)
+    return population, list(accumulate(weights))
+
+
+def generate_customer_batch(count: int, seed: int | None = None) -> CustomerBatch:
+    """
+    Generate a columnar batch of customers.
+
+    Postcodes and last names are drawn in chunks of ``CHUNK_SIZE`` from a
+    generator seeded with ``seed``, so the same seed yields the same batch
+    and the temporary lists stay small however large the batch is.
+
+    Args:
+        count (int): Number of customers to generate.
+        seed (int | None): Seed of the batch; None draws a random one.
+
+    Returns:
+        CustomerBatch: The generated customers.
+    """
+    rng = random.Random(seed)
+    population, cum_weights = _last_names()
+    names = range(len(population))
+    postcodes = bytearray()
+    last_names = array("H")
+    for start in range(0, count, CHUNK_SIZE):
+        size = min(CHUNK_SIZE, count - start)
+        postcodes += "".join(
+            f"{postcode:010d}" for postcode in rng.choices(POSTCODES, k=size)
+        ).encode("ascii")
+        last_names.extend(rng.choices(names, cum_weights=cum_weights, k=size))
+    return CustomerBatch(
+        memoryview(postcodes).toreadonly(), memoryview(last_names), tuple(population)
+    )
+
+
+def generate_customers(count: int, seed: int | None = None) -> list[Customer]:
+    """
+    Generate customers in bulk.
+
+    The customers are drawn as a ``generate_customer_batch`` and
+    materialized, so the same seed yields the same customers. Keep large
+    datasets as a batch instead.
+
+    Args:
+        count (int): Number of customers to generate.
+        seed (int | None): Seed of the batch; None draws a random one.
+
+    Returns:
+        list[Customer]: The generated customers.
+    """
+    return generate_customer_batch(count, seed).to_customers()
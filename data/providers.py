@@ -1,5 +1,6 @@
-import random
 import string
+from collections.abc import Iterator
+from functools import cache
 
 from faker import Faker
 from faker.providers import BaseProvider
@@ -9,27 +10,47 @@ class CustomProvider(BaseProvider):
     """
     A custom provider for generating custom postcodes and first names.
 
-    This class contains static methods for generating custom postcodes
-    consisting of 10 random digits and custom first names based on a given postcode.
+    This class contains methods for generating custom postcodes consisting
+    of 10 random digits, custom first names based on a given postcode and
+    entity titles. Postcodes and titles are drawn from the ``postcodes`` and
+    ``titles`` sequences when ``data.seeding`` installs them, which makes
+    them unique across the run.
     """
 
-    @staticmethod
-    def custom_postcode() -> str:
+    postcodes: Iterator[int] | None = None
+    titles: Iterator[int] | None = None
+
+    def custom_postcode(self) -> str:
         """
         Generate a custom postcode consisting of 10 random digits.
 
         Returns:
             str: The generated custom postcode.
         """
-        return "".join(random.choices(string.digits, k=10))
+        if self.postcodes is not None:
+            return f"{next(self.postcodes):010d}"
+        return "".join(self.generator.random.choices(string.digits, k=10))
+
+    def entity_title(self) -> str:
+        """
+        Generate an entity title of two words, such as ``"Answer city."``.
+
+        Returns:
+            str: The generated title.
+        """
+        if self.titles is None:
+            return self.generator.sentence(nb_words=2)
+        words = title_words()
+        first, second = divmod(next(self.titles), len(words))
+        return f"{words[first].capitalize()} {words[second]}."
 
     @staticmethod
     def custom_first_name(postcode: str) -> str:
         """
         Generate a custom first name based on the given postcode.
 
-        This method converts each digit of the postcode to a corresponding letter
-        and concatenates them to form a custom first name.
+        Each pair of digits of the postcode is converted to a letter
+        (``pair % 26``, starting at ``a``) and the letters are concatenated.
 
         Args:
             postcode (str): The postcode to convert.
@@ -37,15 +58,31 @@ class CustomProvider(BaseProvider):
         Returns:
             str: The generated custom first name.
         """
+        return first_name_from_postcode(postcode)
+
+
+def _pair_letters(offset: int) -> dict[str, str]:
+    """Map every four-digit string to the letters of its two digit pairs."""
+    return {
+        f"{i:04d}": chr((i // 100) % 26 + offset) + chr((i % 100) % 26 + 97)
+        for i in range(10_000)
+    }
+
+
+_FIRST_PAIRS = _pair_letters(65)
+_PAIRS = _pair_letters(97)
+_LAST_PAIR = {f"{i:02d}": chr(i % 26 + 97) for i in range(100)}
+
+
+def first_name_from_postcode(postcode: str) -> str:
+    """Derive the first name of a 10-digit postcode with table lookups."""
+    return _FIRST_PAIRS[postcode[:4]] + _PAIRS[postcode[4:8]] + _LAST_PAIR[postcode[8:]]
 
-        def digit_to_letter(digit: int) -> str:
-            return chr((int(digit) % 26) + 97)
 
-        name = ""
-        for i in range(0, 10, 2):
-            two_digit = int(postcode[i : i + 2])
-            name += digit_to_letter(two_digit)
-        return name.capitalize()
+@cache
+def title_words() -> tuple[str, ...]:
+    """Return the words entity titles and payload texts are made of."""
+    return tuple(fake.get_words_list())
 
 
 fake = Faker()
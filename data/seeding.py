@@ -0,0 +1,165 @@
+"""Deterministic, worker-partitioned seeding of the generated test data."""
+
+import hashlib
+import itertools
+import math
+import os
+import random
+
+from faker import Faker
+
+from data.providers import CustomProvider, fake, title_words
+
+SEED_ENV = "TEST_DATA_SEED"
+POSTCODE_SPACE = 10**10  # every 10-digit postcode
+
+
+def derive_seed(seed: int, *labels: object) -> int:
+    """
+    Derive an independent 64-bit seed from a session seed and labels.
+
+    Args:
+        seed (int): The session seed.
+        *labels (object): What the seed is for, e.g. a worker or a test ID.
+
+    Returns:
+        int: The derived seed; equal labels always give the same seed.
+    """
+    key = "\0".join(str(part) for part in (seed, *labels)).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+def session_seed() -> int:
+    """Return the seed set in ``TEST_DATA_SEED`` or a new random one."""
+    value = os.getenv(SEED_ENV)
+    return int(value) if value else random.SystemRandom().getrandbits(63)
+
+
+class UniqueSequence:
+    """
+    Non-repeating pseudo-random numbers of ``range(space)`` for one shard.
+
+    Shard ``shard`` of ``shards`` numbers the values ``shard``,
+    ``shard + shards``, ... and maps them through a permutation of the space
+    that depends on the seed only. Shards with the same seed therefore never
+    produce the same value and need no coordination, which is how xdist
+    workers get collision-free data without locking.
+    """
+
+    def __init__(self, space: int, seed: int, shard: int = 0, shards: int = 1) -> None:
+        """Initializes the sequence.
+
+        Args:
+            space (int): Number of distinct values.
+            seed (int): Seed of the permutation, shared by all shards.
+            shard (int): The shard drawing from this sequence.
+            shards (int): The number of shards.
+        """
+        rng = random.Random(seed)
+        self.space = space
+        self.multiplier = rng.randrange(1, space)
+        while math.gcd(self.multiplier, space) != 1:
+            self.multiplier = rng.randrange(1, space)
+        self.offset = rng.randrange(space)
+        self._counter = itertools.count(shard, shards)
+
+    def __iter__(self) -> "UniqueSequence":
+        """Return the sequence itself."""
+        return self
+
+    def __next__(self) -> int:
+        """Return the next value; safe to call from several threads."""
+        index = next(self._counter)
+        if index >= self.space:
+            error_message = f"All {self.space} unique values have been used"
+            raise RuntimeError(error_message)
+        return (self.multiplier * index + self.offset) % self.space
+
+
+class DataSeeder:
+    """
+    Derives every random stream of a test session from one seed.
+
+    ``install`` makes the shared Faker draw postcodes and entity titles from
+    sequences partitioned by worker, so they are unique across the whole run.
+    ``seed_test`` reseeds the Faker from the test ID before each test, so a
+    test rerun with the same session seed gets the same random fields again,
+    no matter which worker runs it or in which order. Only the unique values
+    depend on how many values its worker handed out before.
+
+    Data generated off the test thread, e.g. by the entity pool refilling in
+    the background, comes from ``background_faker``: a Faker with its own
+    seed and its own part of the unique values, so it never shifts the
+    streams of the tests.
+    """
+
+    def __init__(self, seed: int, worker: int = 0, workers: int = 1) -> None:
+        """Initializes the streams of one worker.
+
+        Args:
+            seed (int): The session seed, the same on every worker.
+            worker (int): The index of this worker.
+            workers (int): The number of workers of the run.
+        """
+        self.seed = seed
+        self.worker = worker
+        self.workers = workers
+        # Shards 0..workers-1 serve the tests, the others background threads.
+        self.postcodes, self.background_postcodes = (
+            UniqueSequence(
+                POSTCODE_SPACE, derive_seed(seed, "postcodes"), shard, 2 * workers
+            )
+            for shard in (worker, workers + worker)
+        )
+        self.titles, self.background_titles = (
+            UniqueSequence(
+                len(title_words()) ** 2, derive_seed(seed, "titles"), shard, 2 * workers
+            )
+            for shard in (worker, workers + worker)
+        )
+
+    def install(self) -> None:
+        """Seed the shared Faker and make its postcodes and titles unique."""
+        fake.seed_instance(derive_seed(self.seed, "worker", self.worker))
+        _use_sequences(fake, self.postcodes, self.titles)
+
+    def background_faker(self, label: str) -> Faker:
+        """
+        Create a Faker for data generated off the test thread.
+
+        Args:
+            label (str): What the Faker is for, e.g. ``"entity-pool"``; it
+                is part of its seed.
+
+        Returns:
+            Faker: A Faker seeded from the session seed, the label and the
+            worker, drawing unique values from the background sequences.
+        """
+        faker = Faker()
+        faker.add_provider(CustomProvider)
+        faker.seed_instance(derive_seed(self.seed, label, self.worker))
+        _use_sequences(faker, self.background_postcodes, self.background_titles)
+        return faker
+
+    def seed_test(self, test_id: str) -> int:
+        """
+        Reseed the shared Faker for a test.
+
+        Args:
+            test_id (str): The ID of the test, e.g. its pytest node ID.
+
+        Returns:
+            int: The seed of the test.
+        """
+        seed = derive_seed(self.seed, "test", test_id)
+        fake.seed_instance(seed)
+        return seed
+
+
+def _use_sequences(
+    faker: Faker, postcodes: UniqueSequence, titles: UniqueSequence
+) -> None:
+    """Make a Faker draw its postcodes and titles from unique sequences."""
+    provider = next(p for p in faker.get_providers() if isinstance(p, CustomProvider))
+    provider.postcodes = postcodes
+    provider.titles = titles
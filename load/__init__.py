@@ -0,0 +1 @@
+"""This package runs the entity CRUD scenarios as a load test."""
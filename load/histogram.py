@@ -0,0 +1,123 @@
+import math
+from collections import Counter
+from typing import Self
+
+SUB_BUCKET_BITS = 7  # 64 linear sub-buckets per power of two, ~1.6% error
+
+
+class LatencyHistogram:
+    """
+    HDR-style latency histogram with bounded relative error.
+
+    Values are recorded in microseconds into log-linear buckets: every power
+    of two is split into the same number of linear sub-buckets, so the
+    relative error is the same at 1 ms and at 10 s while memory stays small
+    and independent of the number of samples. Histograms from several
+    workers can be merged.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty histogram."""
+        self.counts: Counter[int] = Counter()
+        self.total = 0
+        self.min_us = math.inf
+        self.max_us = 0
+        self.sum_us = 0
+
+    def record(self, seconds: float) -> None:
+        """Record a latency given in seconds."""
+        value = max(0, int(seconds * 1_000_000))
+        self.counts[_bucket_index(value)] += 1
+        self.total += 1
+        self.sum_us += value
+        self.min_us = min(self.min_us, value)
+        self.max_us = max(self.max_us, value)
+
+    def merge(self, other: Self) -> None:
+        """Add all samples of another histogram to this one."""
+        self.counts.update(other.counts)
+        self.total += other.total
+        self.sum_us += other.sum_us
+        self.min_us = min(self.min_us, other.min_us)
+        self.max_us = max(self.max_us, other.max_us)
+
+    def percentile(self, q: float) -> float:
+        """Return the latency in seconds below which ``q`` percent of samples fall."""
+        if not self.total:
+            return 0.0
+        target = max(1, math.ceil(q / 100 * self.total))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(_bucket_upper(index), self.max_us) / 1_000_000
+        return self.max_us / 1_000_000
+
+    @property
+    def mean(self) -> float:
+        """Mean latency in seconds."""
+        return self.sum_us / self.total / 1_000_000 if self.total else 0.0
+
+    def distribution(self, bins: int = 10) -> list[tuple[float, int]]:
+        """
+        Return sample counts in ``bins`` log-spaced bins.
+
+        Returns:
+            list[tuple[float, int]]: Pairs of bin upper bound in seconds and
+            the number of samples in the bin.
+        """
+        if not self.total:
+            return []
+        low = max(self.min_us, 1)
+        ratio = (max(self.max_us, low + 1) / low) ** (1 / bins)
+        bounds = [low * ratio ** (i + 1) for i in range(bins)]
+        result = [0] * bins
+        for index, count in self.counts.items():
+            value = _bucket_lower(index)
+            slot = next((i for i, bound in enumerate(bounds) if value <= bound), -1)
+            result[slot] += count
+        return [
+            (bound / 1_000_000, count)
+            for bound, count in zip(bounds, result, strict=True)
+        ]
+
+    def to_dict(self) -> dict[str, float | int]:
+        """Summarize the histogram with latencies in milliseconds."""
+        return {
+            "count": self.total,
+            "min": round(self.min_us / 1000, 3) if self.total else 0.0,
+            "mean": round(self.mean * 1000, 3),
+            "p50": round(self.percentile(50) * 1000, 3),
+            "p90": round(self.percentile(90) * 1000, 3),
+            "p99": round(self.percentile(99) * 1000, 3),
+            "p99.9": round(self.percentile(99.9) * 1000, 3),
+            "max": round(self.max_us / 1000, 3),
+        }
+
+
+_SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+_HALF = _SUB_BUCKETS >> 1
+
+
+def _bucket_index(value: int) -> int:
+    """Map a value in microseconds to its bucket index."""
+    if value < _SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return _SUB_BUCKETS + (shift - 1) * _HALF + (value >> shift) - _HALF
+
+
+def _bucket_lower(index: int) -> int:
+    """Return the smallest value in microseconds stored in a bucket."""
+    if index < _SUB_BUCKETS:
+        return index
+    shift, sub = divmod(index - _SUB_BUCKETS, _HALF)
+    return (sub + _HALF) << (shift + 1)
+
+
+def _bucket_upper(index: int) -> int:
+    """Return the largest value in microseconds stored in a bucket."""
+    if index < _SUB_BUCKETS:
+        return index
+    shift = (index - _SUB_BUCKETS) // _HALF + 1
+    return _bucket_lower(index) + (1 << shift) - 1
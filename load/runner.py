@@ -0,0 +1,251 @@
+import asyncio
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import StrEnum
+from pathlib import Path
+
+from data.datasets import iter_payloads
+from services.entity.api_client import APIClient
+from services.entity.async_api_client import AsyncAPIClient
+from services.entity.async_entity_service import AsyncEntityService
+from services.entity.async_http_client import AsyncHTTPClient
+from services.entity.entity_service import EntityService
+from services.entity.http_client import HTTPClient
+from utils.allure_utils import AllureUtils, AttachPolicy
+
+from .histogram import LatencyHistogram
+from .scenarios import DEFAULT_MIX, EntityIds, Scenarios, parse_mix
+
+
+class Engine(StrEnum):
+    """How virtual users are executed."""
+
+    THREADS = "threads"
+    ASYNCIO = "asyncio"
+
+
+@dataclass(slots=True)
+class LoadConfig:
+    """
+    Settings of a load run.
+
+    Attributes:
+        base_url (str): The base URL of the entity service.
+        mix (str): Weighted operation mix, e.g. ``"create=2,get=5"``.
+        duration (float): Run time in seconds.
+        users (int): Virtual users in closed-loop mode; the concurrency cap
+            in open-loop mode.
+        rps (float | None): Target request rate; enables open-loop mode.
+        engine (Engine): Execute users on threads or on asyncio.
+        dataset (Path | None): Payload dataset the created entities are
+            taken from, in file order.
+    """
+
+    base_url: str
+    mix: str = DEFAULT_MIX
+    duration: float = 30.0
+    users: int = 10
+    rps: float | None = None
+    engine: Engine = Engine.THREADS
+    dataset: Path | None = None
+
+
+@dataclass(slots=True)
+class LoadReport:
+    """Results of a load run."""
+
+    duration: float
+    histograms: dict[str, LatencyHistogram] = field(default_factory=dict)
+    errors: dict[str, int] = field(default_factory=dict)
+    leaked: int = 0
+
+    @property
+    def total(self) -> int:
+        """Number of finished operations, including failed ones."""
+        return sum(h.total for h in self.histograms.values())
+
+    @property
+    def error_count(self) -> int:
+        """Number of failed operations."""
+        return sum(self.errors.values())
+
+    def to_dict(self) -> dict:
+        """Summarize the run with latencies in milliseconds."""
+        return {
+            "duration_s": round(self.duration, 3),
+            "operations": self.total,
+            "throughput_ops": round(self.total / self.duration, 2),
+            "error_rate": round(self.error_count / self.total, 4) if self.total else 0,
+            "leaked_entities": self.leaked,
+            "per_operation": {
+                name: {**histogram.to_dict(), "errors": self.errors.get(name, 0)}
+                for name, histogram in sorted(self.histograms.items())
+            },
+        }
+
+
+class _Stats:
+    """Per-operation histograms and error counts shared by virtual users."""
+
+    def __init__(self) -> None:
+        self.histograms: defaultdict[str, LatencyHistogram] = defaultdict(
+            LatencyHistogram
+        )
+        self.errors: defaultdict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def record(self, name: str, latency: float, *, failed: bool) -> None:
+        with self._lock:
+            self.histograms[name].record(latency)
+            if failed:
+                self.errors[name] += 1
+
+
+class LoadRunner:
+    """
+    Runs the entity CRUD scenarios as load for a fixed duration.
+
+    In closed-loop mode ``users`` virtual users run operations back to back.
+    In open-loop mode operations are started at a fixed rate regardless of
+    how fast the service answers; their latency is measured from the moment
+    they were due, so queueing delay is not hidden when the service falls
+    behind. Every entity created by the run is deleted at the end.
+    """
+
+    def __init__(self, config: LoadConfig) -> None:
+        """Initializes the runner with the given settings."""
+        self.config = config
+        self.ids = EntityIds()
+        payloads = iter_payloads(config.dataset) if config.dataset else None
+        self.scenarios = Scenarios(parse_mix(config.mix), self.ids, payloads)
+        self._stats = _Stats()
+
+    def run(self) -> LoadReport:
+        """Run the load and clean up the created entities.
+
+        Returns:
+            LoadReport: Throughput, errors and latency histograms of the run.
+        """
+        policy, AllureUtils.policy = AllureUtils.policy, AttachPolicy.NEVER
+        with HTTPClient(self.config.base_url, pool_maxsize=self.config.users) as http:
+            service = EntityService(APIClient(self.config.base_url, http))
+            start = time.perf_counter()
+            try:
+                if self.config.engine is Engine.ASYNCIO:
+                    asyncio.run(self._run_async(http))
+                else:
+                    self._run_threads(service)
+            finally:
+                duration = time.perf_counter() - start
+                leaked = Scenarios.cleanup(service, self.ids.drain())
+                AllureUtils.policy = policy
+        return LoadReport(
+            duration=duration,
+            histograms=dict(self._stats.histograms),
+            errors=dict(self._stats.errors),
+            leaked=leaked,
+        )
+
+    def _run_threads(self, service: EntityService) -> None:
+        """Run virtual users on a thread pool."""
+        deadline = time.perf_counter() + self.config.duration
+
+        def execute(due: float) -> None:
+            name = self.scenarios.choose()
+            try:
+                name = self.scenarios.run(name, service)
+            except Exception:  # noqa: BLE001
+                self._stats.record(name, time.perf_counter() - due, failed=True)
+            else:
+                self._stats.record(name, time.perf_counter() - due, failed=False)
+
+        def user() -> None:
+            while time.perf_counter() < deadline:
+                execute(time.perf_counter())
+
+        with ThreadPoolExecutor(max_workers=self.config.users) as pool:
+            if self.config.rps is None:
+                for _ in range(self.config.users):
+                    pool.submit(user)
+                return
+            for due in self._schedule(deadline):
+                time.sleep(max(0.0, due - time.perf_counter()))
+                pool.submit(execute, due)
+
+    async def _run_async(self, http: HTTPClient) -> None:
+        """Run virtual users as asyncio tasks."""
+        deadline = time.perf_counter() + self.config.duration
+        async_http = AsyncHTTPClient(
+            self.config.base_url, http, max_workers=self.config.users
+        )
+        async with AsyncAPIClient(self.config.base_url, async_http) as client:
+            service = AsyncEntityService(client)
+            semaphore = asyncio.Semaphore(self.config.users)
+
+            async def execute(due: float) -> None:
+                name = self.scenarios.choose()
+                async with semaphore:
+                    try:
+                        name = await self.scenarios.arun(name, service)
+                    except Exception:  # noqa: BLE001
+                        self._stats.record(name, time.perf_counter() - due, failed=True)
+                    else:
+                        self._stats.record(
+                            name, time.perf_counter() - due, failed=False
+                        )
+
+            async def user() -> None:
+                while time.perf_counter() < deadline:
+                    await execute(time.perf_counter())
+
+            if self.config.rps is None:
+                await asyncio.gather(*(user() for _ in range(self.config.users)))
+                return
+            tasks = set()
+            for due in self._schedule(deadline):
+                await asyncio.sleep(max(0.0, due - time.perf_counter()))
+                task = asyncio.create_task(execute(due))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            await asyncio.gather(*tasks)
+
+    def _schedule(self, deadline: float) -> Iterator[float]:
+        """Yield the due times of the operations in open-loop mode."""
+        interval = 1 / self.config.rps
+        due = time.perf_counter()
+        while due < deadline:
+            yield due
+            due += interval
+
+
+def format_report(report: LoadReport) -> str:
+    """Render a load report as a text table with latency histograms."""
+    summary = report.to_dict()
+    lines = [
+        f"Duration: {summary['duration_s']} s, operations: {summary['operations']}, "
+        f"throughput: {summary['throughput_ops']} ops/s, "
+        f"error rate: {summary['error_rate']:.2%}, "
+        f"leaked entities: {summary['leaked_entities']}",
+        "",
+        f"{'operation':<10} {'count':>7} {'errors':>6} {'p50':>9} {'p90':>9} "
+        f"{'p99':>9} {'p99.9':>9} {'max':>9}  (ms)",
+    ]
+    for name, stats in summary["per_operation"].items():
+        lines.append(
+            f"{name:<10} {stats['count']:>7} {stats['errors']:>6} "
+            f"{stats['p50']:>9.1f} {stats['p90']:>9.1f} {stats['p99']:>9.1f} "
+            f"{stats['p99.9']:>9.1f} {stats['max']:>9.1f}"
+        )
+    for name, histogram in sorted(report.histograms.items()):
+        lines.extend(["", f"{name} latency distribution:"])
+        bins = histogram.distribution()
+        peak = max(count for _, count in bins) or 1
+        lines.extend(
+            f"  <= {bound * 1000:9.1f} ms {count:>7} {'#' * (40 * count // peak)}"
+            for bound, count in bins
+        )
+    return "\n".join(lines)
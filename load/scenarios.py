@@ -0,0 +1,186 @@
+import random
+import threading
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from services.entity.async_entity_service import AsyncEntityService
+from services.entity.entity_service import EntityService
+from services.entity.payloads import Payloads
+
+OPERATIONS = ("create", "get", "getall", "patch", "delete")
+DEFAULT_MIX = "create=2,get=5,getall=1,patch=1,delete=1"
+
+
+def parse_mix(mix: str) -> dict[str, int]:
+    """
+    Parse a weighted operation mix such as ``"create=2,get=5"``.
+
+    Args:
+        mix (str): Comma separated ``operation=weight`` pairs.
+
+    Returns:
+        dict[str, int]: Weight per operation.
+    """
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.strip().partition("=")
+        if name not in OPERATIONS:
+            error_message = f"Unknown operation '{name}'. Use one of {OPERATIONS}"
+            raise ValueError(error_message)
+        weights[name] = int(weight or 1)
+    if not any(weights.values()):
+        error_message = "The operation mix needs at least one positive weight"
+        raise ValueError(error_message)
+    return weights
+
+
+class EntityIds:
+    """
+    Thread-safe set of the entity IDs created by a load run.
+
+    An operation takes the ID it works on out of the set and adds it back
+    when it is done, so no entity is deleted while another operation still
+    reads or patches it.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty set."""
+        self._ids: list[str] = []
+        self._lock = threading.Lock()
+
+    def add(self, entity_id: str) -> None:
+        """Remember a created entity, or give back a taken one."""
+        with self._lock:
+            self._ids.append(entity_id)
+
+    def take(self) -> str | None:
+        """Remove and return a random live entity ID, or None if there is none."""
+        with self._lock:
+            if not self._ids:
+                return None
+            index = random.randrange(len(self._ids))
+            self._ids[index], self._ids[-1] = self._ids[-1], self._ids[index]
+            return self._ids.pop()
+
+    def drain(self) -> list[str]:
+        """Remove and return every remaining ID."""
+        with self._lock:
+            ids, self._ids = self._ids, []
+            return ids
+
+
+class Scenarios:
+    """
+    The CRUD flows of the API suite as individual load operations.
+
+    Each operation mirrors what the tests do through ``EntityService``.
+    Operations that need an existing entity hold it exclusively while they
+    run and fall back to ``create`` while no entity is free. Every created ID
+    is tracked so the run can clean up.
+    """
+
+    def __init__(
+        self,
+        weights: dict[str, int],
+        ids: EntityIds,
+        payloads: Iterator[dict[str, Any]] | None = None,
+    ) -> None:
+        """Initializes the scenarios.
+
+        Args:
+            weights (dict[str, int]): Weight per operation.
+            ids (EntityIds): Registry of the entities created by the run.
+            payloads (Iterator[dict] | None): Payloads of the created entities,
+                e.g. a dataset file; random ones are generated once it runs out.
+        """
+        self.names = list(weights)
+        self.weights = list(weights.values())
+        self.ids = ids
+        self.payloads = payloads
+        self._payloads_lock = threading.Lock()
+
+    def choose(self) -> str:
+        """Pick the next operation according to the mix."""
+        return random.choices(self.names, self.weights)[0]
+
+    def next_payload(self) -> dict[str, Any]:
+        """Return the payload of the next created entity."""
+        with self._payloads_lock:
+            payload = next(self.payloads, None) if self.payloads else None
+        return payload or Payloads.generate_entity_payload()
+
+    def run(self, name: str, service: EntityService) -> str:
+        """
+        Run an operation synchronously.
+
+        Returns:
+            str: The operation that actually ran.
+        """
+        entity_id = None if name in {"create", "getall"} else self.ids.take()
+        if name == "create" or (name != "getall" and entity_id is None):
+            response = service.api_client.create_entity(self.next_payload())
+            response.raise_for_status()
+            try:
+                service.get_entity(response.text)
+            finally:
+                self.ids.add(response.text)
+            return "create"
+        try:
+            if name == "get":
+                service.get_entity(entity_id)
+            elif name == "getall":
+                service.get_all_entities(page=1, per_page=10)
+            elif name == "patch":
+                service.update_entity(entity_id, Payloads.create_entity_request())
+            else:
+                service.delete_entity(entity_id)
+                entity_id = None
+        finally:
+            if entity_id is not None:
+                self.ids.add(entity_id)
+        return name
+
+    async def arun(self, name: str, service: AsyncEntityService) -> str:
+        """
+        Run an operation on the event loop.
+
+        Returns:
+            str: The operation that actually ran.
+        """
+        entity_id = None if name in {"create", "getall"} else self.ids.take()
+        if name == "create" or (name != "getall" and entity_id is None):
+            response = await service.api_client.create_entity(self.next_payload())
+            response.raise_for_status()
+            try:
+                await service.get_entity(response.text)
+            finally:
+                self.ids.add(response.text)
+            return "create"
+        try:
+            if name == "get":
+                await service.get_entity(entity_id)
+            elif name == "getall":
+                await service.get_all_entities(page=1, per_page=10)
+            elif name == "patch":
+                await service.update_entity(entity_id, Payloads.create_entity_request())
+            else:
+                await service.delete_entity(entity_id)
+                entity_id = None
+        finally:
+            if entity_id is not None:
+                self.ids.add(entity_id)
+        return name
+
+    @staticmethod
+    def cleanup(service: EntityService, entity_ids: Iterable[str]) -> int:
+        """
+        Delete every remaining entity created by the run.
+
+        Returns:
+            int: The number of entities that could not be deleted.
+        """
+        try:
+            service.delete_entities(entity_ids)
+        except ExceptionGroup as group:
+            return len(group.exceptions)
+        return 0
@@ -28,7 +28,7 @@ class AddCustomerPage(BasePage):
         Returns:
             bool: True if the page is loaded, False otherwise
         """
-        return self.is_element_present(self.ADD_CUSTOMER_BUTTON)
+        return self.is_element_present(self.ADD_CUSTOMER_BUTTON, timeout=self.timeout)
 
     def enter_first_name(self, first_name: str) -> None:
         """Enter the first name in the input field.
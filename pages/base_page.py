@@ -2,10 +2,24 @@ import allure
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.chrome.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 
 from config.config_ui.config import BASE_URL, DEFAULT_TIMEOUT
+from utils.ui.waits import Waits
+
+# Returns the trimmed text of every cell of the rows matching a locator.
+_READ_TABLE = """
+const [by, value] = arguments;
+let rows;
+if (by === "xpath") {
+    const result = document.evaluate(
+        value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    rows = Array.from(
+        {length: result.snapshotLength}, (_, i) => result.snapshotItem(i));
+} else {
+    rows = Array.from(document.querySelectorAll(value));
+}
+return rows.map(row => Array.from(row.cells, cell => cell.innerText.trim()));
+"""
 
 
 class BasePage:
@@ -17,17 +31,19 @@ class BasePage:
         self.base_url = BASE_URL
         self.url = url
         self.timeout = DEFAULT_TIMEOUT
+        self.waits = Waits(browser, self.timeout)
 
     def open_page(self) -> None:
-        """Open a page using the given URL."""
+        """Open a page using the given URL and wait until Angular settles."""
         with allure.step(f"Opening page: {self.base_url}{self.url}"):
             self.browser.get(f"{self.base_url}{self.url}")
+            self.waits.angular_stable()
 
     def find_element(self, locator: tuple[str, str]) -> WebElement:
-        """Find an element on the page."""
+        """Find an element on the page, waiting until it is present."""
         try:
-            return self.browser.find_element(*locator)
-        except NoSuchElementException as e:
+            return self.waits.present(locator)[0]
+        except TimeoutException as e:
             error_message = f"Element not found with locator: {locator}"
             raise NoSuchElementException(error_message) from e
 
@@ -43,11 +59,21 @@ class BasePage:
         element.clear()
         element.send_keys(text)
 
-    def is_element_present(self, locator: tuple[str, str]) -> bool:
-        """Check if an element is present on the page."""
+    def is_element_present(self, locator: tuple[str, str], timeout: float = 0) -> bool:
+        """
+        Check if an element is present on the page.
+
+        Args:
+            locator (tuple[str, str]): Locator of the element.
+            timeout (float): Seconds to wait for it; by default the page is
+                checked once, so a negative check returns at once.
+
+        Returns:
+            bool: True if the element is present.
+        """
         try:
-            self.find_element(locator)
-        except NoSuchElementException:
+            self.waits.present(locator, timeout)
+        except TimeoutException:
             return False
         else:
             return True
@@ -56,17 +82,7 @@ class BasePage:
         self, locator: tuple[str, str], timeout: int | None = None
     ) -> WebElement:
         """Wait for an element to be present on the page."""
-        if timeout is None:
-            timeout = self.timeout
-        try:
-            return WebDriverWait(self.browser, timeout).until(
-                EC.presence_of_element_located(locator),
-            )
-        except TimeoutException as e:
-            error_message = (
-                f"Element not found within {timeout} seconds. Locator: {locator}"
-            )
-            raise TimeoutException(error_message) from e
+        return self.wait_for_elements(locator, timeout)[0]
 
     def wait_for_elements(
         self, locator: tuple[str, str], timeout: int | None = None
@@ -75,9 +91,7 @@ class BasePage:
         if timeout is None:
             timeout = self.timeout
         try:
-            return WebDriverWait(self.browser, timeout).until(
-                EC.presence_of_all_elements_located(locator),
-            )
+            return self.waits.present(locator, timeout)
         except TimeoutException as e:
             error_message = (
                 f"Elements not found within {timeout} seconds. Locator: {locator}"
@@ -88,3 +102,24 @@ class BasePage:
         """Clear the field specified by the locator."""
         element = self.wait_for_element(locator)
         element.clear()
+
+    def read_table(
+        self, locator: tuple[str, str], timeout: int | None = None
+    ) -> list[list[str]]:
+        """
+        Read the text of every cell of the table rows in one round trip.
+
+        If no row is present yet, waits for one like ``wait_for_elements``.
+
+        Args:
+            locator (tuple[str, str]): XPath or CSS locator of the rows.
+            timeout (int | None): Seconds to wait for the rows.
+
+        Returns:
+            list[list[str]]: The cell texts of each row, in page order.
+        """
+        rows = self.browser.execute_script(_READ_TABLE, *locator)
+        if not rows:
+            self.wait_for_elements(locator, timeout)
+            rows = self.browser.execute_script(_READ_TABLE, *locator)
+        return rows
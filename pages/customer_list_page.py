@@ -1,3 +1,6 @@
+from dataclasses import dataclass
+from typing import Self
+
 import allure
 from selenium.webdriver.chrome.webdriver import WebDriver
 from selenium.webdriver.common.by import By
@@ -11,6 +14,22 @@ from utils.ui.statistics_utils import (
 )
 
 
+@dataclass(frozen=True, slots=True)
+class CustomerRecord:
+    """A row of the customer table."""
+
+    first_name: str
+    last_name: str
+    post_code: str
+    account_numbers: tuple[str, ...]
+
+    @classmethod
+    def from_cells(cls, cells: list[str]) -> Self:
+        """Build a record from the cell texts of a table row."""
+        first_name, last_name, post_code, accounts = cells[:4]
+        return cls(first_name, last_name, post_code, tuple(accounts.split()))
+
+
 class CustomerListPage(BasePage):
     """Page object for the Customer List page in XYZ Bank application."""
 
@@ -35,21 +54,31 @@ class CustomerListPage(BasePage):
         Returns:
             bool: True if the page is loaded, False otherwise
         """
-        return self.is_element_present(self.FIRST_NAME_HEADER)
+        return self.is_element_present(self.FIRST_NAME_HEADER, timeout=self.timeout)
 
     @allure.step("Click on the First Name header")
     def click_first_name_header(self) -> None:
         """Click the first name header."""
         self.click_element(self.FIRST_NAME_HEADER)
 
+    def get_customers(self) -> list[CustomerRecord]:
+        """Read the whole customer table in one round trip.
+
+        Returns:
+            list[CustomerRecord]: The customers in the order shown
+        """
+        return [
+            CustomerRecord.from_cells(cells)
+            for cells in self.read_table(self.CUSTOMER_ROWS)
+        ]
+
     def get_customer_names(self) -> list[str]:
         """Get the list of customer first names.
 
         Returns:
             List[str]: List of customer first names
         """
-        customer_rows: list[WebElement] = self.wait_for_elements(self.CUSTOMER_ROWS)
-        return [row.find_element(By.XPATH, "./td[1]").text for row in customer_rows]
+        return [customer.first_name for customer in self.get_customers()]
 
     @allure.step("Sort customers by first name")
     def sort_names(self, sort_direction: str) -> None:
@@ -58,19 +87,14 @@ class CustomerListPage(BasePage):
         Args:
             sort_direction (str): The direction to sort ('ascending' or 'descending')
         """
-        current_order = self.get_customer_names()
-        if sort_direction == "descending":
-            while current_order == self.get_customer_names():
-                self.click_first_name_header()
-        elif sort_direction == "ascending":
-            while current_order == self.get_customer_names():
-                self.click_first_name_header()
-                if current_order != self.get_customer_names():
-                    self.click_first_name_header()
-                    break
-        else:
+        clicks = {"descending": 1, "ascending": 2}.get(sort_direction)
+        if clicks is None:
             error_message = "Invalid sort direction. Use 'ascending' or 'descending'."
             raise ValueError(error_message)
+        for _ in range(clicks):
+            rows = self.waits.text(self.CUSTOMER_ROWS)
+            self.click_first_name_header()
+            self.waits.text_changed(self.CUSTOMER_ROWS, rows)
 
     @allure.step("Verify customer sorting")
     def verify_sorting(self, names: list[str]) -> bool:
@@ -96,11 +120,9 @@ class CustomerListPage(BasePage):
     @allure.step("Find the row corresponding to the customer name: {name}")
     def find_customer_row_by_name(self, name: str) -> WebElement:
         """Find the row corresponding to the customer name."""
-        customer_rows: list[WebElement] = self.wait_for_elements(self.CUSTOMER_ROWS)
-        for row in customer_rows:
-            first_name_element = row.find_element(By.XPATH, "./td[1]")
-            if first_name_element.text == name:
-                return row
+        names = self.get_customer_names()
+        if name in names:
+            return self.browser.find_elements(*self.CUSTOMER_ROWS)[names.index(name)]
         error_message = f"Customer with name '{name}' not found"
         raise ValueError(error_message)
 
@@ -1,3 +1,6 @@
+from types import TracebackType
+from typing import Self
+
 import allure
 from requests import Response
 
@@ -8,10 +11,33 @@ from .http_client import HTTPClient
 class APIClient:
     """Low-level API client for interacting with the service."""
 
-    def __init__(self, base_url: str) -> None:
-        """Initializes the APIClient with a base URL."""
+    def __init__(self, base_url: str, http_client: HTTPClient | None = None) -> None:
+        """Initializes the APIClient with a base URL.
+
+        Args:
+            base_url (str): The base URL of the service.
+            http_client (HTTPClient | None): A shared pooled client to send
+                requests through. A private one is created when omitted.
+        """
         self.base_url = base_url
-        self.http_client = HTTPClient(base_url)
+        self.http_client = http_client or HTTPClient(base_url)
+
+    def __enter__(self) -> Self:
+        """Returns the client for use as a context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Closes the underlying HTTP client on leaving the context."""
+        self.close()
+
+    def close(self) -> None:
+        """Closes the underlying HTTP client and its connection pool."""
+        self.http_client.close()
 
     @allure.step("Create entity")
     def create_entity(self, payload: dict) -> Response:
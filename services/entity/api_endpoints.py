@@ -6,3 +6,17 @@ class APIEndpoints:
     GET_ALL_ENDPOINT = "/api/getall/"
     UPDATE_ENDPOINT = "/api/patch/"
     DELETE_ENDPOINT = "/api/delete/"
+
+    @classmethod
+    def tag_for(cls, path: str) -> str:
+        """Return the endpoint a request path belongs to, without its entity ID."""
+        endpoints = (
+            cls.CREATE_ENDPOINT,
+            cls.GET_ALL_ENDPOINT,
+            cls.GET_ENDPOINT,
+            cls.UPDATE_ENDPOINT,
+            cls.DELETE_ENDPOINT,
+        )
+        return next(
+            (endpoint for endpoint in endpoints if path.startswith(endpoint)), path
+        )
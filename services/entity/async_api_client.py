@@ -0,0 +1,69 @@
+from types import TracebackType
+from typing import Self
+
+from requests import Response
+
+from .api_endpoints import APIEndpoints
+from .async_http_client import AsyncHTTPClient
+
+
+class AsyncAPIClient:
+    """Asyncio twin of APIClient.
+
+    Allure steps are not opened here: concurrent coroutines would interleave
+    them on one step stack. Wrap a whole fan-out in a single step instead.
+    """
+
+    def __init__(
+        self, base_url: str, http_client: AsyncHTTPClient | None = None
+    ) -> None:
+        """Initializes the AsyncAPIClient with a base URL.
+
+        Args:
+            base_url (str): The base URL of the service.
+            http_client (AsyncHTTPClient | None): The async client to send
+                requests through. A private one is created when omitted.
+        """
+        self.base_url = base_url
+        self.http_client = http_client or AsyncHTTPClient(base_url)
+
+    async def __aenter__(self) -> Self:
+        """Returns the client for use as an async context manager."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Closes the underlying HTTP client on leaving the context."""
+        self.close()
+
+    def close(self) -> None:
+        """Closes the underlying async HTTP client."""
+        self.http_client.close()
+
+    async def create_entity(self, payload: dict) -> Response:
+        """Creates a new entity."""
+        return await self.http_client.post(APIEndpoints.CREATE_ENDPOINT, payload)
+
+    async def get_entity(self, entity_id: str) -> Response:
+        """Gets an entity with the given entity ID."""
+        return await self.http_client.get(f"{APIEndpoints.GET_ENDPOINT}{entity_id}")
+
+    async def get_all_entities(self, params: dict | None = None) -> Response:
+        """Gets all entities with the provided filters."""
+        return await self.http_client.get(APIEndpoints.GET_ALL_ENDPOINT, params=params)
+
+    async def update_entity(self, entity_id: str, payload: dict) -> Response:
+        """Updates an entity with the given entity ID and data."""
+        return await self.http_client.patch(
+            f"{APIEndpoints.UPDATE_ENDPOINT}{entity_id}", payload
+        )
+
+    async def delete_entity(self, entity_id: str) -> Response:
+        """Deletes an entity with the given entity ID."""
+        return await self.http_client.delete(
+            f"{APIEndpoints.DELETE_ENDPOINT}{entity_id}"
+        )
@@ -0,0 +1,243 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
+from contextlib import suppress
+from typing import Any
+
+from requests import HTTPError, Response
+
+from config.config_api.config import PAGE_PREFETCH, PAGE_SIZE, SEED_CONCURRENCY
+from services.entity.async_api_client import AsyncAPIClient
+from services.entity.cleanup import CleanupRegistry
+from services.entity.entity_service import EntityService
+from services.entity.models.decoding import decode_entities, decode_entity
+from services.entity.models.entity_model import EntityRequest, EntityResponse
+from services.entity.payloads import Payloads
+from utils.async_utils import gather_bounded
+
+
+class AsyncEntityService:
+    """Asyncio twin of EntityService with the same method surface."""
+
+    def __init__(
+        self,
+        api_client: AsyncAPIClient,
+        *,
+        trusted_reads: bool = False,
+        cleanup: CleanupRegistry | None = None,
+    ) -> None:
+        """Initializes the service with the provided async API client.
+
+        Args:
+            api_client (AsyncAPIClient): The client used to send requests.
+            trusted_reads (bool): Build getall rows with ``model_construct``
+                instead of validating them, for bulk reads of rows not under test.
+            cleanup (CleanupRegistry | None): Registry every created entity is
+                registered with, so it is deleted by the end of the session.
+        """
+        self.api_client = api_client
+        self.payloads = Payloads()
+        self.trusted_reads = trusted_reads
+        self.cleanup = cleanup
+
+    async def create_entity(self) -> tuple[Response, EntityResponse]:
+        """Creates a new entity and returns its data."""
+        payload = self.payloads.generate_entity_payload()
+        response = await self.api_client.create_entity(payload)
+        response.raise_for_status()
+        entity_id = response.text
+        if self.cleanup is not None:
+            self.cleanup.register([entity_id])
+        return response, await self.get_entity(entity_id)
+
+    async def get_entity(self, entity_id: str) -> EntityResponse:
+        """Gets an entity with the given entity ID."""
+        return (await self.get_entity_response(entity_id))[1]
+
+    async def get_entity_response(
+        self, entity_id: str
+    ) -> tuple[Response, EntityResponse]:
+        """Gets an entity from the server together with its response."""
+        response = await self.api_client.get_entity(entity_id)
+        response.raise_for_status()
+        return response, decode_entity(response.content)
+
+    async def get_all_entities(
+        self,
+        title: str | None = None,
+        verified: bool | None = None,
+        page: int | None = None,
+        per_page: int | None = None,
+    ) -> tuple[Response, list[EntityResponse]]:
+        """Gets all entities with the provided filters."""
+        params = {k: v for k, v in locals().items() if v is not None and k != "self"}
+        response = await self.api_client.get_all_entities(params)
+        response.raise_for_status()
+        return response, decode_entities(response.content, trusted=self.trusted_reads)
+
+    async def update_entity(
+        self, entity_id: str, entity: EntityRequest
+    ) -> tuple[Response, EntityResponse | None]:
+        """Updates an entity with the given entity ID and data."""
+        response = await self.api_client.update_entity(entity_id, entity.model_dump())
+        response.raise_for_status()
+        if response.status_code == 204:
+            return response, None
+        return response, await self.get_entity(entity_id)
+
+    async def iter_entities(
+        self,
+        title: str | None = None,
+        verified: bool | None = None,
+        page_size: int = PAGE_SIZE,
+        prefetch: int = PAGE_PREFETCH,
+    ) -> AsyncIterator[EntityResponse]:
+        """
+        Lazily yields entities page by page, like ``EntityService.iter_entities``.
+
+        Up to ``prefetch`` pages ahead of the one being consumed are fetched
+        concurrently. Paging stops at the first page that is not full.
+
+        Args:
+            title (str | None): Title filter.
+            verified (bool | None): Verification status filter.
+            page_size (int): Number of entities requested per page.
+            prefetch (int): Number of pages fetched ahead.
+
+        Yields:
+            EntityResponse: The entities in server order.
+        """
+
+        async def fetch(page: int) -> list[EntityResponse]:
+            return (await self.get_all_entities(title, verified, page, page_size))[1]
+
+        pending = deque(
+            asyncio.ensure_future(fetch(page)) for page in range(1, prefetch + 2)
+        )
+        next_page = prefetch + 2
+        try:
+            while pending:
+                entities = await pending.popleft()
+                for entity in entities:
+                    yield entity
+                if len(entities) != page_size:
+                    return
+                pending.append(asyncio.ensure_future(fetch(next_page)))
+                next_page += 1
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def contains_ids(self, entity_ids: Iterable[int]) -> bool:
+        """
+        Checks that all the given IDs exist, like ``EntityService.contains_ids``.
+
+        IDs the pages did not show are confirmed one by one before the check
+        fails, as offset paging skips rows deleted meanwhile.
+        """
+        remaining = set(entity_ids)
+        if remaining:
+            async for entity in self.iter_entities():
+                remaining.discard(entity.id)
+                if not remaining:
+                    break
+        return remaining <= (await self._get_missed(remaining)).keys()
+
+    async def delete_entity(self, entity_id: str) -> Response:
+        """Deletes an entity with the given entity ID."""
+        response = await self.api_client.delete_entity(entity_id)
+        response.raise_for_status()
+        if self.cleanup is not None:
+            self.cleanup.forget(entity_id)
+        return response
+
+    async def create_entities(
+        self,
+        entities: int | list[dict[str, Any]],
+        *,
+        max_workers: int = SEED_CONCURRENCY,
+    ) -> list[EntityResponse]:
+        """
+        Creates entities concurrently without reading each one back.
+
+        Like ``EntityService.create_entities``, every created entity is
+        registered with the cleanup as soon as its response arrives, and if
+        any creation fails the created entities are deleted and the failures
+        are raised as an ``ExceptionGroup``.
+
+        Args:
+            entities (int | list[dict]): Number of entities to generate, or the
+                payloads to create.
+            max_workers (int): Maximum number of requests sent concurrently.
+
+        Returns:
+            list[EntityResponse]: The created entities, in payload order.
+        """
+        if isinstance(entities, int):
+            payloads = [
+                self.payloads.generate_entity_payload() for _ in range(entities)
+            ]
+        else:
+            payloads = list(entities)
+
+        async def create(payload: dict[str, Any]) -> str:
+            response = await self.api_client.create_entity(payload)
+            response.raise_for_status()
+            if self.cleanup is not None:
+                self.cleanup.register([response.text])
+            return response.text
+
+        results = await gather_bounded(
+            max_workers, *map(create, payloads), return_exceptions=True
+        )
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            created = [result for result in results if isinstance(result, str)]
+            with suppress(ExceptionGroup):
+                await self.delete_entities(created, max_workers=max_workers)
+            error_message = (
+                f"Failed to create {len(errors)} of {len(payloads)} entities"
+            )
+            raise ExceptionGroup(error_message, errors)
+        return [
+            EntityService._entity_from_payload(entity_id, payload)  # noqa: SLF001
+            for entity_id, payload in zip(results, payloads, strict=True)
+        ]
+
+    async def delete_entities(
+        self, entity_ids: Iterable[str], *, max_workers: int = SEED_CONCURRENCY
+    ) -> list[Response]:
+        """
+        Deletes entities concurrently.
+
+        Every deletion is attempted; failures are raised together as an
+        ``ExceptionGroup`` once all requests have finished.
+
+        Args:
+            entity_ids (Iterable[str]): IDs of the entities to delete.
+            max_workers (int): Maximum number of requests sent concurrently.
+
+        Returns:
+            list[Response]: The delete responses, in ID order.
+        """
+        entity_ids = list(entity_ids)
+        results = await gather_bounded(
+            max_workers, *map(self.delete_entity, entity_ids), return_exceptions=True
+        )
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            error_message = (
+                f"Failed to delete {len(errors)} of {len(entity_ids)} entities"
+            )
+            raise ExceptionGroup(error_message, errors)
+        return results
+
+    async def _get_missed(self, entity_ids: Iterable[int]) -> dict[int, EntityResponse]:
+        """Reads entities a getall pass did not show; absent ones are left out."""
+        found = {}
+        for entity_id in entity_ids:
+            try:
+                found[entity_id] = (await self.get_entity_response(str(entity_id)))[1]
+            except HTTPError:
+                continue
+        return found
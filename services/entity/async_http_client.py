@@ -0,0 +1,94 @@
+import asyncio
+import contextvars
+from functools import partial
+from types import TracebackType
+from typing import Any, Self
+
+import requests
+
+from config.config_api.config import POOL_MAXSIZE
+from utils.allure_utils import AllureUtils
+
+from .background import background_executor
+from .http_client import HTTPClient
+
+
+class AsyncHTTPClient:
+    """Asyncio twin of HTTPClient.
+
+    Requests are sent through a pooled ``HTTPClient`` on a dedicated thread
+    pool, so coroutines can fan out over the same keep-alive connections the
+    synchronous stack uses. The thread pool is sized to the connection pool,
+    which keeps every in-flight request on a warm connection. Responses are
+    attached to the Allure report on the thread running the event loop.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        http_client: HTTPClient | None = None,
+        max_workers: int = POOL_MAXSIZE,
+    ) -> None:
+        """Initializes the AsyncHTTPClient.
+
+        Args:
+            base_url (str): The base URL prepended to every endpoint.
+            http_client (HTTPClient | None): A pooled client to share. A private
+                one is created (and closed with this client) when omitted.
+            max_workers (int): Maximum number of requests sent concurrently.
+        """
+        self.base_url = base_url
+        self._owns_client = http_client is None
+        self.http_client = http_client or HTTPClient(base_url, pool_maxsize=max_workers)
+        self._executor = background_executor(max_workers, "async-http")
+
+    async def __aenter__(self) -> Self:
+        """Returns the client for use as an async context manager."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Closes the client on leaving the context."""
+        self.close()
+
+    def close(self) -> None:
+        """Shuts down the thread pool and closes the HTTP client if owned."""
+        self._executor.shutdown(wait=True)
+        if self._owns_client:
+            self.http_client.close()
+
+    async def _run(self, method: str, *args: Any) -> requests.Response:  # noqa: ANN401
+        """
+        Runs a method of the wrapped HTTPClient on the thread pool.
+
+        The call runs in the context of the coroutine, so its request is sent
+        in the cassette scope of the test awaiting it.
+        """
+        loop = asyncio.get_running_loop()
+        call = partial(getattr(self.http_client, method), *args)
+        context = contextvars.copy_context()
+        response = await loop.run_in_executor(self._executor, context.run, call)
+        AllureUtils.attach_response(response)
+        return response
+
+    async def get(
+        self, endpoint: str, params: dict[str, Any] | None = None
+    ) -> requests.Response:
+        """Sends a GET request to the specified endpoint with the provided data."""
+        return await self._run("get", endpoint, params)
+
+    async def post(self, endpoint: str, data: dict[str, Any]) -> requests.Response:
+        """Sends a POST request to the specified endpoint with the provided data."""
+        return await self._run("post", endpoint, data)
+
+    async def patch(self, endpoint: str, data: dict[str, Any]) -> requests.Response:
+        """Sends a PATCH request to the specified endpoint with the provided data."""
+        return await self._run("patch", endpoint, data)
+
+    async def delete(self, endpoint: str) -> requests.Response:
+        """Sends a DELETE request to the specified endpoint."""
+        return await self._run("delete", endpoint)
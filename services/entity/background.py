@@ -0,0 +1,40 @@
+"""Thread pools for the background work of the entity services."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.allure_utils import AllureUtils
+
+from .cassette import current_scope, set_scope
+
+
+def background_executor(
+    max_workers: int, thread_name_prefix: str = "", scope: str | None = None
+) -> ThreadPoolExecutor:
+    """
+    Create a thread pool for requests sent off the test thread.
+
+    Its threads never attach responses to the Allure report, which only
+    knows the test running on the test thread, and send their requests in
+    one cassette scope.
+
+    Args:
+        max_workers (int): Maximum number of threads.
+        thread_name_prefix (str): Prefix of the thread names.
+        scope (str | None): The cassette scope of the requests; by default
+            the scope of the thread creating the pool.
+
+    Returns:
+        ThreadPoolExecutor: The thread pool.
+    """
+    return ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix=thread_name_prefix,
+        initializer=_start_thread,
+        initargs=(current_scope() if scope is None else scope,),
+    )
+
+
+def _start_thread(scope: str) -> None:
+    """Set up a thread of a background pool."""
+    AllureUtils.disable_in_thread()
+    set_scope(scope)
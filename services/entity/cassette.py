@@ -0,0 +1,544 @@
+"""
+Record/replay of HTTP exchanges for ``HTTPClient``.
+
+In record mode every exchange is appended to a tape file next to an offset
+index; in replay mode the tapes are memory-mapped and matching requests are
+answered from disk without touching the network.
+
+A request is matched by its scope, its method, path and query, the shape of
+its JSON body, and how many identical requests the scope has already sent.
+The scope belongs to the thread sending the request: the test thread sends
+in the scope of the running test (its node ID), background thread pools in
+the scope of the thread that created them, and the entity pool and the
+deferred cleanup in the session scope. Volatile values take no part in
+matching:
+
+- a body is reduced to its keys and value types, so payloads drawn by Faker
+  from any seed match the recorded ones;
+- an entity ID in a path is replaced by its alias in the scope, the order in
+  which the scope first sent it, so a test matches whichever pooled entity
+  it leased; session requests replace it with a placeholder;
+- non-numeric query values are ignored.
+
+Replay maps every recorded ID of a scope to the live ID sent in its place
+and rewrites the IDs of the entities in the replayed responses through that
+map. An entity field that echoes what was recorded as sent for the entity,
+on create or update, is rendered with the value sent for it in the replay;
+fields the server did not echo are replayed as recorded. Session requests
+of all tapes are pooled, so a replay may select a subset of the tests and
+run on any number of workers.
+"""
+
+import hashlib
+import json
+import mmap
+import struct
+import threading
+from collections import Counter, defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import timedelta
+from enum import StrEnum
+from operator import itemgetter
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+_FRAME = struct.Struct("<II")
+METADATA_FILE = "cassette.json"
+SESSION_SCOPE = "session"
+
+_scope: ContextVar[str] = ContextVar("cassette_scope", default=SESSION_SCOPE)
+
+
+class CassetteMode(StrEnum):
+    """What the cassette does with the requests passing through it."""
+
+    RECORD = "record"
+    REPLAY = "replay"
+    PASSTHROUGH = "passthrough"
+
+
+class CassetteMissError(requests.ConnectionError):
+    """Raised in replay mode when no recorded exchange matches a request."""
+
+
+def current_scope() -> str:
+    """Return the scope the current thread sends its requests in."""
+    return _scope.get()
+
+
+def set_scope(scope: str) -> None:
+    """Send the following requests of the current thread in ``scope``."""
+    _scope.set(scope)
+
+
+@contextmanager
+def request_scope(scope: str) -> Iterator[None]:
+    """Send the requests of the current thread in ``scope`` inside the block."""
+    token = _scope.set(scope)
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+def save_metadata(directory: str | Path, **metadata: Any) -> None:  # noqa: ANN401
+    """Store facts about a recording, e.g. its data seed, next to its tapes."""
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+    (path / METADATA_FILE).write_text(json.dumps(metadata), encoding="utf-8")
+
+
+def load_metadata(directory: str | Path) -> dict[str, Any]:
+    """Return the facts stored with a recording, or nothing if there are none."""
+    path = Path(directory) / METADATA_FILE
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+class Cassette:
+    """
+    A directory of tapes shared by every client of a test session.
+
+    Each process records to its own tape (``<name>.tape`` plus ``<name>.idx``,
+    and ``<name>.entities`` with the bodies sent per entity ID), so xdist
+    workers never write to the same file; replay loads every tape of the
+    directory. Record into an empty directory.
+
+    Example:
+        cassette = Cassette("cassettes", CassetteMode.REPLAY)
+        client = HTTPClient(BASE_URL, cassette=cassette)
+    """
+
+    def __init__(
+        self, directory: str | Path, mode: CassetteMode, name: str = "api"
+    ) -> None:
+        """Initializes the cassette and opens its tapes.
+
+        Args:
+            directory (str | Path): Directory holding the tapes.
+            mode (CassetteMode): Record, replay or pass requests through.
+            name (str): Tape name of this process; in replay mode the session
+                requests of this tape are served first.
+        """
+        self.directory = Path(directory)
+        self.mode = CassetteMode(mode)
+        self.name = name
+        self._counts: Counter[tuple[str, str]] = Counter()
+        self._aliases: dict[str, dict[str, str]] = defaultdict(dict)
+        self._ids: dict[str, dict[str, str]] = defaultdict(dict)
+        self._sent: dict[str, list[Any]] = defaultdict(list)
+        self._recorded: dict[tuple[str, str], list[Any]] = {}
+        self._issued: set[str] = set()
+        self._next_id = 1
+        self._lock = threading.Lock()
+        self._index: dict[str, tuple[mmap.mmap, int, str]] = {}
+        self._maps: list[mmap.mmap] = []
+        self._tape = None
+        self._tape_index: dict[str, int] = {}
+        if self.mode is CassetteMode.RECORD:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._tape_path = self.directory / f"{name}.tape"
+            self._tape = self._tape_path.open("wb")
+        elif self.mode is CassetteMode.REPLAY:
+            self._load()
+
+    def start_scope(self, scope: str) -> None:
+        """Match the following requests of this thread in a new scope, e.g. a test."""
+        set_scope(scope)
+        with self._lock:
+            for key in [key for key in self._counts if key[0] == scope]:
+                del self._counts[key]
+            self._aliases.pop(scope, None)
+            self._ids.pop(scope, None)
+
+    def note_ids(self, entity_ids: list[str]) -> None:
+        """
+        Note the IDs of entities the scope got without a request, e.g. a lease.
+
+        Recording stores them in the scope. Replay maps the IDs noted at the
+        same point of the recorded scope to them, so the scope finds its live
+        entities in the replayed responses, e.g. in getall pages.
+        """
+        if self.mode is CassetteMode.PASSTHROUGH:
+            return
+        scope = _scope.get()
+        key = self._count(scope, "IDS")
+        if self.mode is CassetteMode.RECORD:
+            meta = json.dumps({"key": key, "ids": entity_ids}).encode()
+            with self._lock:
+                self._tape_index[key] = self._tape.tell()
+                self._tape.write(_FRAME.pack(len(meta), 0) + meta)
+        elif key in self._index:
+            meta, _, _ = self._read(key)
+            with self._lock:
+                self._ids[scope].update(zip(meta["ids"], entity_ids, strict=False))
+
+    def wrap(self, adapter: BaseAdapter) -> BaseAdapter:
+        """Put the cassette in front of a transport adapter."""
+        if self.mode is CassetteMode.PASSTHROUGH:
+            return adapter
+        return _CassetteAdapter(self, adapter)
+
+    def close(self) -> None:
+        """Finish the tape being recorded and release the replayed ones."""
+        if self._tape is not None:
+            self._tape.close()
+            self._tape = None
+            self._tape_path.with_suffix(".idx").write_text(
+                json.dumps(self._tape_index), encoding="utf-8"
+            )
+            self._tape_path.with_suffix(".entities").write_text(
+                json.dumps(self._sent), encoding="utf-8"
+            )
+        for tape in self._maps:
+            tape.close()
+        self._maps.clear()
+        self._index.clear()
+
+    def record(
+        self, request: requests.PreparedRequest, response: requests.Response
+    ) -> None:
+        """Append an exchange to the tape."""
+        key = self._key(request)
+        path = urlsplit(request.url).path
+        meta = json.dumps(
+            {
+                "key": key,
+                "path": path,
+                "status": response.status_code,
+                "reason": response.reason,
+                "headers": dict(response.headers),
+            }
+        ).encode()
+        content = response.content
+        with self._lock:
+            self._tape_index[key] = self._tape.tell()
+            self._tape.write(_FRAME.pack(len(meta), len(content)) + meta + content)
+            self._remember_sent(request, path, content)
+
+    def replay(self, request: requests.PreparedRequest) -> requests.Response:
+        """
+        Build the recorded response of a request for the live entities.
+
+        Raises:
+            CassetteMissError: If the request was not recorded.
+        """
+        scope = _scope.get()
+        key = self._key(request)
+        if key not in self._index:
+            error_message = f"No recorded response for {key} in {self.directory}"
+            raise CassetteMissError(error_message, request=request)
+        meta, recorded, tape_name = self._read(key)
+        headers = CaseInsensitiveDict(meta["headers"])
+
+        path = urlsplit(request.url).path
+        with self._lock:
+            ids = self._ids[scope]
+            ids.update(zip(_path_ids(meta["path"]), _path_ids(path), strict=False))
+            content = self._translate(request, recorded, ids, tape_name)
+            self._remember_sent(request, path, content)
+        if content is not recorded:
+            headers.pop("Content-Length", None)
+
+        response = requests.Response()
+        response.status_code = meta["status"]
+        response.reason = meta["reason"]
+        response.headers = headers
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.elapsed = timedelta(0)
+        response._content = content  # noqa: SLF001
+        return response
+
+    def _key(self, request: requests.PreparedRequest) -> str:
+        """Build the matching key of a request and count it in the scope."""
+        url = urlsplit(request.url)
+        query = urlencode(
+            sorted(
+                (name, value if value.isdigit() else "*")
+                for name, value in parse_qsl(url.query)
+            )
+        )
+        scope = _scope.get()
+        with self._lock:
+            path = self._alias_path(scope, url.path.rstrip("/"))
+        target = f"{request.method} {path}?{query}"
+        if request.body:
+            body = _json_body(request)
+            shape = (
+                json.dumps(_shape(body)).encode()
+                if body is not None
+                else _encode(request.body)
+            )
+            target += f"#{hashlib.blake2b(shape, digest_size=8).hexdigest()}"
+        return self._count(scope, target)
+
+    def _count(self, scope: str, target: str) -> str:
+        """Count a target in a scope and return its key."""
+        if scope == SESSION_SCOPE and self.mode is CassetteMode.RECORD:
+            scope = f"{SESSION_SCOPE}:{self.name}"
+        with self._lock:
+            sequence = self._counts[scope, target]
+            self._counts[scope, target] += 1
+        return f"{scope}|{target}|{sequence}"
+
+    def _alias_path(self, scope: str, path: str) -> str:
+        """Replace the entity IDs of a path by their aliases in the scope."""
+        aliases = self._aliases[scope]
+        segments = path.split("/")
+        for position, segment in enumerate(segments):
+            if segment.isdigit():
+                if scope == SESSION_SCOPE:
+                    segments[position] = "{id}"
+                else:
+                    alias = aliases.setdefault(segment, f"{{{len(aliases)}}}")
+                    segments[position] = alias
+        return "/".join(segments)
+
+    def _read(self, key: str) -> tuple[dict[str, Any], bytes, str]:
+        """Return the meta, the content and the tape name of an exchange."""
+        tape, offset, tape_name = self._index[key]
+        meta_size, content_size = _FRAME.unpack_from(tape, offset)
+        start = offset + _FRAME.size
+        meta = json.loads(tape[start : start + meta_size])
+        content = tape[start + meta_size : start + meta_size + content_size]
+        return meta, content, tape_name
+
+    def _remember_sent(
+        self, request: requests.PreparedRequest, path: str, content: bytes
+    ) -> None:
+        """Note the body sent for an entity, on create or update."""
+        body = _json_body(request)
+        if not isinstance(body, dict):
+            return
+        path_ids = _path_ids(path)
+        text = content.strip()
+        if path_ids:
+            self._sent[path_ids[-1]].append(body)
+        elif text.isdigit():
+            self._sent[text.decode()].append(body)
+
+    def _translate(
+        self,
+        request: requests.PreparedRequest,
+        content: bytes,
+        ids: dict[str, str],
+        tape_name: str,
+    ) -> bytes:
+        """
+        Rewrite a recorded response for the live entities of the scope.
+
+        A created entity keeps its recorded ID unless the replay already
+        issued it for another entity, e.g. one recorded by another worker.
+
+        Returns:
+            bytes: The rewritten content, or ``content`` itself if nothing
+            had to change.
+        """
+        text = content.strip()
+        if text.isdigit() and not _path_ids(urlsplit(request.url).path):
+            recorded_id = text.decode()
+            ids[recorded_id] = live_id = self._issue(recorded_id)
+            return content if live_id == recorded_id else live_id.encode()
+        return self._translate_entities(content, ids, tape_name)
+
+    def _translate_entities(
+        self, content: bytes, ids: dict[str, str], tape_name: str
+    ) -> bytes:
+        """Rewrite the entity, or the lists of entities, of a JSON response."""
+        try:
+            data = json.loads(content)
+        except ValueError:
+            return content
+        if not isinstance(data, dict):
+            return content
+        entities = [data] if "id" in data else []
+        for value in data.values():
+            if isinstance(value, list):
+                entities += (
+                    item for item in value if isinstance(item, dict) and "id" in item
+                )
+        original = json.dumps(data)
+        for entity in entities:
+            self._translate_entity(entity, ids, tape_name)
+        translated = json.dumps(data)
+        return content if translated == original else translated.encode()
+
+    def _translate_entity(
+        self, entity: dict[str, Any], ids: dict[str, str], tape_name: str
+    ) -> None:
+        """Give an entity its live ID and the live values of its echoed fields."""
+        recorded_id = str(entity["id"])
+        live_id = _live_id(ids, recorded_id)
+        recorded = self._recorded.get((tape_name, recorded_id), [])
+        sent = self._sent.get(live_id, [])
+        for position in reversed(range(min(len(recorded), len(sent)))):
+            if _echoes(entity, recorded[position]):
+                _substitute(entity, sent[position])
+                break
+        if live_id.isdigit():
+            entity["id"] = int(live_id)
+
+    def _issue(self, recorded_id: str) -> str:
+        """Return a live ID for a created entity, unique within the replay."""
+        live_id = recorded_id
+        if live_id in self._issued:
+            live_id = str(self._next_id)
+            self._next_id += 1
+        self._issued.add(live_id)
+        return live_id
+
+    def _load(self) -> None:
+        """
+        Memory-map every tape of the directory and read its index.
+
+        Session requests are renumbered across the tapes, starting with the
+        tape of this process, so every process of the replay draws from the
+        session requests of the whole recording.
+        """
+        sessions: Counter[str] = Counter()
+        tape_paths = sorted(
+            self.directory.glob("*.tape"),
+            key=lambda path: (path.stem != self.name, path.name),
+        )
+        for tape_path in tape_paths:
+            if tape_path.stat().st_size == 0:
+                continue
+            with tape_path.open("rb") as file:
+                tape = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps.append(tape)
+            name = tape_path.stem
+            index_path = tape_path.with_suffix(".idx")
+            if index_path.exists():
+                index = json.loads(index_path.read_text(encoding="utf-8"))
+            else:
+                index = _scan(tape)
+            for recorded_key, offset in sorted(index.items(), key=itemgetter(1)):
+                key = recorded_key
+                scope, target, _ = key.rsplit("|", 2)
+                if scope.startswith(f"{SESSION_SCOPE}:"):
+                    key = f"{SESSION_SCOPE}|{target}|{sessions[target]}"
+                    sessions[target] += 1
+                self._index[key] = (tape, offset, name)
+            entities_path = tape_path.with_suffix(".entities")
+            if entities_path.exists():
+                sent = json.loads(entities_path.read_text(encoding="utf-8"))
+                self._recorded.update(
+                    ((name, entity_id), bodies) for entity_id, bodies in sent.items()
+                )
+        self._next_id = 1 + max(
+            (int(entity_id) for _, entity_id in self._recorded), default=0
+        )
+
+
+class _CassetteAdapter(BaseAdapter):
+    """Transport adapter recording or replaying through a cassette."""
+
+    def __init__(self, cassette: Cassette, adapter: BaseAdapter) -> None:
+        super().__init__()
+        self.cassette = cassette
+        self.adapter = adapter
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> requests.Response:
+        if self.cassette.mode is CassetteMode.REPLAY:
+            return self.cassette.replay(request)
+        response = self.adapter.send(request, **kwargs)
+        self.cassette.record(request, response)
+        return response
+
+    def close(self) -> None:
+        self.adapter.close()
+
+
+def _scan(tape: mmap.mmap) -> dict[str, int]:
+    """Rebuild the index of a tape whose index file is missing."""
+    index, offset = {}, 0
+    while offset < len(tape):
+        meta_size, content_size = _FRAME.unpack_from(tape, offset)
+        start = offset + _FRAME.size
+        index[json.loads(tape[start : start + meta_size])["key"]] = offset
+        offset = start + meta_size + content_size
+    return index
+
+
+def _encode(body: bytes | str) -> bytes:
+    """Return a request body as bytes."""
+    return body if isinstance(body, bytes) else body.encode()
+
+
+def _json_body(request: requests.PreparedRequest) -> Any:  # noqa: ANN401
+    """Return the decoded JSON body of a request, or None if it has none."""
+    if not request.body:
+        return None
+    try:
+        return json.loads(request.body)
+    except ValueError:
+        return None
+
+
+def _path_ids(path: str) -> list[str]:
+    """Return the entity IDs in a path, in order."""
+    return [segment for segment in path.split("/") if segment.isdigit()]
+
+
+def _live_id(ids: dict[str, str], recorded_id: str) -> str:
+    """
+    Return the live ID of a recorded entity of a scope.
+
+    A recorded ID the scope never mapped keeps its value, unless that value
+    is the live ID of another entity of the scope; the entity then takes
+    the recorded ID of that one, so two entities never share an ID.
+    """
+    if recorded_id in ids:
+        return ids[recorded_id]
+    recorded_ids = {live_id: recorded for recorded, live_id in ids.items()}
+    live_id = recorded_id
+    while live_id in recorded_ids:
+        live_id = recorded_ids[live_id]
+    return live_id
+
+
+def _shape(value: Any) -> Any:  # noqa: ANN401
+    """
+    Reduce a JSON value to its keys and value types.
+
+    Lists become the sorted set of the shapes of their items, so lists of
+    any length match.
+    """
+    if isinstance(value, dict):
+        return {key: _shape(item) for key, item in sorted(value.items())}
+    if isinstance(value, list):
+        return sorted({json.dumps(_shape(item)) for item in value})
+    return type(value).__name__
+
+
+def _echoes(entity: Any, sent: Any) -> bool:  # noqa: ANN401
+    """Return True if every field sent for an entity is found in it unchanged."""
+    if isinstance(sent, dict):
+        return isinstance(entity, dict) and all(
+            key in entity and _echoes(entity[key], value) for key, value in sent.items()
+        )
+    return entity == sent
+
+
+def _substitute(entity: dict[str, Any], sent: dict[str, Any]) -> None:
+    """Overwrite the fields of an entity with the ones sent for it."""
+    for key, value in sent.items():
+        if isinstance(value, dict) and isinstance(entity.get(key), dict):
+            _substitute(entity[key], value)
+        else:
+            entity[key] = value
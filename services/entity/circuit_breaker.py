@@ -0,0 +1,137 @@
+"""Client-side circuit breaker that fails fast while the backend is down."""
+
+import json
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, astuple, dataclass
+from pathlib import Path
+
+import requests
+
+from config.config_api.config import CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT
+
+from .cassette import CassetteMissError
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows shares no state between workers
+    fcntl = None
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """Raised instead of sending a request while the circuit is open."""
+
+
+@dataclass(slots=True)
+class _State:
+    failures: int = 0
+    opened_at: float | None = None
+    probe_at: float | None = None
+    last_error: str = ""
+
+
+class CircuitBreaker:
+    """
+    Stops sending requests after consecutive connection failures.
+
+    After ``failure_threshold`` connection errors or timeouts in a row the
+    circuit opens and every request fails at once with ``CircuitOpenError``.
+    Once ``reset_timeout`` has passed a single request is let through as a
+    probe: its success closes the circuit, its failure opens it again.
+
+    With a ``state_path`` the state lives in a small JSON file guarded by
+    ``flock``, so all xdist workers of a run trip and recover together.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_RESET_TIMEOUT,
+        state_path: Path | None = None,
+    ) -> None:
+        """Initializes a closed circuit.
+
+        Args:
+            failure_threshold (int): Consecutive failures that open the circuit.
+            reset_timeout (float): Seconds before an open circuit is probed.
+            state_path (Path | None): File shared with other processes; the
+                state is kept in memory when omitted.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state_path = state_path
+        self._state = _State()
+        self._lock = threading.Lock()
+
+    def before_request(self) -> None:
+        """
+        Check whether a request may be sent.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a
+                probe already in flight.
+        """
+        with self._locked() as state:
+            if state.opened_at is None:
+                return
+            now = time.time()
+            waiting = state.opened_at + self.reset_timeout - now
+            probing = state.probe_at is not None and (
+                now - state.probe_at < self.reset_timeout
+            )
+            if waiting > 0 or probing:
+                error_message = (
+                    f"Circuit open after {state.failures} consecutive connection "
+                    f"failures (last: {state.last_error}); failing fast, next "
+                    f"probe in {max(waiting, 0):.0f} s"
+                )
+                raise CircuitOpenError(error_message)
+            state.probe_at = now
+
+    def record_success(self) -> None:
+        """Close the circuit after a request got a response."""
+        with self._locked() as state:
+            if state.opened_at is not None:
+                logging.info("Circuit closed, the API answers again")
+            state.failures, state.opened_at, state.probe_at = 0, None, None
+
+    def record_failure(self, exception: BaseException) -> None:
+        """Count a failed request; other than connection errors are ignored."""
+        if not isinstance(
+            exception, requests.ConnectionError | requests.Timeout
+        ) or isinstance(exception, CircuitOpenError | CassetteMissError):
+            return
+        with self._locked() as state:
+            state.failures += 1
+            state.last_error = type(exception).__name__
+            if state.probe_at is not None or (
+                state.opened_at is None and state.failures >= self.failure_threshold
+            ):
+                logging.error(
+                    "Circuit opened after %d consecutive connection failures: %s",
+                    state.failures,
+                    exception,
+                )
+                state.opened_at, state.probe_at = time.time(), None
+
+    @contextmanager
+    def _locked(self) -> Iterator[_State]:
+        """Hold the state exclusively, writing it back if it changed."""
+        with self._lock:
+            if self.state_path is None or fcntl is None:
+                yield self._state
+                return
+            with self.state_path.open("a+", encoding="utf-8") as file:
+                fcntl.flock(file, fcntl.LOCK_EX)
+                file.seek(0)
+                raw = file.read()
+                state = _State(**json.loads(raw)) if raw else _State()
+                before = astuple(state)
+                yield state
+                if astuple(state) != before:
+                    file.seek(0)
+                    file.truncate()
+                    file.write(json.dumps(asdict(state)))
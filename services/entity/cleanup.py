@@ -0,0 +1,118 @@
+import json
+import logging
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+
+from config.config_api.config import CLEANUP_CONCURRENCY
+from services.entity.api_client import APIClient
+from services.entity.background import background_executor
+from services.entity.cassette import SESSION_SCOPE
+from services.entity.entity_cache import EntityCache
+
+
+class CleanupRegistry:
+    """
+    Deletes the entities created by a session off the critical path.
+
+    Services register every entity as soon as the server answers its create
+    request with a success, before they process the response, so the leak
+    report covers every entity the server created. Fixtures schedule the ones
+    they are done with, and a background pool deletes them while the next
+    tests run, sending them in the session scope of the cassette. ``close``
+    is the final barrier: it waits for the pending deletions, deletes
+    whatever is still registered and writes a report of the entities that
+    could not be deleted.
+    """
+
+    def __init__(
+        self,
+        api_client: APIClient,
+        max_workers: int = CLEANUP_CONCURRENCY,
+        cache: EntityCache | None = None,
+    ) -> None:
+        """Initializes the registry.
+
+        Args:
+            api_client (APIClient): The client used to delete entities.
+            max_workers (int): Maximum number of deletions in flight.
+            cache (EntityCache | None): Entity cache of the session; deleted
+                entities are dropped from it.
+        """
+        self.api_client = api_client
+        self.max_workers = max_workers
+        self.cache = cache
+        self._live: set[str] = set()
+        self._deleted: set[str] = set()
+        self._failed: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._executor = background_executor(max_workers, "cleanup", SESSION_SCOPE)
+
+    def register(self, entity_ids: Iterable[str]) -> None:
+        """Record created entities so they are deleted by the end of the session."""
+        with self._lock:
+            self._live.update(entity_ids)
+
+    def forget(self, entity_id: str) -> None:
+        """Record an entity that was deleted by its owner."""
+        with self._lock:
+            self._live.discard(entity_id)
+            self._failed.pop(entity_id, None)
+            self._deleted.add(entity_id)
+
+    def is_deleted(self, entity_id: str) -> bool:
+        """Return True if the entity was deleted by its owner or the registry."""
+        with self._lock:
+            return entity_id in self._deleted
+
+    def schedule(self, entity_ids: Iterable[str]) -> None:
+        """Delete entities in the background; already deleted ones are skipped."""
+        with self._lock:
+            ids = [
+                entity_id for entity_id in entity_ids if entity_id not in self._deleted
+            ]
+            self._live.difference_update(ids)
+        for entity_id in ids:
+            self._executor.submit(self._delete, entity_id)
+
+    def close(self, report_path: Path | None = None) -> dict[str, str]:
+        """
+        Wait for the scheduled deletions and delete every remaining entity.
+
+        Args:
+            report_path (Path | None): Where to write the JSON leak report.
+
+        Returns:
+            dict[str, str]: The error per entity that could not be deleted.
+        """
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            remaining = sorted(self._live | self._failed.keys())
+            self._live.clear()
+            self._failed.clear()
+        with background_executor(
+            self.max_workers, "cleanup-close", SESSION_SCOPE
+        ) as pool:
+            pool.map(self._delete, remaining)
+
+        with self._lock:
+            leaked = dict(sorted(self._failed.items()))
+            deleted = len(self._deleted)
+        if leaked:
+            logging.warning("%d entities could not be deleted: %s", len(leaked), leaked)
+        if report_path is not None:
+            report = {"deleted": deleted, "leaked": leaked}
+            report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        return leaked
+
+    def _delete(self, entity_id: str) -> None:
+        """Delete one entity and record the outcome."""
+        if self.cache is not None:
+            self.cache.invalidate(int(entity_id))
+        try:
+            self.api_client.delete_entity(entity_id).raise_for_status()
+        except Exception as e:  # noqa: BLE001
+            with self._lock:
+                self._failed[entity_id] = str(e)
+        else:
+            self.forget(entity_id)
@@ -0,0 +1,71 @@
+import threading
+import time
+from collections import OrderedDict
+
+from config.config_api.config import ENTITY_CACHE_SIZE, ENTITY_CACHE_TTL
+from services.entity.models.entity_model import EntityResponse
+
+
+class EntityCache:
+    """
+    Thread-safe LRU cache of entities with a time to live.
+
+    Cached entities are shared objects and must not be modified by callers.
+    """
+
+    def __init__(
+        self, max_size: int = ENTITY_CACHE_SIZE, ttl: float = ENTITY_CACHE_TTL
+    ) -> None:
+        """Initializes an empty cache.
+
+        Args:
+            max_size (int): Maximum number of entities kept.
+            ttl (float): Seconds an entity stays valid after it was stored.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[int, tuple[float, EntityResponse]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, entity_id: int) -> EntityResponse | None:
+        """Return a fresh cached entity, or None."""
+        with self._lock:
+            item = self._entries.get(entity_id)
+            if item is None or item[0] < time.monotonic():
+                self._entries.pop(entity_id, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(entity_id)
+            self.hits += 1
+            return item[1]
+
+    def put(self, entity: EntityResponse) -> None:
+        """Store an entity."""
+        with self._lock:
+            self._entries[entity.id] = (time.monotonic() + self.ttl, entity)
+            self._entries.move_to_end(entity.id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, entity_id: int) -> None:
+        """Drop an entity, e.g. after it was updated or deleted."""
+        with self._lock:
+            self._entries.pop(entity_id, None)
+
+    def clear(self) -> None:
+        """Drop every entity."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, float]:
+        """Return the hit and miss counts and the hit rate."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "size": len(self._entries),
+            }
@@ -0,0 +1,168 @@
+import logging
+import threading
+from collections.abc import Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
+from itertools import islice
+from typing import Any
+
+from faker import Faker
+
+from data.providers import fake
+from services.entity.background import background_executor
+from services.entity.cassette import SESSION_SCOPE, Cassette, request_scope
+from services.entity.entity_service import EntityService
+from services.entity.models.entity_model import EntityResponse
+
+
+class EntityPool:
+    """
+    Pool of entities shared by the tests of a session.
+
+    Entities are created on demand, when a lease finds the pool short, in one
+    parallel batch; the create response confirms them, so nothing is read
+    back. Read-only leases hand out entities that stay in the pool, so any
+    number of tests can read the same rows. A mutating lease takes the
+    entities out of the pool for good: they are deleted in the background
+    once the lease ends, except the ones the test deleted itself and marked
+    as deleted with ``CleanupRegistry.forget``, as ``EntityService.delete_entity``
+    does. Nothing is created ahead of a lease, so the pool never creates
+    entities no test uses. Whatever is left is deleted in bulk on ``close``.
+
+    All requests of the pool are sent in the session scope of the cassette,
+    whichever test triggers them, and the leased IDs are noted in the scope
+    of the lease, so a replay maps them to the entities leased at recording.
+
+    The pool cannot tell whether a test really is read-only; tests that
+    change or delete their entities must lease them as mutating.
+    """
+
+    def __init__(
+        self,
+        service: EntityService,
+        payloads: Iterator[dict[str, Any]] | None = None,
+        faker: Faker = fake,
+        cassette: Cassette | None = None,
+    ) -> None:
+        """Initializes an empty pool.
+
+        Args:
+            service (EntityService): The service used to create and delete.
+            payloads (Iterator[dict] | None): Payloads of the pooled entities,
+                e.g. a dataset shard; random ones are generated once it runs out.
+            faker (Faker): Draws the random payloads. Pass one of its own,
+                e.g. ``DataSeeder.background_faker``, so the pool does not
+                consume the random stream of the running test.
+            cassette (Cassette | None): The cassette of the service's client.
+        """
+        self.service = service
+        self.payloads = payloads
+        self.faker = faker
+        self.cassette = cassette
+        self.created = 0
+        self.leased = 0
+        self._clean: list[EntityResponse] = []
+        self._taken: set[str] = set()
+        self._lock = threading.Lock()
+        self._executor = background_executor(1, "entity-pool", SESSION_SCOPE)
+
+    @contextmanager
+    def lease(
+        self, count: int = 1, *, mutating: bool = False
+    ) -> Iterator[list[EntityResponse]]:
+        """
+        Lease entities from the pool.
+
+        Args:
+            count (int): Number of entities to lease.
+            mutating (bool): The holder changes or deletes the entities, so
+                they are never handed out again.
+
+        Yields:
+            list[EntityResponse]: The leased entities.
+        """
+        entities = self._acquire(count, mutating=mutating)
+        if self.cassette is not None:
+            self.cassette.note_ids([str(entity.id) for entity in entities])
+        try:
+            yield entities
+        finally:
+            if mutating:
+                future = self._executor.submit(
+                    self._discard, [str(entity.id) for entity in entities]
+                )
+                future.add_done_callback(_log_failure)
+
+    def close(self) -> None:
+        """Wait for background deletions and delete every remaining entity."""
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            ids = [str(entity.id) for entity in self._clean] + sorted(self._taken)
+            self._clean, self._taken = [], set()
+        with request_scope(SESSION_SCOPE):
+            self._discard(ids)
+        logging.info(
+            "Entity pool: %d created, %d leased, %d deleted at close",
+            self.created,
+            self.leased,
+            len(ids),
+        )
+
+    def _acquire(self, count: int, *, mutating: bool) -> list[EntityResponse]:
+        """Take entities from the pool, creating the missing ones."""
+        with self._lock:
+            missing = count - len(self._clean)
+        if missing > 0:
+            with request_scope(SESSION_SCOPE):
+                self._fill(missing)
+
+        with self._lock:
+            entities = self._clean[:count]
+            if mutating:
+                del self._clean[:count]
+                self._taken.update(str(entity.id) for entity in entities)
+            self.leased += count
+        return entities
+
+    def _fill(self, count: int) -> None:
+        """Create entities and add them to the pool."""
+        with self._lock:
+            payloads = list(islice(self.payloads, count)) if self.payloads else []
+        payloads += (
+            self.service.payloads.generate_entity_payload(self.faker)
+            for _ in range(count - len(payloads))
+        )
+        entities = self.service.create_entities(payloads)
+        with self._lock:
+            self._clean.extend(entities)
+            self.created += len(entities)
+
+    def _discard(self, entity_ids: list[str]) -> None:
+        """
+        Delete entities, skipping the ones their holder already deleted.
+
+        Entities that cannot be deleted stay registered with the cleanup of
+        the service, which retries them and reports them as leaked.
+        """
+        cleanup = self.service.cleanup
+        live = [
+            entity_id
+            for entity_id in entity_ids
+            if cleanup is None or not cleanup.is_deleted(entity_id)
+        ]
+        try:
+            self.service.delete_entities(live)
+        except ExceptionGroup as group:
+            logging.warning(
+                "Entity pool could not delete %d entities: %s",
+                len(group.exceptions),
+                group.exceptions,
+            )
+        with self._lock:
+            self._taken.difference_update(entity_ids)
+
+
+def _log_failure(future: Future) -> None:
+    """Log a failed background deletion."""
+    if not future.cancelled() and future.exception() is not None:
+        logging.warning("Entity pool background job failed: %s", future.exception())
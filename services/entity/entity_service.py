@@ -1,17 +1,54 @@
-from requests import Response
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future
+from contextlib import suppress
+from typing import Any
 
+import allure
+from requests import HTTPError, Response
+
+from config.config_api.config import PAGE_PREFETCH, PAGE_SIZE, SEED_CONCURRENCY
 from services.entity.api_client import APIClient
-from services.entity.models.entity_model import EntityRequest, EntityResponse
+from services.entity.background import background_executor
+from services.entity.cleanup import CleanupRegistry
+from services.entity.entity_cache import EntityCache
+from services.entity.models.decoding import decode_entities, decode_entity
+from services.entity.models.entity_model import (
+    AdditionResponse,
+    EntityRequest,
+    EntityResponse,
+)
 from services.entity.payloads import Payloads
 
 
 class EntityService:
     """High-level service for entity operations with deserialization."""
 
-    def __init__(self, api_client: APIClient) -> None:
-        """Initializes the service with the provided API client."""
+    def __init__(
+        self,
+        api_client: APIClient,
+        *,
+        trusted_reads: bool = False,
+        cache: EntityCache | None = None,
+        cleanup: CleanupRegistry | None = None,
+    ) -> None:
+        """Initializes the service with the provided API client.
+
+        Args:
+            api_client (APIClient): The client used to send requests.
+            trusted_reads (bool): Build getall rows with ``model_construct``
+                instead of validating them, for bulk reads of rows not under test.
+            cache (EntityCache | None): Read-through cache of entities, filled
+                by gets, creates and validated getall pages and invalidated by
+                updates and deletes.
+            cleanup (CleanupRegistry | None): Registry every created entity is
+                registered with, so it is deleted by the end of the session.
+        """
         self.api_client = api_client
         self.payloads = Payloads()
+        self.trusted_reads = trusted_reads
+        self.cache = cache
+        self.cleanup = cleanup
 
     def create_entity(self) -> tuple[Response, EntityResponse]:
         """Creates a new entity and returns its data."""
@@ -19,14 +56,35 @@ class EntityService:
         response = self.api_client.create_entity(payload)
         response.raise_for_status()
         entity_id = response.text
-        return response, self.get_entity(entity_id)[1]
+        if self.cleanup is not None:
+            self.cleanup.register([entity_id])
+        return response, self.get_entity(entity_id)
+
+    def get_entity(self, entity_id: str, *, use_cache: bool = True) -> EntityResponse:
+        """
+        Gets an entity with the given entity ID.
 
-    def get_entity(self, entity_id: str) -> tuple[Response, EntityResponse]:
-        """Gets an entity with the given entity ID."""
+        Args:
+            entity_id (str): ID of the entity.
+            use_cache (bool): Serve the entity from the cache if it is there;
+                False always asks the server (and refreshes the cache).
+
+        Returns:
+            EntityResponse: The entity.
+        """
+        if self.cache is not None and use_cache:
+            cached = self.cache.get(int(entity_id))
+            if cached is not None:
+                return cached
+        return self.get_entity_response(entity_id)[1]
+
+    def get_entity_response(self, entity_id: str) -> tuple[Response, EntityResponse]:
+        """Gets an entity from the server, bypassing and refreshing the cache."""
         response = self.api_client.get_entity(entity_id)
         response.raise_for_status()
-        data = response.json()
-        entity = EntityResponse(**data)
+        entity = decode_entity(response.content)
+        if self.cache is not None:
+            self.cache.put(entity)
         return response, entity
 
     def get_all_entities(
@@ -40,22 +98,343 @@ class EntityService:
         params = {k: v for k, v in locals().items() if v is not None and k != "self"}
         response = self.api_client.get_all_entities(params)
         response.raise_for_status()
-        data = response.json()
-        entities = data["entity"]
-        return response, [EntityResponse(**item) for item in entities]
+        entities = decode_entities(response.content, trusted=self.trusted_reads)
+        if self.cache is not None and not self.trusted_reads:
+            for entity in entities:
+                self.cache.put(entity)
+        return response, entities
+
+    def iter_entities(
+        self,
+        title: str | None = None,
+        verified: bool | None = None,
+        page_size: int = PAGE_SIZE,
+        prefetch: int = PAGE_PREFETCH,
+    ) -> Iterator[EntityResponse]:
+        """
+        Lazily yields entities page by page using the page/per_page filters.
+
+        Up to ``prefetch`` pages ahead of the one being consumed are fetched in
+        the background. Paging stops at the first page that is not full; a page
+        larger than ``page_size`` means the server ignored pagination, so it is
+        treated as the last one as well.
+
+        Args:
+            title (str | None): Title filter.
+            verified (bool | None): Verification status filter.
+            page_size (int): Number of entities requested per page.
+            prefetch (int): Number of pages fetched ahead in the background.
+
+        Yields:
+            EntityResponse: The entities in server order.
+        """
+
+        def fetch(page: int) -> list[EntityResponse]:
+            return self.get_all_entities(title, verified, page, page_size)[1]
+
+        if prefetch < 1:
+            page = 1
+            while True:
+                entities = fetch(page)
+                yield from entities
+                if len(entities) != page_size:
+                    return
+                page += 1
+
+        pool = background_executor(prefetch, "getall")
+        try:
+            pending: deque[Future[list[EntityResponse]]] = deque(
+                pool.submit(fetch, page) for page in range(1, prefetch + 2)
+            )
+            next_page = prefetch + 2
+            while pending:
+                entities = pending.popleft().result()
+                yield from entities
+                if len(entities) != page_size:
+                    return
+                pending.append(pool.submit(fetch, next_page))
+                next_page += 1
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def contains_ids(
+        self,
+        entity_ids: Iterable[int],
+        page_size: int = PAGE_SIZE,
+        prefetch: int = PAGE_PREFETCH,
+    ) -> bool:
+        """
+        Checks that all the given IDs exist, stopping once every one is seen.
+
+        Offset paging skips a row whenever a row before it is deleted between
+        two pages, e.g. by the cleanup or another worker, so the IDs the pages
+        did not show are confirmed one by one before the check fails.
+
+        Args:
+            entity_ids (Iterable[int]): IDs of the entities to look for.
+            page_size (int): Number of entities requested per page.
+            prefetch (int): Number of pages fetched ahead in the background.
+
+        Returns:
+            bool: True if every ID was found, False otherwise.
+        """
+        remaining = set(entity_ids)
+        if not remaining:
+            return True
+        for entity in self.iter_entities(page_size=page_size, prefetch=prefetch):
+            remaining.discard(entity.id)
+            if not remaining:
+                return True
+        return remaining <= self._get_missed(remaining).keys()
 
     def update_entity(
         self, entity_id: str, entity: EntityRequest
     ) -> tuple[Response, EntityResponse | None]:
         """Updates an entity with the given entity ID and data."""
         response = self.api_client.update_entity(entity_id, entity.model_dump())
+        if self.cache is not None:
+            self.cache.invalidate(int(entity_id))
         response.raise_for_status()
         if response.status_code == 204:
             return response, None
-        return response, self.get_entity(entity_id)[1]
+        return response, self.get_entity(entity_id)
 
     def delete_entity(self, entity_id: str) -> Response:
         """Deletes an entity with the given entity ID."""
         response = self.api_client.delete_entity(entity_id)
+        if self.cache is not None:
+            self.cache.invalidate(int(entity_id))
         response.raise_for_status()
+        if self.cleanup is not None:
+            self.cleanup.forget(entity_id)
         return response
+
+    def create_entities(
+        self,
+        entities: int | list[dict[str, Any]],
+        *,
+        verify: bool = False,
+        max_workers: int = SEED_CONCURRENCY,
+    ) -> list[EntityResponse]:
+        """
+        Creates entities in parallel without reading each one back.
+
+        The returned entities are built from the request payloads and the ids
+        returned by the server, so ``addition.id`` is not known unless
+        ``verify`` is set. With ``verify`` a single ``get_all_entities`` pass
+        checks every created row at once and the server rows are returned.
+
+        Every entity the server created is registered with the cleanup as
+        soon as its response arrives. If any creation fails, the entities
+        that were created are deleted and the failures are raised as an
+        ``ExceptionGroup``.
+
+        Args:
+            entities (int | list[dict]): Number of entities to generate, or the
+                payloads to create.
+            verify (bool): Check all created rows against the server.
+            max_workers (int): Maximum number of requests sent concurrently.
+
+        Returns:
+            list[EntityResponse]: The created entities, in payload order.
+        """
+        if isinstance(entities, int):
+            payloads = [
+                self.payloads.generate_entity_payload() for _ in range(entities)
+            ]
+        else:
+            payloads = list(entities)
+        if not payloads:
+            return []
+
+        with (
+            allure.step(f"Create {len(payloads)} entities"),
+            background_executor(min(max_workers, len(payloads)), "create") as pool,
+        ):
+            futures = [
+                pool.submit(self.api_client.create_entity, payload)
+                for payload in payloads
+            ]
+            created, created_ids, errors = [], [], []
+            for payload, future in zip(payloads, futures, strict=True):
+                try:
+                    response = future.result()
+                    response.raise_for_status()
+                    created_ids.append(response.text)
+                    if self.cleanup is not None:
+                        self.cleanup.register([response.text])
+                    created.append(self._entity_from_payload(response.text, payload))
+                except Exception as e:  # noqa: BLE001
+                    errors.append(e)
+
+        if errors:
+            with suppress(ExceptionGroup):
+                self.delete_entities(created_ids)
+            error_message = (
+                f"Failed to create {len(errors)} of {len(payloads)} entities"
+            )
+            raise ExceptionGroup(error_message, errors)
+
+        if verify:
+            return self._verify_created(created, payloads)
+        return created
+
+    def seed_entities(
+        self, payloads: Iterable[dict[str, Any]], *, max_workers: int = SEED_CONCURRENCY
+    ) -> list[str]:
+        """
+        Creates entities from a stream of payloads, e.g. a dataset file.
+
+        Requests are pipelined: up to ``max_workers`` are in flight with as
+        many queued behind them, and the next payload is only read when the
+        oldest one finishes, so datasets of any size are seeded without
+        holding them in memory. Nothing is read back.
+
+        Once a creation fails no further payloads are sent; the entities that
+        were created are deleted and the failures are raised as an
+        ``ExceptionGroup``.
+
+        Args:
+            payloads (Iterable[dict]): The payloads to create.
+            max_workers (int): Maximum number of requests sent concurrently.
+
+        Returns:
+            list[str]: IDs of the created entities, in payload order.
+        """
+        created, errors = [], []
+        pending: deque[Future[Response]] = deque()
+
+        def collect(future: Future[Response]) -> None:
+            try:
+                response = future.result()
+                response.raise_for_status()
+            except Exception as e:  # noqa: BLE001
+                errors.append(e)
+            else:
+                created.append(response.text)
+                if self.cleanup is not None:
+                    self.cleanup.register([response.text])
+
+        with (
+            allure.step("Seed entities"),
+            background_executor(max_workers, "seed") as pool,
+        ):
+            for payload in payloads:
+                if len(pending) >= 2 * max_workers:
+                    collect(pending.popleft())
+                if errors:
+                    break
+                pending.append(pool.submit(self.api_client.create_entity, payload))
+            while pending:
+                collect(pending.popleft())
+
+        if errors:
+            with suppress(ExceptionGroup):
+                self.delete_entities(created)
+            error_message = (
+                f"Failed to seed {len(errors)} entities after creating {len(created)}"
+            )
+            raise ExceptionGroup(error_message, errors)
+        return created
+
+    def delete_entities(
+        self, entity_ids: Iterable[str], *, max_workers: int = SEED_CONCURRENCY
+    ) -> list[Response]:
+        """
+        Deletes entities in parallel.
+
+        Every deletion is attempted; failures are raised together as an
+        ``ExceptionGroup`` once all requests have finished.
+
+        Args:
+            entity_ids (Iterable[str]): IDs of the entities to delete.
+            max_workers (int): Maximum number of requests sent concurrently.
+
+        Returns:
+            list[Response]: The delete responses, in ID order.
+        """
+        entity_ids = list(entity_ids)
+        if not entity_ids:
+            return []
+
+        with (
+            allure.step(f"Delete {len(entity_ids)} entities"),
+            background_executor(min(max_workers, len(entity_ids)), "delete") as pool,
+        ):
+            futures = [
+                pool.submit(self.delete_entity, entity_id) for entity_id in entity_ids
+            ]
+            responses, errors = [], []
+            for future in futures:
+                try:
+                    responses.append(future.result())
+                except Exception as e:  # noqa: BLE001
+                    errors.append(e)
+
+        if errors:
+            error_message = (
+                f"Failed to delete {len(errors)} of {len(entity_ids)} entities"
+            )
+            raise ExceptionGroup(error_message, errors)
+        return responses
+
+    @staticmethod
+    def _entity_from_payload(entity_id: str, payload: dict[str, Any]) -> EntityResponse:
+        """Builds an EntityResponse from a request payload and the returned ID."""
+        request = EntityRequest(**payload)
+        addition = (
+            AdditionResponse.model_construct(**request.addition.model_dump())
+            if request.addition
+            else None
+        )
+        return EntityResponse(
+            id=int(entity_id),
+            title=request.title,
+            verified=request.verified,
+            important_numbers=request.important_numbers,
+            addition=addition,
+        )
+
+    def _get_missed(self, entity_ids: Iterable[int]) -> dict[int, EntityResponse]:
+        """Reads entities a getall pass did not show; absent ones are left out."""
+        found = {}
+        for entity_id in entity_ids:
+            try:
+                found[entity_id] = self.get_entity_response(str(entity_id))[1]
+            except HTTPError:
+                continue
+        return found
+
+    @allure.step("Verify created entities")
+    def _verify_created(
+        self, created: list[EntityResponse], payloads: list[dict[str, Any]]
+    ) -> list[EntityResponse]:
+        """
+        Checks created entities against a single streamed getall pass.
+
+        Rows the pass skipped, see ``contains_ids``, are read one by one.
+        """
+        created_ids = {entity.id for entity in created}
+        rows = {}
+        for entity in self.iter_entities():
+            if entity.id in created_ids:
+                rows[entity.id] = entity
+                if len(rows) == len(created_ids):
+                    break
+
+        rows |= self._get_missed(created_ids - rows.keys())
+        missing = [entity.id for entity in created if entity.id not in rows]
+        mismatched = [
+            entity.id
+            for entity, payload in zip(created, payloads, strict=True)
+            if entity.id in rows
+            and rows[entity.id].model_dump(exclude={"id": True, "addition": {"id"}})
+            != EntityRequest(**payload).model_dump()
+        ]
+        if missing or mismatched:
+            error_message = (
+                f"Created entities failed verification: "
+                f"missing={missing}, mismatched={mismatched}"
+            )
+            raise AssertionError(error_message)
+        return [rows[entity.id] for entity in created]
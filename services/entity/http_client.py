@@ -1,44 +1,183 @@
-from typing import Any
+import logging
+from time import perf_counter
+from types import TracebackType
+from typing import Any, Self
+from uuid import uuid4
 
 import requests
 
-from config.config_api.config import TIMEOUT
+from config.config_api.config import KEEP_ALIVE, POOL_CONNECTIONS, POOL_MAXSIZE, TIMEOUT
 from utils.allure_utils import AllureUtils
 
+from .api_endpoints import APIEndpoints
+from .cassette import Cassette
+from .circuit_breaker import CircuitBreaker
+from .retry import IDEMPOTENCY_HEADER, RetryPolicy
+from .timing import (
+    RequestTiming,
+    TimedHTTPAdapter,
+    emit_timing,
+    has_timing_hooks,
+    pop_request_timing,
+    reset_request_timing,
+)
+
 
 class HTTPClient:
-    """HTTP client for making requests to a specified base URL."""
+    """HTTP client for making requests to a specified base URL.
+
+    The client owns a ``requests.Session`` backed by a pooled adapter, so
+    connections (and their TLS sessions) are reused across calls instead of
+    being re-established for every request. The timing of every request is
+    passed to the hooks registered in ``services.entity.timing``. With a
+    cassette, exchanges are recorded to or replayed from disk. With a retry
+    policy, transient failures of idempotent requests are retried in place;
+    if the policy retries POST, creates carry an idempotency key. With a
+    circuit breaker, requests fail fast while the backend is unreachable.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        base_url: str,
+        pool_connections: int = POOL_CONNECTIONS,
+        pool_maxsize: int = POOL_MAXSIZE,
+        *,
+        keep_alive: bool = KEEP_ALIVE,
+        cassette: Cassette | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+    ) -> None:
+        """Initializes the HTTPClient with a base URL and a connection pool.
 
-    def __init__(self, base_url: str) -> None:
-        """Initializes the HTTPClient with a base URL."""
+        Args:
+            base_url (str): The base URL prepended to every endpoint.
+            pool_connections (int): Number of per-host connection pools to cache.
+            pool_maxsize (int): Maximum number of connections kept per host.
+            keep_alive (bool): Whether connections are kept open between requests.
+            cassette (Cassette | None): Records or replays the requests.
+            retry_policy (RetryPolicy | None): Retries transient failures; no
+                request is retried when omitted.
+            circuit_breaker (CircuitBreaker | None): Fails requests fast after
+                consecutive connection failures.
+        """
         self.base_url = base_url
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.session = requests.Session()
+        adapter = TimedHTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=True,
+        )
+        if cassette is not None:
+            adapter = cassette.wrap(adapter)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+    def __enter__(self) -> Self:
+        """Returns the client for use as a context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Closes the client on leaving the context."""
+        self.close()
+
+    def close(self) -> None:
+        """Closes the session and releases all pooled connections."""
+        self.session.close()
+
+    def _request(self, method: str, endpoint: str, **kwargs: Any) -> requests.Response:  # noqa: ANN401
+        """Sends a request with the retry policy and attaches the final response."""
+        if self.retry_policy is None:
+            response = self._send(1, method, endpoint, **kwargs)
+        else:
+            headers = kwargs.setdefault("headers", {})
+            if method == "POST" and self.retry_policy.retry_post:
+                headers.setdefault(IDEMPOTENCY_HEADER, uuid4().hex)
+            response = self.retry_policy.call(
+                lambda attempt: self._send(attempt, method, endpoint, **kwargs),
+                idempotent=self.retry_policy.is_idempotent(method, headers),
+            )
+        try:
+            AllureUtils.attach_response(response)
+        except Exception:
+            # The request succeeded; a broken report must not turn it into
+            # a failure the caller would not clean up after.
+            logging.exception("Could not attach %s %s", method, endpoint)
+        return response
+
+    def _send(
+        self,
+        attempt: int,
+        method: str,
+        endpoint: str,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> requests.Response:
+        """Sends a single attempt of a request through the pooled session."""
+        url = f"{self.base_url}{endpoint}"
+        breaker = self.circuit_breaker
+        if breaker is not None:
+            breaker.before_request()
+        reset_request_timing()
+        start = perf_counter()
+        try:
+            response = self.session.request(method, url, timeout=TIMEOUT, **kwargs)
+        except requests.RequestException as error:
+            if breaker is not None:
+                breaker.record_failure(error)
+            self._emit_timing(method, endpoint, None, perf_counter() - start, attempt)
+            raise
+        if breaker is not None:
+            breaker.record_success()
+        self._emit_timing(method, endpoint, response, perf_counter() - start, attempt)
+        return response
+
+    @staticmethod
+    def _emit_timing(
+        method: str,
+        endpoint: str,
+        response: requests.Response | None,
+        total: float,
+        attempt: int,
+    ) -> None:
+        """Passes the timing of a finished request to the timing hooks, if any."""
+        connect, ttfb = pop_request_timing()
+        if not has_timing_hooks():
+            return
+        emit_timing(
+            RequestTiming(
+                method=method,
+                endpoint=APIEndpoints.tag_for(endpoint),
+                status_code=response.status_code if response is not None else None,
+                connect=connect,
+                ttfb=ttfb,
+                total=total,
+                size=len(response.content) if response is not None else 0,
+                attempt=attempt,
+            )
+        )
 
     def get(
         self, endpoint: str, params: dict[str, Any] | None = None
     ) -> requests.Response:
         """Sends a GET request to the specified endpoint with the provided data."""
-        url = f"{self.base_url}{endpoint}"
-        response = requests.get(url, params=params, timeout=TIMEOUT)
-        AllureUtils.attach_response(response)
-        return response
+        return self._request("GET", endpoint, params=params)
 
     def post(self, endpoint: str, data: dict[str, Any]) -> requests.Response:
         """Sends a POST request to the specified endpoint with the provided data."""
-        url = f"{self.base_url}{endpoint}"
-        response = requests.post(url, json=data, timeout=TIMEOUT)
-        AllureUtils.attach_response(response)
-        return response
+        return self._request("POST", endpoint, json=data)
 
     def patch(self, endpoint: str, data: dict[str, Any]) -> requests.Response:
         """Sends a PATCH request to the specified endpoint with the provided data."""
-        url = f"{self.base_url}{endpoint}"
-        response = requests.patch(url, json=data, timeout=TIMEOUT)
-        AllureUtils.attach_response(response)
-        return response
+        return self._request("PATCH", endpoint, json=data)
 
     def delete(self, endpoint: str) -> requests.Response:
         """Sends a DELETE request to the specified endpoint."""
-        url = f"{self.base_url}{endpoint}"
-        response = requests.delete(url, timeout=TIMEOUT)
-        AllureUtils.attach_response(response)
-        return response
+        return self._request("DELETE", endpoint)
@@ -0,0 +1,70 @@
+from functools import cache
+from typing import TypeVar
+
+from pydantic import TypeAdapter
+from pydantic_core import from_json
+
+from services.entity.models.entity_model import (
+    AdditionResponse,
+    EntityListResponse,
+    EntityResponse,
+)
+
+T = TypeVar("T")
+
+
+@cache
+def _adapter(model: type[T]) -> TypeAdapter[T]:
+    """Build a TypeAdapter once per model and reuse it afterwards."""
+    return TypeAdapter(model)
+
+
+def decode_entity(content: bytes) -> EntityResponse:
+    """
+    Decode a single entity straight from the raw response body.
+
+    Args:
+        content (bytes): The raw JSON body of a get response.
+
+    Returns:
+        EntityResponse: The validated entity.
+    """
+    return _adapter(EntityResponse).validate_json(content)
+
+
+def decode_entities(content: bytes, *, trusted: bool = False) -> list[EntityResponse]:
+    """
+    Decode a getall page straight from the raw response body.
+
+    The default path validates the bytes in one pass through a cached
+    TypeAdapter, without parsing the body with the stdlib json first.
+    The trusted path only parses the JSON and builds the models with
+    ``model_construct``. It is not faster than ``validate_json`` on
+    pydantic 2.9 (see ``benchmarks/bench_decoding.py``), but it does not
+    fail on rows written by other clients of the shared backend, so use it
+    for bulk reads where the rows themselves are not under test.
+
+    Args:
+        content (bytes): The raw JSON body of a getall response.
+        trusted (bool): Skip validation and construct models directly.
+
+    Returns:
+        list[EntityResponse]: The entities on the page.
+    """
+    if trusted:
+        return [_construct_entity(item) for item in from_json(content)["entity"]]
+    return _adapter(EntityListResponse).validate_json(content).entity
+
+
+_ENTITY_FIELDS = frozenset(EntityResponse.model_fields)
+_ADDITION_FIELDS = frozenset(AdditionResponse.model_fields)
+
+
+def _construct_entity(item: dict) -> EntityResponse:
+    """Build an EntityResponse from trusted data without validation."""
+    addition = item.get("addition")
+    if addition:
+        item["addition"] = AdditionResponse.model_construct(
+            _fields_set=_ADDITION_FIELDS, **addition
+        )
+    return EntityResponse.model_construct(_fields_set=_ENTITY_FIELDS, **item)
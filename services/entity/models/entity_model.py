@@ -41,3 +41,9 @@ class EntityResponse(BaseModel):
     addition: AdditionResponse | None = Field(
         None, description="additionalInformationAboutTheEntity"
     )
+
+
+class EntityListResponse(BaseModel):
+    """Model for receiving a page of entities from the getall endpoint."""
+
+    entity: list[EntityResponse] = Field(..., description="entities")
@@ -1,28 +1,64 @@
-from typing import Any
+import random
+from array import array
+from collections.abc import Iterator
+from typing import Any, Self, overload
 
 from faker import Faker
 
+from data.providers import fake, title_words
 from services.entity.models.entity_model import EntityRequest
 
-fake = Faker()
+WORDS = title_words()
+CHUNK_SIZE = 65_536  # rows drawn at a time by PayloadBatch.generate
+WORDS_PER_ROW = 5  # two for the title, three for the additional info
+NUMBERS_PER_ROW = 3
 
 
 class Payloads:
     """A class used to represent Payloads."""
 
     @staticmethod
-    def generate_entity_payload() -> dict[str, Any]:
-        """Generate a dictionary representing an entity payload."""
+    def generate_entity_payload(faker: Faker = fake) -> dict[str, Any]:
+        """
+        Generate a dictionary representing an entity payload.
+
+        Args:
+            faker (Faker): The Faker to draw from; background threads pass
+                their own so they do not consume the stream of the test.
+
+        Returns:
+            dict[str, Any]: The payload.
+        """
         return {
-            "title": fake.sentence(nb_words=2),
-            "verified": fake.boolean(),
-            "important_numbers": [fake.random_int(min=1, max=100) for _ in range(3)],
+            "title": faker.entity_title(),
+            "verified": faker.boolean(),
+            "important_numbers": [faker.random_int(min=1, max=100) for _ in range(3)],
             "addition": {
-                "additional_info": fake.sentence(nb_words=3),
-                "additional_number": fake.random_int(min=1, max=1000),
+                "additional_info": faker.sentence(nb_words=3),
+                "additional_number": faker.random_int(min=1, max=1000),
             },
         }
 
+    @staticmethod
+    def generate_entity_payloads(
+        count: int, seed: int | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Generate entity payloads in bulk.
+
+        The payloads are drawn as a ``PayloadBatch`` and materialized, so
+        the same seed yields the same payloads. The fields follow
+        ``generate_entity_payload``. Keep large datasets as a batch instead.
+
+        Args:
+            count (int): Number of payloads to generate.
+            seed (int | None): Seed of the batch; None draws a random one.
+
+        Returns:
+            list[dict[str, Any]]: The generated payloads.
+        """
+        return PayloadBatch.generate(count, seed).to_payloads()
+
     @classmethod
     def create_entity_request(
         cls, payload: dict[str, Any] | None = None
@@ -38,3 +74,169 @@ class Payloads:
             }
 
         return EntityRequest(**payload)
+
+
+class PayloadRow:
+    """
+    Read-only view of one payload of a PayloadBatch.
+
+    ``to_dict`` and ``to_request`` build the payload from the batch columns
+    when a test needs it.
+    """
+
+    __slots__ = ("_batch", "_index")
+
+    def __init__(self, batch: "PayloadBatch", index: int) -> None:
+        """Initializes the view of the row at ``index``."""
+        self._batch = batch
+        self._index = index
+
+    def to_dict(self) -> dict[str, Any]:
+        """Materialize the row as a payload like ``generate_entity_payload``."""
+        batch, i = self._batch, self._index
+        title, info1, info2, info3, info4 = (
+            WORDS[w] for w in batch.words[i * WORDS_PER_ROW : (i + 1) * WORDS_PER_ROW]
+        )
+        return {
+            "title": f"{title.capitalize()} {info1}.",
+            "verified": bool(batch.verified[i]),
+            "important_numbers": batch.numbers[
+                i * NUMBERS_PER_ROW : (i + 1) * NUMBERS_PER_ROW
+            ].tolist(),
+            "addition": {
+                "additional_info": f"{info2.capitalize()} {info3} {info4}.",
+                "additional_number": batch.additional_numbers[i],
+            },
+        }
+
+    def to_request(self) -> EntityRequest:
+        """Materialize the row as an EntityRequest."""
+        return EntityRequest(**self.to_dict())
+
+    def __repr__(self) -> str:
+        """Show the row as its payload."""
+        return f"PayloadRow({self.to_dict()!r})"
+
+
+class PayloadBatch:
+    """
+    Columnar batch of entity payloads.
+
+    Words are stored as indices into ``WORDS`` and numbers as small machine
+    integers, about 13 bytes per payload instead of a dictionary tree of a
+    few hundred. Rows and slices are views over the same buffers; nothing is
+    built until ``to_dict``, ``to_request`` or ``to_payloads`` is called.
+
+    Attributes:
+        words (memoryview): WORDS_PER_ROW indices into ``WORDS`` per row.
+        verified (memoryview): The verified flag of each row, 0 or 1.
+        numbers (memoryview): NUMBERS_PER_ROW important numbers per row.
+        additional_numbers (memoryview): The additional number of each row.
+    """
+
+    __slots__ = ("additional_numbers", "numbers", "verified", "words")
+
+    def __init__(
+        self,
+        words: memoryview,
+        verified: memoryview,
+        numbers: memoryview,
+        additional_numbers: memoryview,
+    ) -> None:
+        """Initializes the batch from its columns."""
+        self.words = memoryview(words)
+        self.verified = memoryview(verified)
+        self.numbers = memoryview(numbers)
+        self.additional_numbers = memoryview(additional_numbers)
+        rows = len(self.verified)
+        if (
+            len(self.words) != rows * WORDS_PER_ROW
+            or len(self.numbers) != rows * NUMBERS_PER_ROW
+            or len(self.additional_numbers) != rows
+        ):
+            error_message = "The payload columns differ in length"
+            raise ValueError(error_message)
+
+    @classmethod
+    def generate(cls, count: int, seed: int | None = None) -> Self:
+        """
+        Generate a batch of random payloads.
+
+        Values are drawn in chunks of ``CHUNK_SIZE`` from a generator seeded
+        with ``seed``, so the same seed yields the same batch and the
+        temporary lists stay small however large the batch is.
+
+        Args:
+            count (int): Number of payloads to generate.
+            seed (int | None): Seed of the batch; None draws a random one.
+
+        Returns:
+            PayloadBatch: The generated payloads.
+        """
+        rng = random.Random(seed)
+        words, numbers = array("H"), array("B")
+        verified, additional_numbers = array("B"), array("H")
+        for start in range(0, count, CHUNK_SIZE):
+            size = min(CHUNK_SIZE, count - start)
+            words.extend(rng.choices(range(len(WORDS)), k=size * WORDS_PER_ROW))
+            verified.extend(rng.choices((1, 0), k=size))
+            numbers.extend(rng.choices(range(1, 101), k=size * NUMBERS_PER_ROW))
+            additional_numbers.extend(rng.choices(range(1, 1001), k=size))
+        return cls(
+            memoryview(words),
+            memoryview(verified),
+            memoryview(numbers),
+            memoryview(additional_numbers),
+        )
+
+    def __len__(self) -> int:
+        """Number of payloads in the batch."""
+        return len(self.verified)
+
+    @overload
+    def __getitem__(self, key: int) -> PayloadRow: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> "PayloadBatch": ...
+
+    def __getitem__(self, key: int | slice) -> "PayloadRow | PayloadBatch":
+        """Return a row view, or a batch viewing a contiguous slice."""
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                error_message = "Batches only support contiguous slices"
+                raise ValueError(error_message)
+            stop = max(start, stop)
+            return PayloadBatch(
+                self.words[start * WORDS_PER_ROW : stop * WORDS_PER_ROW],
+                self.verified[start:stop],
+                self.numbers[start * NUMBERS_PER_ROW : stop * NUMBERS_PER_ROW],
+                self.additional_numbers[start:stop],
+            )
+        index = range(len(self))[key]
+        return PayloadRow(self, index)
+
+    def __iter__(self) -> Iterator[PayloadRow]:
+        """Iterate over row views."""
+        return (PayloadRow(self, index) for index in range(len(self)))
+
+    def shard(self, index: int, count: int) -> "PayloadBatch":
+        """
+        Return the contiguous part of the batch owned by one of ``count`` shards.
+
+        Args:
+            index (int): The shard, e.g. the number of an xdist worker.
+            count (int): The number of shards.
+
+        Returns:
+            PayloadBatch: A view of about ``len(self) / count`` payloads.
+        """
+        return self[len(self) * index // count : len(self) * (index + 1) // count]
+
+    def to_payloads(self) -> list[dict[str, Any]]:
+        """Materialize every row as a payload dictionary."""
+        return [row.to_dict() for row in self]
+
+    def to_requests(self) -> list[EntityRequest]:
+        """Materialize every row as an EntityRequest."""
+        return [row.to_request() for row in self]
@@ -0,0 +1,160 @@
+"""Retry policy for transient failures of the HTTP layer."""
+
+import itertools
+import logging
+import threading
+from collections.abc import Callable, Mapping
+
+import requests
+from tenacity import (
+    RetryCallState,
+    Retrying,
+    retry_if_exception,
+    retry_if_result,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from config.config_api.config import (
+    RETRY_ATTEMPTS,
+    RETRY_BACKOFF,
+    RETRY_BACKOFF_MAX,
+    RETRY_BUDGET,
+)
+
+from .cassette import CassetteMissError
+from .circuit_breaker import CircuitOpenError
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+RETRY_METHODS = frozenset({"GET", "DELETE"})
+RETRY_STATUSES = frozenset({502, 503, 504})
+
+
+class RetryBudget:
+    """Thread-safe number of retries left for a session."""
+
+    def __init__(self, limit: int) -> None:
+        """Initializes the budget with the number of retries allowed."""
+        self.limit = limit
+        self.spent = 0
+        self._lock = threading.Lock()
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget; return False if none is left."""
+        with self._lock:
+            if self.spent >= self.limit:
+                return False
+            self.spent += 1
+            return True
+
+
+class RetryPolicy:
+    """
+    Retries idempotent requests on transient failures.
+
+    GET and DELETE are retried on connection errors, timeouts and 502/503/504
+    answers. POST is not retried: a create that timed out or got a 502 may
+    still have succeeded, and a backend that ignores ``Idempotency-Key``
+    would create the entity twice. Only with ``retry_post``, for backends
+    known to deduplicate creates by that header, is a POST carrying it
+    retried. Waits grow exponentially with
+    full jitter. All clients sharing a policy draw from one retry budget, so
+    an outage fails fast instead of multiplying every request.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = RETRY_ATTEMPTS,
+        backoff: float = RETRY_BACKOFF,
+        backoff_max: float = RETRY_BACKOFF_MAX,
+        budget: int = RETRY_BUDGET,
+        *,
+        retry_post: bool = False,
+    ) -> None:
+        """Initializes the policy.
+
+        Args:
+            max_attempts (int): Attempts per request, including the first one.
+            backoff (float): Upper bound in seconds of the first wait.
+            backoff_max (float): Upper bound in seconds of any wait.
+            budget (int): Retries allowed over the lifetime of the policy.
+            retry_post (bool): Retry POST requests carrying an
+                ``Idempotency-Key``; only for backends that honour it.
+        """
+        self.retry_post = retry_post
+        self.budget = RetryBudget(budget)
+        self._retrying = Retrying(
+            stop=stop_after_attempt(max_attempts) | self._out_of_budget,
+            wait=wait_random_exponential(multiplier=backoff, max=backoff_max),
+            retry=retry_if_exception(_is_transient_error)
+            | retry_if_result(_is_transient_response),
+            before_sleep=_log_retry,
+            retry_error_callback=lambda state: state.outcome.result(),
+        )
+
+    def is_idempotent(self, method: str, headers: Mapping[str, str]) -> bool:
+        """Return True if a request may be sent more than once."""
+        return method in RETRY_METHODS or (
+            self.retry_post and method == "POST" and IDEMPOTENCY_HEADER in headers
+        )
+
+    def call(
+        self, send: Callable[[int], requests.Response], *, idempotent: bool
+    ) -> requests.Response:
+        """
+        Send a request, retrying it if it is idempotent.
+
+        Args:
+            send (Callable[[int], requests.Response]): Sends one attempt; gets
+                the attempt number, starting at 1.
+            idempotent (bool): Whether the request may be retried.
+
+        Returns:
+            requests.Response: The response of the last attempt.
+        """
+        if not idempotent:
+            return send(1)
+        attempts = itertools.count(1)
+        return self._retrying(lambda: send(next(attempts)))
+
+    def _out_of_budget(self, retry_state: RetryCallState) -> bool:
+        """Stop retrying once the session budget is spent."""
+        if self.budget.try_spend():
+            return False
+        logging.warning(
+            "Retry budget of %d exhausted, not retrying %s",
+            self.budget.limit,
+            _describe(retry_state),
+        )
+        return True
+
+
+def _is_transient_error(exception: BaseException) -> bool:
+    """Return True for errors worth another attempt."""
+    return isinstance(
+        exception, requests.ConnectionError | requests.Timeout
+    ) and not isinstance(exception, CassetteMissError | CircuitOpenError)
+
+
+def _is_transient_response(response: requests.Response) -> bool:
+    """Return True for responses worth another attempt."""
+    return response.status_code in RETRY_STATUSES
+
+
+def _describe(retry_state: RetryCallState) -> str:
+    """Describe the outcome of the last attempt for the log."""
+    outcome = retry_state.outcome
+    if outcome.failed:
+        return repr(outcome.exception())
+    response = outcome.result()
+    return f"{response.request.method} {response.url} -> {response.status_code}"
+
+
+def _log_retry(retry_state: RetryCallState) -> None:
+    """Log an attempt that is about to be retried."""
+    logging.info(
+        "Retrying after attempt %d (%s) in %.3f s",
+        retry_state.attempt_number,
+        _describe(retry_state),
+        retry_state.next_action.sleep,
+    )
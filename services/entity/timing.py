@@ -0,0 +1,185 @@
+"""Per-request timing for the HTTP layer."""
+
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from time import perf_counter
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+@dataclass(frozen=True, slots=True)
+class RequestTiming:
+    """
+    Timing of a single HTTP request.
+
+    Attributes:
+        method (str): The HTTP method.
+        endpoint (str): The APIEndpoints value the request was sent to.
+        status_code (int | None): The response status, None if no response.
+        connect (float): Seconds spent on DNS lookup and the TCP/TLS handshake;
+            0 when a pooled connection was reused.
+        ttfb (float): Seconds from the request being sent on its connection to
+            its response headers being parsed; neither the connect time nor
+            the wait for a pooled connection is included.
+        total (float): Seconds until the whole body was read.
+        size (int): Response body size in bytes.
+        attempt (int): 1 for the first attempt, higher for retries.
+    """
+
+    method: str
+    endpoint: str
+    status_code: int | None
+    connect: float
+    ttfb: float
+    total: float
+    size: int
+    attempt: int = 1
+
+
+TimingHook = Callable[[RequestTiming], None]
+
+_hooks: list[TimingHook] = []
+_request_timing = threading.local()
+
+
+def add_timing_hook(hook: TimingHook) -> None:
+    """Register a callable to receive the timing of every request."""
+    _hooks.append(hook)
+
+
+def remove_timing_hook(hook: TimingHook) -> None:
+    """Unregister a callable added with add_timing_hook."""
+    _hooks.remove(hook)
+
+
+def has_timing_hooks() -> bool:
+    """Return True if any timing hook is registered."""
+    return bool(_hooks)
+
+
+def emit_timing(timing: RequestTiming) -> None:
+    """Pass a request timing to every registered hook."""
+    for hook in _hooks:
+        hook(timing)
+
+
+def reset_request_timing() -> None:
+    """Reset the connect time and TTFB measured on the current thread."""
+    _request_timing.connect = 0.0
+    _request_timing.sent = None
+    _request_timing.ttfb = 0.0
+
+
+def pop_request_timing() -> tuple[float, float]:
+    """Return and reset the connect time and TTFB measured on the current thread."""
+    timing = (
+        getattr(_request_timing, "connect", 0.0),
+        getattr(_request_timing, "ttfb", 0.0),
+    )
+    reset_request_timing()
+    return timing
+
+
+class _TimedConnectionMixin:
+    """Records the connect time and TTFB of the requests of this thread."""
+
+    def connect(self) -> None:
+        start = perf_counter()
+        try:
+            super().connect()
+        finally:
+            _request_timing.connect = (
+                getattr(_request_timing, "connect", 0.0) + perf_counter() - start
+            )
+
+    def request(self, *args: object, **kwargs: object) -> None:
+        super().request(*args, **kwargs)
+        _request_timing.sent = perf_counter()
+
+    def getresponse(self) -> object:
+        response = super().getresponse()
+        sent = getattr(_request_timing, "sent", None)
+        if sent is not None:
+            _request_timing.ttfb = perf_counter() - sent
+        return response
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections record their connect time and TTFB."""
+
+    def init_poolmanager(self, *args: object, **kwargs: object) -> None:
+        """Initializes the pool manager with timed connection pools."""
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Return the nearest-rank percentile ``q`` (0-100) of sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(q / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(timings: Iterable[RequestTiming]) -> dict[str, dict]:
+    """
+    Aggregate timings into per-endpoint percentiles.
+
+    Args:
+        timings (Iterable[RequestTiming]): The timings to aggregate.
+
+    Returns:
+        dict: Statistics keyed by ``"<METHOD> <endpoint>"``, with times in
+        milliseconds.
+    """
+    groups: dict[str, list[RequestTiming]] = {}
+    for timing in timings:
+        groups.setdefault(f"{timing.method} {timing.endpoint}", []).append(timing)
+
+    def stats(values: list[float]) -> dict[str, float]:
+        values = sorted(value * 1000 for value in values)
+        return {
+            "p50": round(percentile(values, 50), 3),
+            "p95": round(percentile(values, 95), 3),
+            "p99": round(percentile(values, 99), 3),
+            "max": round(values[-1], 3),
+            "mean": round(sum(values) / len(values), 3),
+        }
+
+    return {
+        key: {
+            "count": len(group),
+            "errors": sum(
+                1 for t in group if t.status_code is None or t.status_code >= 500
+            ),
+            "retries": sum(1 for t in group if t.attempt > 1),
+            "new_connections": sum(1 for t in group if t.connect > 0),
+            "bytes": sum(t.size for t in group),
+            "total_ms": stats([t.total for t in group]),
+            "ttfb_ms": stats([t.ttfb for t in group]),
+            "connect_ms": stats([t.connect for t in group]),
+        }
+        for key, group in sorted(groups.items())
+    }
@@ -0,0 +1 @@
+"""Command line entry point: ``python -m testnest <command>``."""
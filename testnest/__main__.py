@@ -0,0 +1,5 @@
+import sys
+
+from testnest.cli import main
+
+sys.exit(main())
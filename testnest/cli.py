@@ -0,0 +1,163 @@
+import argparse
+import json
+import logging
+import threading
+import time
+from contextlib import suppress
+from pathlib import Path
+
+from config.config_api.config import BASE_URL, SEED_CONCURRENCY
+from data.datasets import iter_payloads, save_dataset
+from data.generators import generate_customer_batch
+from load.runner import Engine, LoadConfig, LoadRunner, format_report
+from load.scenarios import DEFAULT_MIX
+from services.entity.api_client import APIClient
+from services.entity.entity_service import EntityService
+from services.entity.http_client import HTTPClient
+from services.entity.payloads import PayloadBatch
+from utils.api.entity_server import EntityServer
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the parser for all testnest commands."""
+    parser = argparse.ArgumentParser(prog="testnest")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    load = commands.add_parser(
+        "load", help="Run the entity CRUD scenarios as a load test."
+    )
+    load.add_argument("--base-url", default=BASE_URL, help="Entity service URL.")
+    load.add_argument(
+        "--mix", default=DEFAULT_MIX, help="Weighted operations, e.g. create=2,get=5."
+    )
+    load.add_argument(
+        "--duration", type=float, default=30.0, help="Run time in seconds."
+    )
+    load.add_argument(
+        "--users",
+        type=int,
+        default=10,
+        help="Virtual users (closed loop) or concurrency cap (open loop).",
+    )
+    load.add_argument(
+        "--rps", type=float, default=None, help="Target rate; enables open loop."
+    )
+    load.add_argument(
+        "--engine", type=Engine, choices=list(Engine), default=Engine.THREADS
+    )
+    load.add_argument("--report", type=Path, help="Write the summary as JSON.")
+    load.add_argument(
+        "--dataset", type=Path, help="Take the created entities from this dataset."
+    )
+    load.set_defaults(handler=run_load)
+
+    serve = commands.add_parser(
+        "serve", help="Serve the Entity API from an in-memory local server."
+    )
+    serve.add_argument("--host", default="127.0.0.1", help="Interface to listen on.")
+    serve.add_argument("--port", type=int, default=8000, help="Port to listen on.")
+    serve.add_argument(
+        "--latency", type=float, default=0.0, help="Seconds added to every response."
+    )
+    serve.add_argument(
+        "--error-rate", type=float, default=0.0, help="Share of requests failing."
+    )
+    serve.set_defaults(handler=run_serve)
+
+    dataset = commands.add_parser(
+        "dataset", help="Generate a seeded dataset file once for later runs."
+    )
+    dataset.add_argument("kind", choices=("payloads", "customers"))
+    dataset.add_argument("output", type=Path, help="NDJSON if it ends in .ndjson.")
+    dataset.add_argument("--count", type=int, default=100_000, help="Records.")
+    dataset.add_argument("--seed", type=int, default=0, help="Seed of the dataset.")
+    dataset.set_defaults(handler=run_dataset)
+
+    seed = commands.add_parser(
+        "seed", help="Create the entities of a payload dataset through /api/create."
+    )
+    seed.add_argument("dataset", type=Path, help="NDJSON or columnar payloads.")
+    seed.add_argument("--base-url", default=BASE_URL, help="Entity service URL.")
+    seed.add_argument(
+        "--concurrency",
+        type=int,
+        default=SEED_CONCURRENCY,
+        help="Requests in flight.",
+    )
+    seed.add_argument(
+        "--ids", type=Path, help="Write the created IDs, one per line, for cleanup."
+    )
+    seed.set_defaults(handler=run_seed)
+    return parser
+
+
+def run_load(args: argparse.Namespace) -> int:
+    """Run the load command."""
+    config = LoadConfig(
+        base_url=args.base_url,
+        mix=args.mix,
+        duration=args.duration,
+        users=args.users,
+        rps=args.rps,
+        engine=args.engine,
+        dataset=args.dataset,
+    )
+    report = LoadRunner(config).run()
+    print(format_report(report))  # noqa: T201
+    if args.report:
+        args.report.write_text(json.dumps(report.to_dict(), indent=2), encoding="utf-8")
+    return 1 if report.leaked else 0
+
+
+def run_serve(args: argparse.Namespace) -> int:
+    """Run the serve command until interrupted."""
+    server = EntityServer(
+        host=args.host, port=args.port, latency=args.latency, error_rate=args.error_rate
+    )
+    logging.info("Serving the Entity API on %s", server.url)
+    with server, suppress(KeyboardInterrupt):
+        threading.Event().wait()
+    return 0
+
+
+def run_dataset(args: argparse.Namespace) -> int:
+    """Run the dataset command."""
+    if args.kind == "customers":
+        batch = generate_customer_batch(args.count, args.seed)
+    else:
+        batch = PayloadBatch.generate(args.count, args.seed)
+    save_dataset(args.output, batch)
+    logging.info("Wrote %d %s to %s", len(batch), args.kind, args.output)
+    return 0
+
+
+def run_seed(args: argparse.Namespace) -> int:
+    """Run the seed command."""
+    with HTTPClient(args.base_url, pool_maxsize=args.concurrency) as http:
+        service = EntityService(APIClient(args.base_url, http))
+        start = time.perf_counter()
+        ids = service.seed_entities(
+            iter_payloads(args.dataset), max_workers=args.concurrency
+        )
+        duration = time.perf_counter() - start
+    logging.info(
+        "Seeded %d entities in %.1f s (%.0f/s)",
+        len(ids),
+        duration,
+        len(ids) / duration if duration else 0,
+    )
+    if args.ids:
+        args.ids.write_text("".join(f"{i}\n" for i in ids), encoding="utf-8")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parse the command line and run the selected command."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    logging.getLogger("faker").setLevel(logging.WARNING)
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
@@ -1,51 +1,293 @@
 import logging
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
 
 import pytest
+from _pytest.reports import TestReport
 
 from config.config_api.config import BASE_URL
+from data.datasets import iter_payloads
+from data.seeding import DataSeeder
 from services.entity.api_client import APIClient
+from services.entity.async_api_client import AsyncAPIClient
+from services.entity.async_entity_service import AsyncEntityService
+from services.entity.async_http_client import AsyncHTTPClient
+from services.entity.cassette import Cassette, CassetteMode
+from services.entity.circuit_breaker import CircuitBreaker
+from services.entity.cleanup import CleanupRegistry
+from services.entity.entity_cache import EntityCache
+from services.entity.entity_pool import EntityPool
 from services.entity.entity_service import EntityService
+from services.entity.http_client import HTTPClient
 from services.entity.models.entity_model import EntityResponse
+from services.entity.retry import RetryPolicy
+from utils.allure_utils import AllureUtils
+from utils.api.entity_server import EntityServer
 
 
-@pytest.fixture
-def api_client() -> APIClient:
-    """Fixture to create and return an APIClient instance."""
-    return APIClient(BASE_URL)
+@pytest.fixture(scope="session")
+def api_base_url(request: pytest.FixtureRequest) -> str:
+    """
+    Fixture to provide the base URL of the Entity API under test.
+
+    With ``--api-backend=local`` an in-memory server is started on a random
+    port for the session; every xdist worker gets its own.
+    """
+    config = request.config
+    if config.getoption("api_backend") != "local":
+        yield BASE_URL
+        return
+    with EntityServer(
+        latency=config.getoption("local_api_latency"),
+        error_rate=config.getoption("local_api_error_rate"),
+    ) as server:
+        yield server.url
+
+
+@pytest.fixture(scope="session")
+def cassette(request: pytest.FixtureRequest) -> Cassette:
+    """
+    Fixture to provide the cassette recording or replaying the API exchanges.
+
+    Every xdist worker records to its own tape named after the worker.
+    """
+    worker = getattr(request.config, "workerinput", {}).get("workerid", "main")
+    tapes = Cassette(
+        request.config.getoption("cassette_dir"),
+        request.config.getoption("cassette_mode"),
+        name=worker,
+    )
+    yield tapes
+    tapes.close()
+
+
+@pytest.fixture(autouse=True)
+def cassette_scope(request: pytest.FixtureRequest) -> None:
+    """Match the recorded API exchanges per test."""
+    if request.config.getoption("cassette_mode") is not CassetteMode.PASSTHROUGH:
+        request.getfixturevalue("cassette").start_scope(request.node.nodeid)
+
+
+@pytest.fixture(scope="session")
+def retry_policy(request: pytest.FixtureRequest) -> RetryPolicy:
+    """
+    Fixture to provide the retry policy, and its budget, of the session.
+
+    Creates are only retried against the local server, which deduplicates
+    them by ``Idempotency-Key``; the remote backend may not.
+    """
+    return RetryPolicy(retry_post=request.config.getoption("api_backend") == "local")
+
+
+@pytest.fixture(scope="session")
+def circuit_breaker(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> CircuitBreaker:
+    """
+    Fixture to provide the circuit breaker guarding the API.
+
+    Under pytest-xdist the workers share its state through a file in the
+    temporary directory of the run, so a dead backend trips all of them.
+    """
+    state_path = None
+    if hasattr(request.config, "workerinput"):
+        state_path = tmp_path_factory.getbasetemp().parent / "circuit-breaker.json"
+    return CircuitBreaker(state_path=state_path)
+
+
+@pytest.fixture(scope="session")
+def http_client(
+    api_base_url: str,
+    cassette: Cassette,
+    retry_policy: RetryPolicy,
+    circuit_breaker: CircuitBreaker,
+) -> HTTPClient:
+    """
+    Fixture to provide one pooled HTTPClient per session.
+
+    Under pytest-xdist every worker runs its own session, so each worker
+    keeps a single pool of warm connections for all of its tests.
+    """
+    with HTTPClient(
+        api_base_url,
+        cassette=cassette,
+        retry_policy=retry_policy,
+        circuit_breaker=circuit_breaker,
+    ) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def api_client(api_base_url: str, http_client: HTTPClient) -> APIClient:
+    """Fixture to create and return an APIClient sharing the pooled HTTPClient."""
+    return APIClient(api_base_url, http_client)
+
+
+@pytest.fixture(scope="session")
+def async_api_client(api_base_url: str, http_client: HTTPClient) -> AsyncAPIClient:
+    """Fixture to provide an AsyncAPIClient on top of the pooled HTTPClient."""
+    client = AsyncAPIClient(api_base_url, AsyncHTTPClient(api_base_url, http_client))
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def entity_cache(request: pytest.FixtureRequest) -> EntityCache | None:
+    """Fixture to provide the session entity cache, if enabled by --entity-cache."""
+    if not request.config.getoption("entity_cache"):
+        yield None
+        return
+    cache = EntityCache()
+    yield cache
+    logging.info("Entity cache: %s", cache.stats())
+
+
+@pytest.fixture(scope="session")
+def cleanup_registry(
+    request: pytest.FixtureRequest,
+    api_client: APIClient,
+    entity_cache: EntityCache | None,
+) -> CleanupRegistry:
+    """
+    Fixture to provide the deferred cleanup of the entities of the session.
+
+    At session end it deletes every entity still registered and writes the
+    leak report, suffixed with the worker ID under pytest-xdist.
+    """
+    registry = CleanupRegistry(api_client, cache=entity_cache)
+    yield registry
+    report_path = Path(request.config.getoption("leak_report"))
+    worker = getattr(request.config, "workerinput", {}).get("workerid")
+    if worker:
+        report_path = report_path.with_stem(f"{report_path.stem}-{worker}")
+    registry.close(report_path)
 
 
 @pytest.fixture
-def entity_service(api_client: APIClient) -> EntityService:
+def entity_service(
+    api_client: APIClient,
+    entity_cache: EntityCache | None,
+    cleanup_registry: CleanupRegistry,
+) -> EntityService:
     """Fixture for creating an EntityService instance."""
-    return EntityService(api_client)
+    return EntityService(api_client, cache=entity_cache, cleanup=cleanup_registry)
+
+
+@pytest.fixture
+def async_entity_service(
+    async_api_client: AsyncAPIClient, cleanup_registry: CleanupRegistry
+) -> AsyncEntityService:
+    """Fixture for creating an AsyncEntityService instance."""
+    return AsyncEntityService(async_api_client, cleanup=cleanup_registry)
 
 
 @pytest.fixture
-def new_entity(entity_service: EntityService) -> EntityResponse:
-    """Fixture to create a new entity, return its data, deleting it after the test."""
+def new_entity(
+    entity_service: EntityService, cleanup_registry: CleanupRegistry
+) -> EntityResponse:
+    """Fixture to create a new entity, deleting it in the background after the test."""
     _, entity = entity_service.create_entity()
     yield entity
-    try:
-        entity_service.delete_entity(str(entity.id))
-    except Exception as e:
-        error_message = f"Failed to delete entity {entity.id}: {e!s}"
-        logging.exception(error_message)
+    cleanup_registry.schedule([str(entity.id)])
+
+
+@pytest.fixture(scope="session")
+def payload_dataset(
+    request: pytest.FixtureRequest,
+) -> Iterator[dict[str, Any]] | None:
+    """
+    Fixture to stream the payloads of the --payload-dataset file, if given.
+
+    The file is generated once with ``testnest dataset`` and memory-mapped
+    by every pytest-xdist worker, each reading its own shard.
+    """
+    path = request.config.getoption("payload_dataset")
+    if path is None:
+        return None
+    workerinput = getattr(request.config, "workerinput", {})
+    shard = int(workerinput.get("workerid", "gw0").removeprefix("gw"))
+    return iter_payloads(Path(path), shard, workerinput.get("workercount", 1))
+
+
+@pytest.fixture(scope="session")
+def entity_pool(  # noqa: PLR0913
+    api_client: APIClient,
+    cassette: Cassette,
+    entity_cache: EntityCache | None,
+    cleanup_registry: CleanupRegistry,
+    payload_dataset: Iterator[dict[str, Any]] | None,
+    data_seeder: DataSeeder,
+) -> EntityPool:
+    """
+    Fixture to provide the pool of entities shared by the tests of the session.
+
+    Under pytest-xdist every worker keeps its own pool. Its random payloads
+    come from a Faker of their own, so entities created on demand leave the
+    seeded data of the tests alone.
+    """
+    service = EntityService(api_client, cache=entity_cache, cleanup=cleanup_registry)
+    pool = EntityPool(
+        service,
+        payloads=payload_dataset,
+        faker=data_seeder.background_faker("entity-pool"),
+        cassette=cassette,
+    )
+    yield pool
+    pool.close()
 
 
 @pytest.fixture
-def upload_three_entities(entity_service: EntityService) -> list[EntityResponse]:
-    """Fixture to create 3 new entities, return data, deleting them after the test."""
-    entities = []
-    for _ in range(3):
-        _, entity = entity_service.create_entity()
-        entities.append(entity)
-    yield entities
-    for entity in entities:
-        try:
-            entity_service.delete_entity(str(entity.id))
-        except Exception as e:
-            error_message = f"Failed to delete entity {entity.id}: {e!s}"
-            logging.exception(error_message)
+def pooled_entity(
+    request: pytest.FixtureRequest, entity_pool: EntityPool
+) -> EntityResponse:
+    """
+    Fixture to lease one entity from the session pool.
+
+    The entity is shared with other read-only tests; tests marked
+    ``mutating`` get an entity of their own that is deleted afterwards.
+    """
+    mutating = request.node.get_closest_marker("mutating") is not None
+    with entity_pool.lease(mutating=mutating) as entities:
+        yield entities[0]
+
+
+@pytest.fixture
+def pooled_entities(
+    request: pytest.FixtureRequest, entity_pool: EntityPool
+) -> list[EntityResponse]:
+    """Fixture to lease three entities from the session pool."""
+    mutating = request.node.get_closest_marker("mutating") is not None
+    with entity_pool.lease(3, mutating=mutating) as entities:
+        yield entities
+
+
+@pytest.fixture(autouse=True)
+def flush_allure_attachments(request: pytest.FixtureRequest) -> None:
+    """Attach the API responses held back by the on_failure policy if needed."""
+    yield
+    item = request.node
+    failed = any(
+        getattr(item, f"rep_{when}", None) and getattr(item, f"rep_{when}").failed
+        for when in ("setup", "call")
+    )
+    AllureUtils.flush_pending(failed=failed)
+
+
+@pytest.hookimpl(tryfirst=True, hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item) -> TestReport:
+    """
+    Hook to store the report of each test phase on the test item.
+
+    Args:
+        item (pytest.Item): The test item that was run.
+
+    Returns:
+        TestReport: The test report for the test item.
+    """
+    outcome = yield
+    rep = outcome.get_result()
+    setattr(item, "rep_" + rep.when, rep)
 
 
 def pytest_configure() -> None:
@@ -1,11 +1,19 @@
+import asyncio
+
 import allure
 import pytest
 from requests import HTTPError
 
+from config.config_api.config import PAGE_SIZE
+from services.entity.api_client import APIClient
+from services.entity.async_entity_service import AsyncEntityService
+from services.entity.entity_cache import EntityCache
+from services.entity.entity_pool import EntityPool
 from services.entity.entity_service import EntityService
 from services.entity.models.entity_model import EntityResponse
 from services.entity.models.validators import validate_entity
 from services.entity.payloads import Payloads
+from utils.async_utils import gather_bounded
 
 
 @allure.epic("Entity Management")
@@ -26,7 +34,9 @@ class TestEntityAPI:
                 new_entity.id, int
             ), f"Expected a numeric ID, got: {new_entity.id}"
 
-            response, fetched_entity = entity_service.get_entity(str(new_entity.id))
+            response, fetched_entity = entity_service.get_entity_response(
+                str(new_entity.id)
+            )
             assert (
                 response.status_code == 200
             ), f"Error while retrieving entity: {response.status_code}, {response.text}"
@@ -37,37 +47,70 @@ class TestEntityAPI:
     @allure.description("Verify that a specific entity can be retrieved")
     @pytest.mark.api
     def test_get_entity(
-        self, entity_service: EntityService, new_entity: EntityResponse
+        self, entity_service: EntityService, pooled_entity: EntityResponse
     ) -> None:
         """Test that verifies a specific entity can be retrieved."""
-        with allure.step(f"Retrieving the created entity with ID {new_entity.id}"):
-            response, retrieved_entity = entity_service.get_entity(str(new_entity.id))
+        with allure.step(f"Retrieving the pooled entity with ID {pooled_entity.id}"):
+            response, retrieved_entity = entity_service.get_entity_response(
+                str(pooled_entity.id)
+            )
             assert (
                 response.status_code == 200
             ), f"Error while retrieving entity: {response.status_code}, {response.text}"
 
-        validate_entity(retrieved_entity, new_entity)
+        validate_entity(retrieved_entity, pooled_entity)
+
+    @allure.title("Test get entity from the cache")
+    @allure.description(
+        "Verify that cached reads return the entity the server holds, filled "
+        "by a getall page or by a read from the server"
+    )
+    @pytest.mark.api
+    def test_get_entity_from_cache(
+        self, api_client: APIClient, pooled_entity: EntityResponse
+    ) -> None:
+        """Tests that the entity cache serves reads filled by getall and get."""
+        cache = EntityCache()
+        entity_service = EntityService(api_client, cache=cache)
+        entity_id = str(pooled_entity.id)
+
+        with allure.step("Filling the cache from the getall pages"):
+            assert entity_service.contains_ids(
+                [pooled_entity.id]
+            ), f"Pooled entity {entity_id} not found among all entities"
+
+        with allure.step("Reading the entity filled by a getall page"):
+            cached_entity = entity_service.get_entity(entity_id)
+            assert cache.stats()["hits"] == 1, f"Expected a hit: {cache.stats()}"
+            validate_entity(cached_entity, pooled_entity)
+
+        with allure.step("Reading the entity filled by a read from the server"):
+            _, fresh_entity = entity_service.get_entity_response(entity_id)
+            cached_entity = entity_service.get_entity(entity_id)
+            assert cached_entity is fresh_entity, "Cached read lost the fresh entity"
+            assert cache.stats()["hits"] == 2, f"Expected a hit: {cache.stats()}"
 
     @allure.title("Test get all entities")
     @allure.description("Verify that all entities can be retrieved")
     @pytest.mark.api
     def test_get_all_entities(
-        self, entity_service: EntityService, upload_three_entities: list[EntityResponse]
+        self, entity_service: EntityService, pooled_entities: list[EntityResponse]
     ) -> None:
         """Test that verifies all entities can be retrieved."""
-        with allure.step("Retrieving all entities"):
-            response, entities = entity_service.get_all_entities()
+        with allure.step("Retrieving the first page of entities"):
+            response, entities = entity_service.get_all_entities(
+                page=1, per_page=PAGE_SIZE
+            )
             assert response.status_code == 200, (
                 f"Error while retrieving entities: {response.status_code}, "
                 f"{response.text}"
             )
 
         with allure.step("Checking that created entities are in the response"):
-            retrieved_ids = [entity.id for entity in entities]
-            for created_entity in upload_three_entities:
-                assert (
-                    created_entity.id in retrieved_ids
-                ), f"Created entity {created_entity.id} not found in response"
+            created_ids = [entity.id for entity in pooled_entities]
+            assert entity_service.contains_ids(
+                created_ids
+            ), f"Created entities {created_ids} not found in response"
 
         with allure.step("Checking the types of the retrieved objects"):
             assert all(
@@ -81,22 +124,25 @@ class TestEntityAPI:
     @allure.severity(allure.severity_level.CRITICAL)
     @allure.description("Verify that an entity can be updated successfully")
     @pytest.mark.api
+    @pytest.mark.mutating
     def test_update_entity(
-        self, entity_service: EntityService, new_entity: EntityResponse
+        self, entity_service: EntityService, pooled_entity: EntityResponse
     ) -> None:
         """Tests that an entity can be updated."""
         updated_entity_request = Payloads.create_entity_request()
 
-        with allure.step(f"Updating entity with ID {new_entity.id}"):
+        with allure.step(f"Updating entity with ID {pooled_entity.id}"):
             response = entity_service.api_client.update_entity(
-                str(new_entity.id), updated_entity_request.model_dump()
+                str(pooled_entity.id), updated_entity_request.model_dump()
             )
             assert (
                 response.status_code == 204
             ), f"Expected status 204, got: {response.status_code}"
 
         with allure.step("Retrieving the updated entity"):
-            response, updated_entity = entity_service.get_entity(str(new_entity.id))
+            response, updated_entity = entity_service.get_entity_response(
+                str(pooled_entity.id)
+            )
             assert response.status_code == 200, (
                 f"Error while retrieving updated entity: "
                 f"{response.status_code}, {response.text}"
@@ -104,28 +150,32 @@ class TestEntityAPI:
 
         validate_entity(updated_entity, updated_entity_request)
         assert (
-            updated_entity.id == new_entity.id
-        ), f"ID mismatch: expected {new_entity.id}, got {updated_entity.id}"
+            updated_entity.id == pooled_entity.id
+        ), f"ID mismatch: expected {pooled_entity.id}, got {updated_entity.id}"
 
     @allure.title("Test delete entity")
     @allure.description("Verify that an entity can be deleted successfully")
     @pytest.mark.api
+    @pytest.mark.mutating
     def test_delete_entity(
-        self, entity_service: EntityService, new_entity: EntityResponse
+        self,
+        entity_service: EntityService,
+        entity_pool: EntityPool,
+        pooled_entity: EntityResponse,
     ) -> None:
         """Tests that an entity can be deleted successfully."""
-        with allure.step(f"Deleting the entity with ID {new_entity.id}"):
-            delete_response = entity_service.delete_entity(str(new_entity.id))
+        with allure.step(f"Deleting the entity with ID {pooled_entity.id}"):
+            delete_response = entity_service.delete_entity(str(pooled_entity.id))
             assert delete_response.status_code == 204, (
                 f"Error while deleting entity: {delete_response.status_code}, "
                 f"{delete_response.text}"
             )
 
         with allure.step(
-            f"Attempting to retrieve the deleted entity with ID {new_entity.id}"
+            f"Attempting to retrieve the deleted entity with ID {pooled_entity.id}"
         ):
             with pytest.raises(HTTPError) as excinfo:
-                entity_service.get_entity(str(new_entity.id))
+                entity_service.get_entity(str(pooled_entity.id))
 
             assert excinfo.value.response.status_code == 500, (
                 f"Expected status 500, but got: "
@@ -135,13 +185,95 @@ class TestEntityAPI:
         with allure.step(
             "Retrieving all entities and ensuring the deleted entity is not present"
         ):
-            all_response, all_entities = entity_service.get_all_entities()
-            assert (
-                all_response.status_code == 200
-            ), f"Error while retrieving all entities: {all_response.status_code}"
-
-            entity_ids = [entity.id for entity in all_entities]
-            assert new_entity.id not in entity_ids, (
-                f"Deleted entity with ID {new_entity.id} "
+            with entity_pool.lease() as (survivor,):
+                assert entity_service.contains_ids([survivor.id]), (
+                    f"Surviving entity with ID {survivor.id} "
+                    f"is missing among all entities"
+                )
+            assert not entity_service.contains_ids([pooled_entity.id]), (
+                f"Deleted entity with ID {pooled_entity.id} "
                 f"is still present among all entities"
             )
+
+    @allure.title("Test bulk create and delete entities")
+    @allure.description(
+        "Verify that entities created in bulk are all present and can be deleted"
+    )
+    @pytest.mark.api
+    def test_bulk_create_and_delete_entities(
+        self, entity_service: EntityService
+    ) -> None:
+        """Tests that entities can be created and deleted in bulk."""
+        payloads = [Payloads.generate_entity_payload() for _ in range(5)]
+
+        with allure.step("Creating entities in bulk and verifying them"):
+            entities = entity_service.create_entities(payloads, verify=True)
+            assert len(entities) == len(
+                payloads
+            ), f"Expected {len(payloads)} entities, got {len(entities)}"
+            for entity, payload in zip(entities, payloads, strict=True):
+                validate_entity(entity, payload)
+
+        with allure.step("Deleting the created entities in bulk"):
+            responses = entity_service.delete_entities(
+                [str(entity.id) for entity in entities]
+            )
+            assert all(
+                response.status_code == 204 for response in responses
+            ), "Not all entities were deleted"
+
+        with allure.step("Ensuring the deleted entities are no longer present"):
+            deleted_ids = {entity.id for entity in entities}
+            leaked = [
+                entity.id
+                for entity in entity_service.iter_entities()
+                if entity.id in deleted_ids
+            ]
+            assert not leaked, f"Deleted entities are still present: {leaked}"
+
+    @allure.title("Test bulk create and delete entities asynchronously")
+    @allure.description(
+        "Verify that entities created concurrently by the async service "
+        "are all present and can be deleted"
+    )
+    @pytest.mark.api
+    def test_async_bulk_create_and_delete_entities(
+        self, async_entity_service: AsyncEntityService
+    ) -> None:
+        """Tests that entities can be created and deleted through asyncio."""
+        payloads = [Payloads.generate_entity_payload() for _ in range(5)]
+
+        with allure.step("Creating entities concurrently"):
+            entities = asyncio.run(async_entity_service.create_entities(payloads))
+            assert len(entities) == len(
+                payloads
+            ), f"Expected {len(payloads)} entities, got {len(entities)}"
+            entity_ids = [str(entity.id) for entity in entities]
+
+        with allure.step("Reading the created entities back concurrently"):
+            fetched = asyncio.run(
+                gather_bounded(
+                    len(entity_ids), *map(async_entity_service.get_entity, entity_ids)
+                )
+            )
+            for entity, payload in zip(fetched, payloads, strict=True):
+                validate_entity(entity, payload)
+            assert asyncio.run(
+                async_entity_service.contains_ids(entity.id for entity in entities)
+            ), "Not all created entities are present among all entities"
+
+        with allure.step("Deleting the created entities concurrently"):
+            responses = asyncio.run(async_entity_service.delete_entities(entity_ids))
+            assert all(
+                response.status_code == 204 for response in responses
+            ), "Not all entities were deleted"
+
+        with allure.step("Ensuring the deleted entities are no longer present"):
+
+            async def present_ids() -> set[int]:
+                rows = async_entity_service.iter_entities()
+                return {entity.id async for entity in rows}
+
+            deleted_ids = {entity.id for entity in entities}
+            leaked = sorted(asyncio.run(present_ids()) & deleted_ids)
+            assert not leaked, f"Deleted entities are still present: {leaked}"
@@ -0,0 +1,164 @@
+import os
+from pathlib import Path
+
+import pytest
+from _pytest.mark.expression import Expression
+
+from config.config_api.config import CASSETTE_DIR, CASSETTE_MODE
+from data.seeding import DataSeeder, session_seed
+from services.entity.cassette import CassetteMode, load_metadata, save_metadata
+from utils.ui.parallel import max_browsers
+
+DATA_SEEDER = pytest.StashKey[DataSeeder]()
+API_MARK = "api"
+UI_MARK = "ui"
+UI_TESTS = Path(__file__).parent / "ui"
+
+pytest_plugins = ["utils.allure_sink", "utils.allure_workers", "utils.latency_plugin"]
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add command line options selecting the Entity API backend and test data."""
+    parser.getgroup("data").addoption(
+        "--data-seed",
+        type=int,
+        default=None,
+        help="Session seed of the generated test data (default: $TEST_DATA_SEED "
+        "or random; printed in the header to reproduce a run).",
+    )
+    group = parser.getgroup("api")
+    group.addoption(
+        "--api-backend",
+        choices=("remote", "local"),
+        default=os.getenv("API_BACKEND", "remote"),
+        help="Run the API tests against BASE_URL or an in-process local server.",
+    )
+    group.addoption(
+        "--local-api-latency",
+        type=float,
+        default=0.0,
+        help="Seconds the local server adds to every response.",
+    )
+    group.addoption(
+        "--local-api-error-rate",
+        type=float,
+        default=0.0,
+        help="Share of requests the local server answers with 503.",
+    )
+    group.addoption(
+        "--cassette-mode",
+        type=CassetteMode,
+        choices=list(CassetteMode),
+        default=CASSETTE_MODE,
+        help="Record API exchanges to, or replay them from, --cassette-dir.",
+    )
+    group.addoption(
+        "--cassette-dir",
+        default=CASSETTE_DIR,
+        help="Directory holding the recorded API exchanges.",
+    )
+    group.addoption(
+        "--entity-cache",
+        action="store_true",
+        default=False,
+        help="Serve repeated entity reads from a per-session cache.",
+    )
+    group.addoption(
+        "--leak-report",
+        metavar="PATH",
+        default="leak-report.json",
+        help="Where to write the entities the session failed to delete.",
+    )
+    group.addoption(
+        "--payload-dataset",
+        metavar="PATH",
+        default=None,
+        help="Create pooled entities from this dataset, sharded across workers.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Partition the generated test data of the session.
+
+    The controller picks the session seed and hands it to the pytest-xdist
+    workers; each worker draws unique postcodes and titles from its own part.
+    A recording stores its seed with the tapes, and a replay without
+    ``--data-seed`` reuses it, so the tests send the recorded payloads again.
+    """
+    workerinput = getattr(config, "workerinput", {})
+    mode = config.getoption("cassette_mode")
+    cassette_dir = config.getoption("cassette_dir")
+    seed = config.getoption("data_seed")
+    if seed is None:
+        seed = workerinput.get("data_seed")
+    if seed is None and mode is CassetteMode.REPLAY:
+        seed = load_metadata(cassette_dir).get("data_seed")
+    if seed is None:
+        seed = session_seed()
+    if mode is CassetteMode.RECORD and not workerinput:
+        save_metadata(cassette_dir, data_seed=seed)
+    worker = int(workerinput.get("workerid", "gw0").removeprefix("gw"))
+    seeder = DataSeeder(seed, worker, workerinput.get("workercount", 1))
+    seeder.install()
+    config.stash[DATA_SEEDER] = seeder
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node: object) -> None:
+    """Send the session seed to a pytest-xdist worker."""
+    node.workerinput["data_seed"] = node.config.stash[DATA_SEEDER].seed
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config: pytest.Config) -> int | None:
+    """
+    Size ``-n auto`` by the browsers the host can run if UI tests are selected.
+
+    Every UI worker may start a headless Chrome, so workers are capped by the
+    cores, the available memory and ``UI_MAX_BROWSERS``. Other runs start no
+    browsers and keep the pytest-xdist default.
+    """
+    return max_browsers() if selects_ui_tests(config) else None
+
+
+def selects_ui_tests(config: pytest.Config) -> bool:
+    """
+    Return True if the paths and the ``-m`` expression of a run allow UI tests.
+
+    The expression is checked against a UI test with the ``ui`` mark only
+    and one with every mark but ``api``: ``-m ui``, ``-m smoke`` and
+    ``-m "ui and not smoke"`` allow UI tests, ``-m api`` and ``-m "not ui"``
+    do not.
+    """
+    markexpr = config.option.markexpr
+    if markexpr:
+        expression = Expression.compile(markexpr)
+        if not (
+            expression.evaluate(UI_MARK.__eq__) or expression.evaluate(API_MARK.__ne__)
+        ):
+            return False
+    paths = [
+        (config.invocation_params.dir / arg.split("::")[0]).resolve()
+        for arg in config.args
+    ]
+    return any(
+        UI_TESTS.is_relative_to(path) or path.is_relative_to(UI_TESTS) for path in paths
+    )
+
+
+def pytest_report_header(config: pytest.Config) -> str:
+    """Show the data seed needed to reproduce the run."""
+    return f"data seed: {config.stash[DATA_SEEDER].seed}"
+
+
+@pytest.fixture(scope="session")
+def data_seeder(request: pytest.FixtureRequest) -> DataSeeder:
+    """Fixture to provide the seeder of the generated test data of the session."""
+    return request.config.stash[DATA_SEEDER]
+
+
+@pytest.fixture(autouse=True)
+def data_seed(request: pytest.FixtureRequest) -> int:
+    """Fixture reseeding the test data from the session seed and the test ID."""
+    return request.config.stash[DATA_SEEDER].seed_test(request.node.nodeid)
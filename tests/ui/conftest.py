@@ -1,32 +1,57 @@
+import functools
+import inspect
 import logging
+from collections import Counter
 
 import allure
 import pytest
 from _pytest.reports import TestReport
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.webdriver import WebDriver
 
+from config.config_ui.config import PAGE_GROUP_SIZE
 from pages.add_customer_page import AddCustomerPage
+from pages.base_page import BasePage
+from utils.ui.driver_factory import create_driver, worker_id
+from utils.ui.driver_pool import DriverPool
 from utils.ui.helper import Helper
+from utils.ui.waits import METRICS
+
+
+@pytest.fixture(scope="session")
+def driver_pool(tmp_path_factory: pytest.TempPathFactory) -> DriverPool:
+    """
+    Fixture to provide the pool of warm browsers of the session.
+
+    Under pytest-xdist every worker keeps its own pool, and its browsers keep
+    their profiles in a temporary directory of the worker. The application
+    keeps its customers in the web storage of the browser, which the pool
+    clears between tests, so every test starts from the seeded customers
+    whichever worker runs it. The utilization is logged when the session ends.
+    """
+    profile_root = tmp_path_factory.mktemp(f"chrome-{worker_id()}")
+    pool = DriverPool(functools.partial(create_driver, profile_root))
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def wait_metrics() -> None:
+    """Fixture logging the time spent waiting per locator when the session ends."""
+    yield
+    for name, stats in METRICS.summary().items():
+        logging.info("Wait %s: %s", name, stats)
 
 
 @pytest.fixture
-def browser() -> WebDriver:
+def browser(driver_pool: DriverPool) -> WebDriver:
     """
-    Fixture to initialize and provide a WebDriver instance.
+    Fixture to lease a WebDriver instance from the pool for one test.
 
     Returns:
         WebDriver: The WebDriver instance for the browser.
     """
-    chrome_options = Options()
-    chrome_options.add_argument("--headless=new")
-    chrome_options.add_argument("--window-size=1920,1080")
-    driver = webdriver.Chrome(options=chrome_options)
-    driver.implicitly_wait(10)
-
-    yield driver
-    driver.quit()
+    with driver_pool.lease() as driver:
+        yield driver
 
 
 @pytest.fixture
@@ -85,6 +110,37 @@ def pytest_runtest_makereport(item: pytest.Item) -> TestReport:
     setattr(item, "rep_" + rep.when, rep)
 
 
+def page_object_group(item: pytest.Item) -> str | None:
+    """Return the name of the page object the test module imports, if any."""
+    module = getattr(item, "module", None)
+    pages = [
+        value.__name__
+        for _, value in inspect.getmembers(module, inspect.isclass)
+        if issubclass(value, BasePage) and value is not BasePage
+    ]
+    return pages[0] if pages else None
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """
+    Group the UI tests by the page object they drive.
+
+    With ``--dist loadgroup`` pytest-xdist runs each group on one worker, so
+    consecutive tests reuse the warm browser that already has the assets of
+    the page cached. The tests of a page are split into groups of at most
+    ``PAGE_GROUP_SIZE``, so a large page still spreads over all workers.
+    Tests with an explicit ``xdist_group`` keep theirs.
+    """
+    counts = Counter()
+    for item in items:
+        page = page_object_group(item)
+        if page is None or item.get_closest_marker("xdist_group"):
+            continue
+        chunk = counts[page] // PAGE_GROUP_SIZE
+        counts[page] += 1
+        item.add_marker(pytest.mark.xdist_group(f"{page}-{chunk}"))
+
+
 def pytest_configure() -> None:
     """Log configuration."""
     logging.basicConfig(
@@ -0,0 +1,101 @@
+import time
+
+import allure
+import pytest
+from selenium.common.exceptions import JavascriptException, TimeoutException
+
+from utils.ui.waits import Waits, WaitStrategy
+
+LOCATOR = ("css selector", "#customer")
+POLL_INTERVAL = 1.0
+
+
+class StubDriver:
+    """Driver answering the wait scripts with canned results."""
+
+    def __init__(
+        self,
+        observed: object = None,
+        checked: object = None,
+        delay: float = 0.0,
+    ) -> None:
+        """Initializes the stub.
+
+        Args:
+            observed (object): What the observer script returns, or the
+                exception it raises after ``delay`` seconds.
+            checked (object): What every polled check returns.
+            delay (float): Seconds the observer script takes.
+        """
+        self.observed = observed
+        self.checked = checked
+        self.delay = delay
+        self.checks = 0
+
+    def execute_async_script(self, script: str, *args: object) -> object:  # noqa: ARG002
+        """Run the observer script."""
+        time.sleep(self.delay)
+        if isinstance(self.observed, Exception):
+            raise self.observed
+        return self.observed
+
+    def execute_script(self, script: str, *args: object) -> object:  # noqa: ARG002
+        """Run one check of the condition."""
+        self.checks += 1
+        return self.checked
+
+
+def make_waits(driver: StubDriver) -> Waits:
+    """Build event waits on a stub driver with a long poll interval."""
+    return Waits(
+        driver,
+        timeout=0.05,
+        poll_interval=POLL_INTERVAL,
+        strategy=WaitStrategy.EVENTS,
+    )
+
+
+@allure.epic("UI Framework")
+@allure.feature("Waits")
+@pytest.mark.unit
+class TestWaits:
+    """Unit tests of the event waits against a stub driver."""
+
+    @allure.title("Test an observed condition is returned")
+    def test_observed_result(self) -> None:
+        """Tests that the result of the observer ends the wait."""
+        driver = StubDriver(observed=["element"])
+
+        assert make_waits(driver).present(LOCATOR) == ["element"]
+        assert driver.checks == 0, "The wait polled after the observer returned"
+
+    @allure.title("Test an observer timeout does not fall back to polling")
+    def test_observer_timeout(self) -> None:
+        """Tests that an observer that ran out its time ends the wait."""
+        driver = StubDriver(observed=None, checked=["element"])
+
+        with pytest.raises(TimeoutException):
+            make_waits(driver).present(LOCATOR)
+        assert driver.checks == 0, "The wait polled after the observer timed out"
+
+    @allure.title("Test a failed script falls back to polling")
+    def test_script_failure_polls(self) -> None:
+        """Tests that a failed observer script hands the wait to polling."""
+        driver = StubDriver(observed=JavascriptException("navigated"), checked=True)
+
+        make_waits(driver).absent(LOCATOR)
+        assert driver.checks == 1, f"Expected one check, got {driver.checks}"
+
+    @allure.title("Test a script failing after the timeout does not poll")
+    def test_late_script_failure(self) -> None:
+        """Tests that no poll interval is slept once the timeout has passed."""
+        driver = StubDriver(
+            observed=JavascriptException("navigated"), checked=None, delay=0.1
+        )
+        start = time.perf_counter()
+
+        with pytest.raises(TimeoutException):
+            make_waits(driver).present(LOCATOR)
+        elapsed = time.perf_counter() - start
+        assert driver.checks == 0, "The wait polled with no time left"
+        assert elapsed < POLL_INTERVAL, f"The wait slept a poll interval: {elapsed}"
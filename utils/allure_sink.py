@@ -0,0 +1,137 @@
+"""
+Pytest plugin that moves Allure attachment writes off the test thread.
+
+allure-pytest writes every attachment to disk synchronously from
+``allure.attach``. This plugin swaps its file logger for an
+``AttachmentSink`` that queues attachments in memory and writes them from a
+background thread. The queue is bounded, so a slow disk throttles the tests
+instead of growing memory without limit, and it is drained completely at
+session end, including on every xdist worker.
+"""
+
+import logging
+import queue
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import allure_commons
+import pytest
+from allure_commons import hookimpl
+from allure_commons.logger import AllureFileLogger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEFAULT_QUEUE_SIZE = 256
+
+logger = logging.getLogger(__name__)
+
+
+class AttachmentSink(AllureFileLogger):
+    """Allure file logger that writes attachments from a background thread."""
+
+    def __init__(
+        self, report_dir: str | Path, max_queue: int = DEFAULT_QUEUE_SIZE
+    ) -> None:
+        """Initializes the sink and starts its writer thread.
+
+        Args:
+            report_dir (str | Path): The Allure results directory.
+            max_queue (int): Maximum number of attachments waiting to be
+                written; ``allure.attach`` blocks while the queue is full.
+        """
+        super().__init__(report_dir)
+        self._queue: queue.Queue[tuple[Callable, tuple] | None] = queue.Queue(
+            maxsize=max_queue
+        )
+        self._writer = threading.Thread(
+            target=self._drain, name="allure-sink", daemon=True
+        )
+        self._writer.start()
+
+    @hookimpl
+    def report_attached_file(self, source: str, file_name: str) -> None:
+        """Queues copying an attached file into the results directory."""
+        self._queue.put((super().report_attached_file, (source, file_name)))
+
+    @hookimpl
+    def report_attached_data(self, body: str | bytes, file_name: str) -> None:
+        """Queues writing attached data into the results directory."""
+        self._queue.put((super().report_attached_data, (body, file_name)))
+
+    def flush(self) -> None:
+        """Blocks until every queued attachment has been written."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Writes the remaining attachments and stops the writer thread."""
+        self._queue.put(None)
+        self._writer.join()
+
+    def _drain(self) -> None:
+        """Writes queued attachments until the stop sentinel is received."""
+        while True:
+            task = self._queue.get()
+            try:
+                if task is None:
+                    return
+                write, args = task
+                write(*args)
+            except Exception:
+                logger.exception("Failed to write Allure attachment")
+            finally:
+                self._queue.task_done()
+
+
+sink_key = pytest.StashKey[AttachmentSink]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add command line options for the attachment sink."""
+    group = parser.getgroup("allure-sink")
+    group.addoption(
+        "--allure-sink-queue",
+        type=int,
+        default=DEFAULT_QUEUE_SIZE,
+        help="Attachments buffered before allure.attach blocks "
+        "(0 writes synchronously).",
+    )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config: pytest.Config) -> None:
+    """Replace the allure-pytest file logger with a buffered sink."""
+    max_queue = config.getoption("allure_sink_queue")
+    manager = allure_commons.plugin_manager
+    file_logger = next(
+        (
+            plugin
+            for plugin in manager.get_plugins()
+            if type(plugin) is AllureFileLogger
+        ),
+        None,
+    )
+    if file_logger is None or max_queue <= 0:
+        return
+
+    name = manager.get_name(file_logger)
+    manager.unregister(file_logger)
+    sink = AttachmentSink(file_logger._report_dir, max_queue)  # noqa: SLF001
+    manager.register(sink)
+    config.stash[sink_key] = sink
+
+    def restore() -> None:
+        # allure-pytest unregisters its own logger on cleanup, so hand it back.
+        sink.close()
+        manager.unregister(sink)
+        manager.register(file_logger, name)
+
+    config.add_cleanup(restore)
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Flush all buffered attachments at the end of the (worker) session."""
+    sink = session.config.stash.get(sink_key, None)
+    if sink is not None:
+        sink.flush()
@@ -1,39 +1,133 @@
-import json
+import gzip
+import random
+import threading
+from enum import StrEnum
 
 import allure
 from allure_commons.types import AttachmentType
 from requests import Response
 
+from config.config_api.config import (
+    ALLURE_ATTACH_POLICY,
+    ALLURE_BODY_LIMIT,
+    ALLURE_OVERSIZE_MODE,
+    ALLURE_SAMPLE_RATE,
+)
+
+
+class AttachPolicy(StrEnum):
+    """When API responses are attached to the Allure report."""
+
+    ALWAYS = "always"
+    ON_FAILURE = "on_failure"
+    SAMPLED = "sampled"
+    NEVER = "never"
+
+
+class OversizeMode(StrEnum):
+    """How response bodies above the byte cap are attached."""
+
+    TRUNCATE = "truncate"
+    GZIP = "gzip"
+
 
 class AllureUtils:
-    """Utility class for attaching API responses to Allure reports."""
+    """Utility class for attaching API responses to Allure reports.
 
-    @staticmethod
-    def attach_response(response: Response) -> None:
-        """Attach the details of an API response to an Allure report."""
-        try:
-            response_json = response.json()
-            formatted_response = json.dumps(response_json, indent=4)
-        except json.JSONDecodeError:
-            formatted_response = response.text or "Empty response"
+    The attachment policy, sample rate and body cap default to the values in
+    ``config_api`` and can be changed on the class at runtime. With the
+    ``on_failure`` policy responses are held until the test finishes and
+    only attached by ``flush_pending`` if it failed.
 
-        allure.attach(
-            body=formatted_response,
-            name="API Response",
-            attachment_type=AttachmentType.TEXT,
-        )
-        allure.attach(
-            body=str(response.status_code),
-            name="Status Code",
-            attachment_type=AttachmentType.TEXT,
-        )
-        allure.attach(
-            body=str(response.headers),
-            name="Headers",
-            attachment_type=AttachmentType.TEXT,
+    allure-pytest only knows the test running on the test thread. Background
+    threads call ``disable_in_thread`` when they start, and the responses
+    they receive are dropped. Held responses are kept per thread, so a test
+    only ever flushes its own.
+    """
+
+    policy = AttachPolicy(ALLURE_ATTACH_POLICY)
+    sample_rate = ALLURE_SAMPLE_RATE
+    body_limit = ALLURE_BODY_LIMIT
+    oversize_mode = OversizeMode(ALLURE_OVERSIZE_MODE)
+
+    _local = threading.local()
+
+    @classmethod
+    def disable_in_thread(cls) -> None:
+        """Drop the responses received on the current thread from now on."""
+        cls._local.enabled = False
+
+    @classmethod
+    def attach_response(cls, response: Response) -> None:
+        """Attach an API response to the Allure report according to the policy."""
+        if cls.policy is AttachPolicy.NEVER or not getattr(cls._local, "enabled", True):
+            return
+        if cls.policy is AttachPolicy.ON_FAILURE:
+            cls._pending().append(response)
+        elif cls.policy is AttachPolicy.ALWAYS or random.random() < cls.sample_rate:
+            cls._attach(response)
+
+    @classmethod
+    def flush_pending(cls, *, failed: bool) -> None:
+        """Attach the responses held for the current test if it failed.
+
+        Args:
+            failed (bool): Whether the test failed; otherwise they are dropped.
+        """
+        pending = cls._pending()
+        cls._local.pending = []
+        if failed:
+            for response in pending:
+                cls._attach(response)
+
+    @classmethod
+    def _pending(cls) -> list[Response]:
+        """Return the responses held on the current thread."""
+        if not hasattr(cls._local, "pending"):
+            cls._local.pending = []
+        return cls._local.pending
+
+    @classmethod
+    def _attach(cls, response: Response) -> None:
+        """Attach the request summary and the raw body of a response."""
+        headers = "\n".join(
+            f"{key}: {value}" for key, value in response.headers.items()
         )
         allure.attach(
-            body=str(response.url),
-            name="URL",
+            body=(
+                f"{response.request.method} {response.url}\n"
+                f"Status Code: {response.status_code}\n\n"
+                f"Headers:\n{headers}"
+            ),
+            name="Request Summary",
             attachment_type=AttachmentType.TEXT,
         )
+
+        content = response.content
+        if not content:
+            allure.attach(
+                body="Empty response",
+                name="API Response",
+                attachment_type=AttachmentType.TEXT,
+            )
+        elif len(content) <= cls.body_limit:
+            is_json = "json" in response.headers.get("Content-Type", "")
+            allure.attach(
+                body=content,
+                name="API Response",
+                attachment_type=AttachmentType.JSON if is_json else AttachmentType.TEXT,
+            )
+        elif cls.oversize_mode is OversizeMode.GZIP:
+            allure.attach(
+                body=gzip.compress(content, compresslevel=1),
+                name=f"API Response ({len(content)} bytes, gzip)",
+                attachment_type="application/gzip",
+                extension="gz",
+            )
+        else:
+            allure.attach(
+                body=content[: cls.body_limit]
+                + f"\n... truncated {len(content) - cls.body_limit} bytes".encode(),
+                name=f"API Response (first {cls.body_limit} of {len(content)} bytes)",
+                attachment_type=AttachmentType.TEXT,
+            )
@@ -0,0 +1,64 @@
+"""
+Pytest plugin giving every pytest-xdist worker its own Allure results directory.
+
+With one shared ``--alluredir`` every worker that starts with
+``--clean-alluredir`` deletes the results the workers started before it have
+already written. Here each worker writes to ``<alluredir>/<worker id>`` and
+the controller, which cleans the directory once before the workers start,
+moves the worker results up into ``--alluredir`` when the session ends. Allure
+names its result files by UUID, so merging is a rename without conflicts.
+"""
+
+import logging
+import shutil
+from pathlib import Path
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+WORKER_DIR_PREFIX = "gw"
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config) -> None:
+    """Point the Allure results of a worker to its own directory."""
+    workerinput = getattr(config, "workerinput", None)
+    report_dir = config.getoption("allure_report_dir", None)
+    if workerinput is not None and report_dir:
+        config.option.allure_report_dir = str(
+            Path(report_dir) / workerinput["workerid"]
+        )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Merge the worker results into the results directory of the controller."""
+    config = session.config
+    report_dir = config.getoption("allure_report_dir", None)
+    if hasattr(config, "workerinput") or not report_dir:
+        return
+    merge_worker_results(Path(report_dir))
+
+
+def merge_worker_results(report_dir: Path) -> int:
+    """
+    Move the files of every worker directory into the results directory.
+
+    Args:
+        report_dir (Path): The Allure results directory of the run.
+
+    Returns:
+        int: The number of files moved.
+    """
+    moved = 0
+    for worker_dir in report_dir.glob(f"{WORKER_DIR_PREFIX}*"):
+        if not worker_dir.is_dir():
+            continue
+        for path in worker_dir.iterdir():
+            path.replace(report_dir / path.name)
+            moved += 1
+        shutil.rmtree(worker_dir, ignore_errors=True)
+    if moved:
+        logger.info("Merged %d Allure result files of the workers", moved)
+    return moved
@@ -0,0 +1,331 @@
+"""
+In-memory stand-in for the Entity API, generated from ``docs/api/api-docs.json``.
+
+The routes and request schemas come from the Swagger document; the store is a
+thread-safe dict. Behaviour follows the real backend where the tests rely on
+it: getall wraps the rows in ``{"entity": [...]}`` and unknown IDs answer
+500. Latency and error injection make it usable for resilience tests and for
+benchmarking the client stack without network noise.
+"""
+
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import TracebackType
+from typing import Any, NamedTuple, Self
+from urllib.parse import parse_qs, urlsplit
+
+API_DOCS = Path(__file__).resolve().parents[2] / "docs" / "api" / "api-docs.json"
+
+_Result = tuple[int, str | bytes | None]
+_MISSING: _Result = (HTTPStatus.INTERNAL_SERVER_ERROR, "entity not found")
+
+_TYPES = {
+    "string": str,
+    "integer": int,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+
+class _Call(NamedTuple):
+    """The parts of a request an operation handler needs."""
+
+    entity_id: int
+    body: Any
+    query: str
+    idempotency_key: str | None
+
+
+class _Route:
+    """A path template of the spec compiled to a regular expression."""
+
+    def __init__(self, method: str, template: str, spec: dict) -> None:
+        self.method = method
+        self.operation = template.strip("/").split("/")[1].lower()
+        pattern = re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", template.rstrip("/"))
+        self.regex = re.compile(f"^{pattern}/?$", re.IGNORECASE)
+        body = next((p for p in spec.get("parameters", []) if p["in"] == "body"), None)
+        self.body_schema = body["schema"] if body else None
+
+
+class EntityStore:
+    """Thread-safe in-memory storage of entities."""
+
+    def __init__(self) -> None:
+        """Initializes an empty store."""
+        self._entities: dict[int, dict] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def create(self, data: dict) -> int:
+        """Store a new entity and return its ID."""
+        with self._lock:
+            entity_id = next(self._ids)
+            self._entities[entity_id] = self._build(entity_id, data)
+            return entity_id
+
+    def get(self, entity_id: int) -> dict | None:
+        """Return an entity, or None if it does not exist."""
+        with self._lock:
+            return self._entities.get(entity_id)
+
+    def list(self, filters: dict[str, str]) -> list[dict]:
+        """Return the entities matching the getall query parameters."""
+        with self._lock:
+            entities = list(self._entities.values())
+        if "title" in filters:
+            entities = [e for e in entities if filters["title"] in e["title"]]
+        if "verified" in filters:
+            verified = filters["verified"].lower() == "true"
+            entities = [e for e in entities if e["verified"] is verified]
+        per_page = filters.get("per_page") or filters.get("perPage")
+        if "page" in filters and per_page:
+            page, size = int(filters["page"]), int(per_page)
+            entities = entities[(page - 1) * size : page * size]
+        return entities
+
+    def update(self, entity_id: int, data: dict) -> bool:
+        """Replace an entity; return False if it does not exist."""
+        with self._lock:
+            if entity_id not in self._entities:
+                return False
+            self._entities[entity_id] = self._build(entity_id, data)
+            return True
+
+    def delete(self, entity_id: int) -> bool:
+        """Delete an entity; return False if it does not exist."""
+        with self._lock:
+            return self._entities.pop(entity_id, None) is not None
+
+    @staticmethod
+    def _build(entity_id: int, data: dict) -> dict:
+        """Build the stored representation of an entity request."""
+        addition = data.get("addition") or {}
+        return {
+            "id": entity_id,
+            "title": data.get("title", ""),
+            "verified": data.get("verified", False),
+            "important_numbers": data.get("important_numbers") or [],
+            "addition": {
+                "id": entity_id,
+                "additional_info": addition.get("additional_info", ""),
+                "additional_number": addition.get("additional_number", 0),
+            },
+        }
+
+
+class EntityServer:
+    """
+    Local HTTP server implementing the Entity API on a background thread.
+
+    Example:
+        with EntityServer(latency=0.01) as server:
+            client = APIClient(server.url)
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        spec_path: Path = API_DOCS,
+    ) -> None:
+        """Initializes the server; port 0 picks a free port.
+
+        Args:
+            host (str): Interface to listen on.
+            port (int): Port to listen on, 0 for a random free port.
+            latency (float): Seconds added to every response.
+            error_rate (float): Share of requests answered with 503, like a flaky proxy.
+            spec_path (Path): Swagger document the routes are generated from.
+        """
+        self.latency = latency
+        self.error_rate = error_rate
+        self.store = EntityStore()
+        self._created: dict[str, int] = {}
+        self._created_lock = threading.Lock()
+        spec = json.loads(spec_path.read_text(encoding="utf-8"))
+        self.definitions = spec.get("definitions", {})
+        self.routes = [
+            _Route(method.upper(), template, operation)
+            for template, methods in spec["paths"].items()
+            for method, operation in methods.items()
+        ]
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> Self:
+        """Start serving on a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="entity-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> Self:
+        """Start the server for use as a context manager."""
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop the server on leaving the context."""
+        self.stop()
+
+    def dispatch(
+        self,
+        method: str,
+        path: str,
+        body: Any,  # noqa: ANN401
+        idempotency_key: str | None = None,
+    ) -> _Result:
+        """
+        Handle a request and return its status and payload.
+
+        A create repeated with the same idempotency key returns the ID of the
+        entity created the first time instead of creating another one.
+
+        Returns:
+            tuple[int, str | bytes | None]: The status code and either a text
+            body, a JSON-encoded body (bytes) or None for no content.
+        """
+        if self.latency:
+            time.sleep(self.latency)
+        url = urlsplit(path)
+        route, params = self._route(method, url.path)
+
+        if self.error_rate and random.random() < self.error_rate:
+            result = HTTPStatus.SERVICE_UNAVAILABLE, "injected error"
+        elif route is None:
+            result = HTTPStatus.NOT_FOUND, "not found"
+        elif route.body_schema and not self._matches(body, route.body_schema):
+            result = HTTPStatus.BAD_REQUEST, "invalid body"
+        elif not params.get("id", "0").isdigit():
+            result = HTTPStatus.BAD_REQUEST, "invalid id"
+        else:
+            handler = getattr(self, f"_{route.operation}")
+            call = _Call(int(params.get("id", 0)), body, url.query, idempotency_key)
+            result = handler(call)
+        return result
+
+    def _route(self, method: str, path: str) -> tuple[_Route | None, dict[str, str]]:
+        """Find the route serving a request path."""
+        for route in self.routes:
+            match = route.regex.match(path)
+            if match and route.method == method:
+                return route, match.groupdict()
+        return None, {}
+
+    def _create(self, call: _Call) -> _Result:
+        if call.idempotency_key is None:
+            return HTTPStatus.OK, str(self.store.create(call.body))
+        with self._created_lock:
+            if call.idempotency_key not in self._created:
+                self._created[call.idempotency_key] = self.store.create(call.body)
+            return HTTPStatus.OK, str(self._created[call.idempotency_key])
+
+    def _get(self, call: _Call) -> _Result:
+        entity = self.store.get(call.entity_id)
+        return (HTTPStatus.OK, json.dumps(entity).encode()) if entity else _MISSING
+
+    def _getall(self, call: _Call) -> _Result:
+        filters = {key: values[0] for key, values in parse_qs(call.query).items()}
+        return HTTPStatus.OK, json.dumps({"entity": self.store.list(filters)}).encode()
+
+    def _patch(self, call: _Call) -> _Result:
+        updated = self.store.update(call.entity_id, call.body)
+        return (HTTPStatus.NO_CONTENT, None) if updated else _MISSING
+
+    def _delete(self, call: _Call) -> _Result:
+        deleted = self.store.delete(call.entity_id)
+        return (HTTPStatus.NO_CONTENT, None) if deleted else _MISSING
+
+    def _matches(self, value: Any, schema: dict) -> bool:  # noqa: ANN401
+        """Check a value against a Swagger schema (types and nesting only)."""
+        if "$ref" in schema:
+            return self._matches(value, self.definitions[schema["$ref"].split("/")[-1]])
+        if "allOf" in schema:
+            return value is None or all(
+                self._matches(value, s) for s in schema["allOf"]
+            )
+        expected = _TYPES.get(schema.get("type", "object"))
+        valid = isinstance(value, expected) and not (
+            expected is int and isinstance(value, bool)
+        )
+        if valid and expected is list:
+            valid = all(self._matches(item, schema.get("items", {})) for item in value)
+        elif valid and expected is dict:
+            valid = all(
+                key not in value or self._matches(value[key], prop)
+                for key, prop in schema.get("properties", {}).items()
+            )
+        return valid
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        """Build the request handler class bound to this server."""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+            def _serve(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                try:
+                    body = json.loads(raw) if raw else None
+                except json.JSONDecodeError:
+                    status, payload = HTTPStatus.BAD_REQUEST, "invalid json"
+                else:
+                    status, payload = server.dispatch(
+                        self.command,
+                        self.path,
+                        body,
+                        self.headers.get("Idempotency-Key"),
+                    )
+
+                content_type = "application/json"
+                if isinstance(payload, str):
+                    payload, content_type = payload.encode(), "text/plain"
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(payload or b"")))
+                if payload:
+                    self.send_header("Content-Type", content_type)
+                if self.close_connection:
+                    self.send_header("Connection", "close")
+                self.end_headers()
+                if payload:
+                    self.wfile.write(payload)
+
+            do_GET = do_POST = do_PATCH = do_DELETE = _serve  # noqa: N815
+
+        return Handler
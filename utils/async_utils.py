@@ -0,0 +1,34 @@
+import asyncio
+from collections.abc import Awaitable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+async def gather_bounded(
+    limit: int, *aws: Awaitable[T], return_exceptions: bool = False
+) -> list[T | BaseException]:
+    """
+    Run awaitables concurrently with at most ``limit`` of them in flight.
+
+    Args:
+        limit (int): Maximum number of awaitables running at the same time.
+        *aws (Awaitable): The awaitables to run.
+        return_exceptions (bool): Return exceptions as results instead of
+            raising the first one, as in ``asyncio.gather``.
+
+    Returns:
+        list: The results in the order the awaitables were given.
+    """
+    if limit < 1:
+        error_message = f"Concurrency limit must be positive, got {limit}"
+        raise ValueError(error_message)
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(
+        *(run(aw) for aw in aws), return_exceptions=return_exceptions
+    )
@@ -0,0 +1,110 @@
+"""
+Pytest plugin that reports API latency percentiles per endpoint.
+
+Every request sent through ``HTTPClient`` is recorded via the timing hooks in
+``services.entity.timing``. Under pytest-xdist each worker ships its samples
+to the controller when it shuts down. At session end the controller prints
+p50/p95/p99 per endpoint and, with ``--latency-report``, writes them to a JSON
+file that can be diffed between runs.
+"""
+
+import json
+from dataclasses import astuple
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from _pytest.terminal import TerminalReporter
+
+from services.entity.timing import (
+    RequestTiming,
+    add_timing_hook,
+    remove_timing_hook,
+    summarize,
+)
+
+if TYPE_CHECKING:
+    from xdist.workermanage import WorkerController
+
+WORKER_OUTPUT_KEY = "latency_samples"
+
+
+class LatencyRecorder:
+    """Collects request timings for the session."""
+
+    def __init__(self) -> None:
+        """Initializes an empty recorder."""
+        self.timings: list[RequestTiming] = []
+
+    def record(self, timing: RequestTiming) -> None:
+        """Stores a single request timing."""
+        self.timings.append(timing)
+
+
+recorder_key = pytest.StashKey[LatencyRecorder]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add command line options for the latency report."""
+    group = parser.getgroup("latency")
+    group.addoption(
+        "--latency-report",
+        metavar="PATH",
+        default=None,
+        help="Write per-endpoint API latency percentiles to a JSON file.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Start recording request timings."""
+    recorder = LatencyRecorder()
+    config.stash[recorder_key] = recorder
+    add_timing_hook(recorder.record)
+    config.add_cleanup(lambda: remove_timing_hook(recorder.record))
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Hand the samples of an xdist worker over to the controller."""
+    config = session.config
+    if hasattr(config, "workeroutput"):
+        config.workeroutput[WORKER_OUTPUT_KEY] = [
+            astuple(timing) for timing in config.stash[recorder_key].timings
+        ]
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node: "WorkerController", error: object) -> None:  # noqa: ARG001
+    """Merge the samples of a finished xdist worker."""
+    samples = getattr(node, "workeroutput", {}).get(WORKER_OUTPUT_KEY, [])
+    recorder = node.config.stash[recorder_key]
+    recorder.timings.extend(RequestTiming(*sample) for sample in samples)
+
+
+def pytest_terminal_summary(
+    terminalreporter: TerminalReporter, config: pytest.Config
+) -> None:
+    """Print the latency table and write the JSON report."""
+    timings = config.stash[recorder_key].timings
+    if not timings:
+        return
+    summary = summarize(timings)
+
+    terminalreporter.section("API latency (ms)")
+    terminalreporter.write_line(
+        f"{'endpoint':<24} {'count':>6} {'errors':>6} "
+        f"{'p50':>9} {'p95':>9} {'p99':>9} {'ttfb p50':>9} {'conn':>5} "
+        f"{'retries':>7}"
+    )
+    for endpoint, stats in summary.items():
+        total = stats["total_ms"]
+        terminalreporter.write_line(
+            f"{endpoint:<24} {stats['count']:>6} {stats['errors']:>6} "
+            f"{total['p50']:>9.1f} {total['p95']:>9.1f} {total['p99']:>9.1f} "
+            f"{stats['ttfb_ms']['p50']:>9.1f} {stats['new_connections']:>5} "
+            f"{stats['retries']:>7}"
+        )
+
+    report_path = config.getoption("latency_report")
+    if report_path:
+        Path(report_path).write_text(json.dumps(summary, indent=2), encoding="utf-8")
+        terminalreporter.write_line(f"Latency report written to {report_path}")
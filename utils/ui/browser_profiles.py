@@ -0,0 +1,103 @@
+"""Performance profiles of the headless browser the UI tests run in."""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.webdriver import WebDriver
+
+from config.config_ui.config import BLOCKED_URLS, BROWSER_CACHE_DIR, FONT_URLS
+
+_BLOCK = 2  # Chrome content setting value that blocks a content type
+
+
+@dataclass(frozen=True, slots=True)
+class BrowserProfile:
+    """
+    How much of a page the browser loads before a test can use it.
+
+    ``page_load_strategy`` decides when ``WebDriver.get`` returns: ``normal``
+    after the load event, ``eager`` after ``DOMContentLoaded`` and ``none``
+    right after navigation starts. The pages wait explicitly for what they
+    need, so the earlier strategies only skip waiting for images, ads and
+    other subresources. URLs matching ``blocked_urls`` are never requested,
+    which Chrome enforces through the DevTools protocol. A ``disk_cache``
+    keeps the HTTP cache of each worker in ``BROWSER_CACHE_DIR`` across
+    browsers and runs, so scripts and styles are loaded once.
+    """
+
+    name: str
+    page_load_strategy: str = "normal"
+    blocked_urls: tuple[str, ...] = ()
+    block_images: bool = False
+    disk_cache: bool = False
+
+    def apply_options(self, options: Options, worker: str) -> None:
+        """
+        Add the options of the profile to the options of a new browser.
+
+        Args:
+            options (Options): The options the browser will start with.
+            worker (str): The worker starting the browser; each worker gets
+                its own cache directory.
+        """
+        options.page_load_strategy = self.page_load_strategy
+        if self.block_images:
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": _BLOCK}
+            )
+        if self.disk_cache:
+            cache_dir = Path(BROWSER_CACHE_DIR, worker).resolve()
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            options.add_argument(f"--disk-cache-dir={cache_dir}")
+
+    def apply_driver(self, driver: WebDriver) -> None:
+        """Block the URLs of the profile in a started browser."""
+        if self.blocked_urls:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": list(self.blocked_urls)}
+            )
+
+
+PROFILES = {
+    profile.name: profile
+    for profile in (
+        BrowserProfile("default"),
+        BrowserProfile("eager", page_load_strategy="eager"),
+        BrowserProfile(
+            "blocked", blocked_urls=BLOCKED_URLS + FONT_URLS, block_images=True
+        ),
+        BrowserProfile(
+            "lean",
+            page_load_strategy="eager",
+            blocked_urls=BLOCKED_URLS + FONT_URLS,
+            block_images=True,
+            disk_cache=True,
+        ),
+        BrowserProfile(
+            "none",
+            page_load_strategy="none",
+            blocked_urls=BLOCKED_URLS + FONT_URLS,
+            block_images=True,
+            disk_cache=True,
+        ),
+    )
+}
+
+
+def get_profile(name: str) -> BrowserProfile:
+    """
+    Return a browser profile by name.
+
+    Raises:
+        ValueError: If there is no profile with that name.
+    """
+    try:
+        return PROFILES[name]
+    except KeyError:
+        error_message = (
+            f"Unknown browser profile {name!r}, expected one of {list(PROFILES)}"
+        )
+        raise ValueError(error_message) from None
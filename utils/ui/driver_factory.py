@@ -0,0 +1,79 @@
+import os
+import tempfile
+from pathlib import Path
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.webdriver import WebDriver
+
+from config.config_ui.config import BROWSER_PROFILE, WINDOW_SIZE
+from utils.ui.browser_profiles import BrowserProfile, get_profile
+
+WORKER_ENV = "PYTEST_XDIST_WORKER"
+DEFAULT_PROFILE = get_profile(BROWSER_PROFILE)
+
+
+def worker_id() -> str:
+    """Return the pytest-xdist worker running this process, or ``master``."""
+    return os.getenv(WORKER_ENV, "master")
+
+
+def chrome_options(
+    profile_dir: Path | None = None, profile: BrowserProfile = DEFAULT_PROFILE
+) -> Options:
+    """
+    Build the options of the headless Chrome the UI tests run in.
+
+    Args:
+        profile_dir (Path | None): The user data directory of the browser.
+            Chrome picks a temporary one if None.
+        profile (BrowserProfile): The performance profile of the browser.
+
+    Returns:
+        Options: The Chrome options.
+    """
+    options = Options()
+    options.add_argument("--headless=new")
+    options.add_argument(f"--window-size={WINDOW_SIZE}")
+    # Parallel browsers exhaust the small /dev/shm of containers and CI runners.
+    options.add_argument("--disable-dev-shm-usage")
+    if profile_dir is not None:
+        options.add_argument(f"--user-data-dir={profile_dir}")
+    profile.apply_options(options, worker_id())
+    return options
+
+
+def create_driver(
+    profile_root: Path | None = None, profile: BrowserProfile = DEFAULT_PROFILE
+) -> WebDriver:
+    """
+    Start a new headless Chrome.
+
+    No implicit wait is set: pages wait explicitly with ``utils.ui.waits``,
+    so checks for absent elements return at once. With ``profile_root`` the
+    browser gets its own profile in a directory named after the worker, so
+    browsers of parallel workers never share a profile, cache or lock file.
+    The performance ``profile`` defaults to the one named by
+    ``UI_BROWSER_PROFILE``.
+
+    Args:
+        profile_root (Path | None): Directory for the browser profiles.
+        profile (BrowserProfile): The performance profile of the browser.
+
+    Returns:
+        WebDriver: The WebDriver instance for the browser.
+    """
+    profile_dir = None
+    if profile_root is not None:
+        profile_root.mkdir(parents=True, exist_ok=True)
+        profile_dir = Path(
+            tempfile.mkdtemp(prefix=f"chrome-{worker_id()}-", dir=profile_root)
+        )
+    driver = webdriver.Chrome(options=chrome_options(profile_dir, profile))
+    try:
+        profile.apply_driver(driver)
+    except WebDriverException:
+        driver.quit()
+        raise
+    return driver
@@ -0,0 +1,169 @@
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field
+
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from config.config_ui.config import DRIVER_MAX_USES
+from utils.ui.driver_factory import create_driver
+
+BLANK_PAGE = "about:blank"
+_CLEAR_STORAGE = "window.localStorage.clear(); window.sessionStorage.clear();"
+
+
+@dataclass(slots=True)
+class _PooledDriver:
+    driver: WebDriver
+    started: float = field(default_factory=time.monotonic)
+    stopped: float | None = None
+    uses: int = 0
+    busy: float = 0.0
+
+    @property
+    def lifetime(self) -> float:
+        """Seconds the browser has been running."""
+        return (self.stopped or time.monotonic()) - self.started
+
+
+class DriverPool:
+    """
+    Pool of warm browsers shared by the UI tests of a worker.
+
+    A lease hands out an idle browser, or starts one if there is none. When
+    the lease ends the browser is reset for the next test: pending alerts
+    are dismissed, extra windows closed, cookies and web storage cleared and
+    the blank page loaded. A browser is replaced after ``max_uses`` leases,
+    or as soon as it stops answering or cannot be reset.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], WebDriver] = create_driver,
+        max_uses: int = DRIVER_MAX_USES,
+    ) -> None:
+        """Initializes an empty pool.
+
+        Args:
+            factory (Callable[[], WebDriver]): Starts a new browser.
+            max_uses (int): Leases after which a browser is replaced.
+        """
+        self.factory = factory
+        self.max_uses = max_uses
+        self.started = 0
+        self.leases = 0
+        self.recycled = 0
+        self._idle: list[_PooledDriver] = []
+        self._retired: list[_PooledDriver] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def lease(self) -> Iterator[WebDriver]:
+        """
+        Lease a browser for one test.
+
+        Yields:
+            WebDriver: A browser on the blank page with no state left over.
+        """
+        pooled = self._acquire()
+        start = time.monotonic()
+        try:
+            yield pooled.driver
+        finally:
+            pooled.busy += time.monotonic() - start
+            self._release(pooled)
+
+    def close(self) -> None:
+        """Quit every browser and log how well the pool was used."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for pooled in idle:
+            self._retire(pooled)
+        logging.info("Driver pool: %s", self.stats())
+
+    def stats(self) -> dict[str, float]:
+        """Return the lease counts and the share of browser time spent in tests."""
+        with self._lock:
+            drivers = self._retired + self._idle
+            lifetime = sum(pooled.lifetime for pooled in drivers)
+            busy = sum(pooled.busy for pooled in drivers)
+            return {
+                "started": self.started,
+                "leases": self.leases,
+                "recycled": self.recycled,
+                "leases_per_browser": round(self.leases / self.started, 2)
+                if self.started
+                else 0.0,
+                "utilization": round(busy / lifetime, 4) if lifetime else 0.0,
+            }
+
+    def _acquire(self) -> _PooledDriver:
+        """Take an idle browser that still answers, or start a new one."""
+        while True:
+            with self._lock:
+                pooled = self._idle.pop() if self._idle else None
+            if pooled is None or self._is_alive(pooled.driver):
+                break
+            with self._lock:
+                self.recycled += 1
+            self._retire(pooled)
+        if pooled is None:
+            pooled = _PooledDriver(self.factory())
+            with self._lock:
+                self.started += 1
+        with self._lock:
+            self.leases += 1
+        pooled.uses += 1
+        with suppress(WebDriverException):
+            pooled.driver.get_log("browser")  # drop the logs of earlier tests
+        return pooled
+
+    def _release(self, pooled: _PooledDriver) -> None:
+        """Reset a browser and return it to the pool, or replace it."""
+        if pooled.uses >= self.max_uses or not self._reset(pooled.driver):
+            with self._lock:
+                self.recycled += 1
+            self._retire(pooled)
+            return
+        with self._lock:
+            self._idle.append(pooled)
+
+    @staticmethod
+    def _reset(driver: WebDriver) -> bool:
+        """Clear the state a test left behind; return False if that failed."""
+        try:
+            with suppress(NoAlertPresentException):
+                driver.switch_to.alert.dismiss()
+            first, *extra = driver.window_handles
+            for handle in extra:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(first)
+            with suppress(WebDriverException):  # pages without web storage
+                driver.execute_script(_CLEAR_STORAGE)
+            driver.delete_all_cookies()
+            driver.get(BLANK_PAGE)
+        except (WebDriverException, ValueError) as e:
+            logging.warning("Replacing a browser that could not be reset: %s", e)
+            return False
+        return True
+
+    @staticmethod
+    def _is_alive(driver: WebDriver) -> bool:
+        """Return True if the browser still answers."""
+        try:
+            driver.current_window_handle  # noqa: B018
+        except WebDriverException:
+            return False
+        return True
+
+    def _retire(self, pooled: _PooledDriver) -> None:
+        """Quit a browser, keeping its usage for the stats."""
+        with suppress(WebDriverException):
+            pooled.driver.quit()
+        pooled.stopped = time.monotonic()
+        with self._lock:
+            self._retired.append(pooled)
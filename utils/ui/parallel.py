@@ -0,0 +1,54 @@
+"""Sizing of parallel UI runs from the resources of the host."""
+
+import os
+from pathlib import Path
+
+from config.config_ui.config import BROWSER_MEMORY_MB, MAX_BROWSERS
+
+MEMINFO = Path("/proc/meminfo")
+
+
+def cpu_count() -> int:
+    """Return the number of cores this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def available_memory() -> int | None:
+    """Return the bytes of memory available to new processes, if known."""
+    try:
+        for line in MEMINFO.read_text(encoding="ascii").splitlines():
+            if line.startswith("MemAvailable:"):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def max_browsers(
+    memory_per_browser: int = BROWSER_MEMORY_MB, limit: int = MAX_BROWSERS
+) -> int:
+    """
+    Return how many browsers the host can run side by side.
+
+    One per core, as many as fit into the available memory with
+    ``memory_per_browser`` megabytes each, and at most ``limit`` if set.
+
+    Args:
+        memory_per_browser (int): Megabytes reserved per browser.
+        limit (int): Fixed cap on the browsers; 0 for none.
+
+    Returns:
+        int: The number of browsers, at least 1.
+    """
+    browsers = cpu_count()
+    memory = available_memory()
+    if memory is not None:
+        browsers = min(browsers, memory // (memory_per_browser * 2**20))
+    if limit > 0:
+        browsers = min(browsers, limit)
+    return max(browsers, 1)
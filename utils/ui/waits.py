@@ -0,0 +1,311 @@
+"""Waits that resolve on DOM changes in the page instead of on a poll interval."""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from enum import StrEnum
+
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support.ui import WebDriverWait
+
+from config.config_ui.config import DEFAULT_TIMEOUT, WAIT_POLL_INTERVAL, WAIT_STRATEGY
+
+# Defines check(), which returns the result of a wait or null while it must
+# go on: the matching nodes ("present"), true ("absent") or the text of the
+# matching nodes once it differs from the expected one ("text").
+_CHECK_PRELUDE = """
+const [kind, by, value, expected] = arguments;
+function find() {
+    if (by !== "xpath") {
+        return Array.from(document.querySelectorAll(value));
+    }
+    const result = document.evaluate(
+        value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    return Array.from(
+        {length: result.snapshotLength}, (_, i) => result.snapshotItem(i));
+}
+function check() {
+    const nodes = find();
+    if (kind === "present") {
+        return nodes.length ? nodes : null;
+    }
+    if (kind === "absent") {
+        return nodes.length ? null : true;
+    }
+    const text = nodes.map(node => node.innerText).join("\\n");
+    return text !== expected ? text : null;
+}
+"""
+_CHECK = _CHECK_PRELUDE + "return check();"
+_OBSERVE = (
+    _CHECK_PRELUDE
+    + """
+const timeoutMs = arguments[4];
+const done = arguments[arguments.length - 1];
+const first = check();
+if (first !== null) {
+    done(first);
+    return;
+}
+const observer = new MutationObserver(() => {
+    const result = check();
+    if (result !== null) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(result);
+    }
+});
+const timer = setTimeout(() => {
+    observer.disconnect();
+    done(null);
+}, timeoutMs);
+observer.observe(document, {
+    subtree: true, childList: true, characterData: true, attributes: true});
+"""
+)
+_ANGULAR_STABLE = """
+const done = arguments[arguments.length - 1];
+const timer = setTimeout(() => done(false), arguments[0]);
+const finish = () => {
+    clearTimeout(timer);
+    done(true);
+};
+try {
+    if (window.getAllAngularTestabilities) {
+        Promise.all(getAllAngularTestabilities().map(
+            testability => new Promise(resolve => testability.whenStable(resolve))
+        )).then(finish);
+    } else if (window.angular) {
+        const root = document.querySelector("[ng-app]") || document.body;
+        angular.element(root).injector().get("$browser")
+            .notifyWhenNoOutstandingRequests(finish);
+    } else {
+        finish();
+    }
+} catch (error) {
+    finish();
+}
+"""
+
+
+class WaitStrategy(StrEnum):
+    """How waits find out that their condition holds."""
+
+    EVENTS = "events"
+    POLL = "poll"
+
+
+@dataclass(slots=True)
+class WaitStats:
+    """Timings of the waits for one locator."""
+
+    count: int = 0
+    timeouts: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def to_dict(self) -> dict[str, float]:
+        """Summarize the waits with times in milliseconds."""
+        return {
+            "count": self.count,
+            "timeouts": self.timeouts,
+            "mean_ms": round(self.total / self.count * 1000, 1) if self.count else 0,
+            "max_ms": round(self.max * 1000, 1),
+        }
+
+
+class WaitMetrics:
+    """Thread-safe wait timings per condition and locator."""
+
+    def __init__(self) -> None:
+        """Initializes empty metrics."""
+        self._stats: dict[str, WaitStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, elapsed: float, *, timed_out: bool) -> None:
+        """Record one wait."""
+        with self._lock:
+            stats = self._stats.setdefault(name, WaitStats())
+            stats.count += 1
+            stats.timeouts += timed_out
+            stats.total += elapsed
+            stats.max = max(stats.max, elapsed)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Return the stats of every locator, slowest in total first."""
+        with self._lock:
+            ranked = sorted(self._stats.items(), key=lambda item: -item[1].total)
+            return {name: stats.to_dict() for name, stats in ranked}
+
+
+METRICS = WaitMetrics()
+DEFAULT_STRATEGY = WaitStrategy(WAIT_STRATEGY)
+_TIMED_OUT = object()
+
+
+class Waits:
+    """
+    Explicit waits for page conditions.
+
+    With the ``events`` strategy a condition is checked once in the page and,
+    if it does not hold yet, a ``MutationObserver`` re-checks it on every DOM
+    change; ``execute_async_script`` returns as soon as it holds. That costs
+    one WebDriver round trip however long the wait. If the script cannot run,
+    e.g. because the page navigates away, the wait falls back to polling
+    every ``poll_interval`` seconds, which is also the ``poll`` strategy.
+
+    Every wait is recorded in ``metrics`` under its condition and locator.
+    Waits longer than the script timeout of the driver (30 s by default)
+    end as timeouts.
+    """
+
+    def __init__(
+        self,
+        browser: WebDriver,
+        timeout: float = DEFAULT_TIMEOUT,
+        poll_interval: float = WAIT_POLL_INTERVAL,
+        strategy: WaitStrategy = DEFAULT_STRATEGY,
+        metrics: WaitMetrics = METRICS,
+    ) -> None:
+        """Initializes the waits of a browser.
+
+        Args:
+            browser (WebDriver): The browser to wait in.
+            timeout (float): Default seconds to wait.
+            poll_interval (float): Seconds between checks when polling.
+            strategy (WaitStrategy): Observe DOM changes or poll.
+            metrics (WaitMetrics): Where the wait timings are recorded.
+        """
+        self.browser = browser
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.strategy = strategy
+        self.metrics = metrics
+
+    def present(
+        self, locator: tuple[str, str], timeout: float | None = None
+    ) -> list[WebElement]:
+        """Wait until the locator matches; return the matching elements."""
+        return self._wait("present", locator, None, timeout)
+
+    def absent(self, locator: tuple[str, str], timeout: float | None = None) -> None:
+        """Wait until the locator matches nothing."""
+        self._wait("absent", locator, None, timeout)
+
+    def text(self, locator: tuple[str, str]) -> str:
+        """Return the text of the elements matching the locator, without waiting."""
+        return self.browser.execute_script(_CHECK, "text", *locator, None)
+
+    def text_changed(
+        self, locator: tuple[str, str], text: str, timeout: float | None = None
+    ) -> str:
+        """
+        Wait until the text of the matching elements differs from ``text``.
+
+        Take ``text`` with ``Waits.text`` before the action that changes the
+        page, so a change that happens before the wait starts is not missed.
+
+        Returns:
+            str: The new text.
+        """
+        return self._wait("text", locator, text, timeout)
+
+    def angular_stable(self, timeout: float | None = None) -> None:
+        """Wait until Angular has no pending requests or timers, if it is used."""
+        timeout = self.timeout if timeout is None else timeout
+        start = time.perf_counter()
+        stable = False
+        try:
+            stable = self.browser.execute_async_script(
+                _ANGULAR_STABLE, int(timeout * 1000)
+            )
+        except (JavascriptException, TimeoutException) as e:
+            logging.debug("Could not wait for Angular: %s", e.msg)
+        finally:
+            self.metrics.record(
+                "angular stable", time.perf_counter() - start, timed_out=not stable
+            )
+
+    def _wait(
+        self,
+        kind: str,
+        locator: tuple[str, str],
+        expected: str | None,
+        timeout: float | None,
+    ) -> object:
+        """
+        Wait for a condition with the configured strategy.
+
+        An observer that ran out its time ends the wait; one whose script
+        failed hands the rest of the timeout to polling, unless none is left.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        start = time.perf_counter()
+        result = None
+        try:
+            if self.strategy is WaitStrategy.EVENTS:
+                result = self._observe(kind, locator, expected, timeout)
+            if result is None:
+                remaining = timeout - (time.perf_counter() - start)
+                result = (
+                    self._poll(kind, locator, expected, remaining)
+                    if remaining > 0
+                    else _TIMED_OUT
+                )
+            if result is _TIMED_OUT:
+                result = None
+        finally:
+            self.metrics.record(
+                f"{kind} {locator[1]}",
+                time.perf_counter() - start,
+                timed_out=result is None,
+            )
+        if result is None:
+            error_message = (
+                f"Condition '{kind}' not met within {timeout} seconds. "
+                f"Locator: {locator}"
+            )
+            raise TimeoutException(error_message)
+        return result
+
+    def _observe(
+        self,
+        kind: str,
+        locator: tuple[str, str],
+        expected: str | None,
+        timeout: float,
+    ) -> object:
+        """Wait in the page for the condition; None if the script failed."""
+        try:
+            result = self.browser.execute_async_script(
+                _OBSERVE, kind, *locator, expected, int(timeout * 1000)
+            )
+        except TimeoutException:  # the script timeout of the driver
+            result = None
+        except JavascriptException as e:
+            logging.debug("Falling back to polling for %s: %s", locator, e.msg)
+            return None
+        return _TIMED_OUT if result is None else result
+
+    def _poll(
+        self,
+        kind: str,
+        locator: tuple[str, str],
+        expected: str | None,
+        timeout: float,
+    ) -> object:
+        """Check the condition every ``poll_interval`` seconds."""
+
+        def check(browser: WebDriver) -> list[object] | None:
+            result = browser.execute_script(_CHECK, kind, *locator, expected)
+            return None if result is None else [result]
+
+        try:
+            return WebDriverWait(
+                self.browser, timeout, poll_frequency=self.poll_interval
+            ).until(check)[0]
+        except TimeoutException:
+            return _TIMED_OUT